@@ -0,0 +1,68 @@
+"""
+Бенчмарк времени до первой отрисовки для новой сессии.
+
+Для каждой сессии создается ZenCatApp (построение интерфейса и первый page.add)
+с кэшем шаблонов статических секций и без него, а также в отложенном режиме,
+когда первым сообщением отправляется только первый экран (шапка и основной
+экран), а остальные секции строятся позже. Показывает среднее, p50 и p95
+времени на сессию, число элементов и размер первого сообщения клиенту.
+
+Запуск:
+    python benchmarks/bench_first_paint.py [--sessions 300]
+"""
+
+import argparse
+import statistics
+import time
+
+from harness import count_controls, make_page
+
+from zen_cat.main import ZenCatApp
+from zen_cat.utils.templates import TemplateCache
+
+
+def measure(templates, sessions, lazy=False):
+    """
+    Измеряет время до первой отрисовки для серии сессий.
+
+    Args:
+        templates (TemplateCache): Кэш шаблонов или None
+        sessions (int): Количество сессий
+        lazy (bool): Отложенное построение секций ниже первого экрана
+
+    Returns:
+        tuple: (список длительностей в микросекундах, элементов на странице,
+            байт в первом сообщении)
+    """
+    # Первая сессия прогревает кэш шаблонов и в замер не входит
+    page, conn = make_page()
+    ZenCatApp(page, templates, lazy=lazy)
+
+    durations = []
+    for _ in range(sessions):
+        page, conn = make_page()
+        started = time.perf_counter()
+        ZenCatApp(page, templates, lazy=lazy)
+        durations.append((time.perf_counter() - started) * 1e6)
+    return durations, count_controls(page.controls[-1]), conn.bytes_sent
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=300, help="Количество сессий")
+    args = parser.parse_args()
+
+    print(f"{'вариант':<12} {'среднее, мкс':>14} {'p50, мкс':>10} {'p95, мкс':>10} {'элементов':>10} {'байт':>8}")
+    for name, templates, lazy in (
+        ("без кэша", None, False),
+        ("с кэшем", TemplateCache(), False),
+        ("отложенные", TemplateCache(), True),
+    ):
+        durations, controls, size = measure(templates, args.sessions, lazy)
+        p95 = statistics.quantiles(durations, n=20)[-1]
+        print(f"{name:<12} {statistics.mean(durations):>14.0f} {statistics.median(durations):>10.0f} "
+              f"{p95:>10.0f} {controls:>10} {size:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Бенчмарк переключения языка в одной сессии.
+
+Сравнивает полное обновление страницы (page.update() по всему дереву, как
+раньше делал ZenCatApp.update_ui) с точечным обновлением через реестр привязок
+и планировщик обновлений. Показывает время и объем трафика на одно переключение,
+а также сколько обновлений страницы уходит на серию быстрых кликов.
+
+Цикл событий страницы в бенчмарке не запущен, поэтому планировщик
+сбрасывается вручную вызовом flush().
+
+Запуск:
+    python benchmarks/bench_language_switch.py [--toggles 500]
+"""
+
+import argparse
+import time
+
+from harness import make_page
+
+from zen_cat.main import ZenCatApp
+
+
+def full_update(app):
+    """
+    Прежний вариант: все тексты обновляются, затем страница сравнивается целиком.
+    """
+    app.bindings.apply()
+    app.page.update()
+
+
+def patch_update(app):
+    """
+    Текущий вариант: точечное обновление только изменившихся элементов.
+    """
+    app.update_ui()
+    app.scheduler.flush()
+
+
+def burst(clicks):
+    """
+    Имитирует серию быстрых кликов по меню языка в пределах одного прохода цикла событий.
+
+    Args:
+        clicks (int): Количество кликов
+
+    Returns:
+        dict: Счетчики планировщика
+    """
+    page, conn = make_page()
+    app = ZenCatApp(page)
+    for i in range(clicks):
+        app.localization.toggle_lang()
+        app.update_ui()
+    app.scheduler.flush()
+    return app.scheduler.stats()
+
+
+def measure(update, toggles):
+    """
+    Измеряет время и трафик на одно переключение языка.
+
+    Args:
+        update (callable): Функция обновления интерфейса после смены языка
+        toggles (int): Количество переключений
+
+    Returns:
+        tuple: (микросекунды на переключение, байт на переключение)
+    """
+    page, conn = make_page()
+    app = ZenCatApp(page)
+    languages = ("en", "ru")
+    conn.reset()
+
+    started = time.perf_counter()
+    for i in range(toggles):
+        app.localization.set_lang(languages[i % 2])
+        update(app)
+    elapsed = time.perf_counter() - started
+    return elapsed / toggles * 1e6, conn.bytes_sent / toggles
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--toggles", type=int, default=500, help="Количество переключений")
+    args = parser.parse_args()
+
+    print(f"{'вариант':<10} {'мкс/переключение':>18} {'байт/переключение':>18}")
+    for name, update in (("full", full_update), ("patch", patch_update)):
+        usec, size = measure(update, args.toggles)
+        print(f"{name:<10} {usec:>18.1f} {size:>18.0f}")
+
+    stats = burst(15)
+    print(f"серия из 15 кликов: запрошено {stats['requested']}, отправлено {stats['flushed']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Бенчмарк создания объекта локализации для одной сессии.
+
+Сравнивает прежний подход (каждая сессия строит собственные словари текстов
+для всех языков) с текущим (сессия хранит только язык и ссылку на общий каталог).
+Показывает время создания и объём памяти на одну сессию.
+
+Запуск:
+    python benchmarks/bench_localization.py [--sessions 10000]
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+# Добавляем путь к проекту в sys.path для корректного импорта
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from zen_cat.utils.localization import CATALOG, Localization
+
+
+class LegacyLocalization:
+    """
+    Воспроизводит прежнее поведение: словарь текстов строится заново для каждой сессии.
+    """
+
+    def __init__(self, default_lang="ru"):
+        self.lang = default_lang
+        self._texts = {lang: dict(CATALOG[lang]) for lang in CATALOG.languages()}
+
+
+def measure(factory, sessions):
+    """
+    Измеряет время создания и память на одну сессию.
+
+    Args:
+        factory (callable): Функция, создающая объект локализации
+        sessions (int): Количество создаваемых объектов
+
+    Returns:
+        tuple: (микросекунды на объект, байт на объект)
+    """
+    started = time.perf_counter()
+    objects = [factory() for _ in range(sessions)]
+    elapsed = time.perf_counter() - started
+    del objects
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    objects = [factory() for _ in range(sessions)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    allocated = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    del objects
+    return elapsed / sessions * 1e6, allocated / sessions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=10000, help="Количество сессий")
+    args = parser.parse_args()
+
+    print(f"{'вариант':<10} {'мкс/сессия':>12} {'байт/сессия':>12}")
+    for name, factory in (("before", LegacyLocalization), ("after", Localization)):
+        usec, size = measure(factory, args.sessions)
+        print(f"{name:<10} {usec:>12.2f} {size:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
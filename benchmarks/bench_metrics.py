@@ -0,0 +1,101 @@
+"""
+Бенчмарк записи метрик из обработчиков.
+
+Сравнивает счетчик с ячейками по потокам (zen_cat.utils.metrics.Counter)
+со счетчиком под общей блокировкой при одновременной записи из нескольких
+потоков (как из пула потоков обработчиков Flet), а также стоимость записи
+в гистограмму и формирования текста метрик.
+
+Запуск:
+    python benchmarks/bench_metrics.py [--threads 8] [--ops 200000]
+"""
+
+import argparse
+import threading
+import time
+
+import harness  # noqa: F401  (добавляет корень репозитория в sys.path)
+
+from zen_cat.utils.metrics import Counter, Histogram, MetricsRegistry
+
+
+class LockedCounter:
+    """
+    Счетчик под общей блокировкой (для сравнения).
+    """
+
+    def __init__(self):
+        self.value = 0
+        self._lock = threading.Lock()
+
+    def inc(self, amount=1):
+        with self._lock:
+            self.value += amount
+
+
+def hammer(operation, threads, ops):
+    """
+    Выполняет операцию из нескольких потоков одновременно.
+
+    Args:
+        operation (callable): Операция без аргументов
+        threads (int): Количество потоков
+        ops (int): Количество операций в каждом потоке
+
+    Returns:
+        float: Время одной операции в наносекундах (по общему времени)
+    """
+    start = threading.Barrier(threads + 1)
+
+    def run():
+        start.wait()
+        for _ in range(ops):
+            operation()
+
+    workers = [threading.Thread(target=run) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    start.wait()
+    started = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    return (time.perf_counter() - started) / (threads * ops) * 1e9
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--threads", type=int, default=8, help="Количество потоков")
+    parser.add_argument("--ops", type=int, default=200000, help="Операций в каждом потоке")
+    args = parser.parse_args()
+
+    counter = Counter("bench_total", "Бенчмарк")
+    locked = LockedCounter()
+    histogram = Histogram("bench_seconds", "Бенчмарк")
+    labeled = Counter("bench_labeled_total", "Бенчмарк", ("result",))
+
+    results = {
+        "Counter.inc (по потокам)": hammer(counter.inc, args.threads, args.ops),
+        "Counter.inc (блокировка)": hammer(locked.inc, args.threads, args.ops),
+        "Counter.labels().inc": hammer(lambda: labeled.labels("accepted").inc(), args.threads, args.ops),
+        "Histogram.observe": hammer(lambda: histogram.observe(0.003), args.threads, args.ops),
+    }
+    total = args.threads * args.ops
+    assert counter.value() == locked.value == total, "счетчики потеряли приращения"
+
+    registry = MetricsRegistry()
+    for i in range(20):
+        registry.counter(f"bench_{i}_total", "Бенчмарк").inc()
+        registry.histogram(f"bench_{i}_seconds", "Бенчмарк").observe(0.01)
+    started = time.perf_counter()
+    for _ in range(100):
+        registry.render()
+    render_ms = (time.perf_counter() - started) / 100 * 1000
+
+    print(f"{args.threads} потоков, по {args.ops} операций")
+    for name, ns in results.items():
+        print(f"{name:<28} {ns:>8.0f} нс")
+    print(f"{'render (40 метрик)':<28} {render_ms:>8.2f} мс")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Бенчмарк доставки заявок по email через outbox.
+
+Поднимает локальный SMTP-сервер (aiosmtpd), пропускает серию заявок через
+очередь записи и обработчик канала "email" и показывает пропускную способность
+и задержку от создания заявки до доставки письма (p50/p95) для пула из одного
+соединения без переиспользования (новое соединение на каждое письмо) и для
+пула переиспользуемых соединений.
+
+Запуск:
+    python benchmarks/bench_outbox.py [--submissions 500] [--pool 4]
+
+Нужен пакет aiosmtpd (pip install aiosmtpd).
+"""
+
+import argparse
+import os
+import socket
+import tempfile
+import time
+
+import harness  # noqa: F401  (добавляет корень репозитория в sys.path)
+from aiosmtpd.controller import Controller
+
+from zen_cat.pipeline.mailer import SmtpPool, SmtpSender
+from zen_cat.pipeline.outbox import OutboxWorker
+from zen_cat.pipeline.submissions import Submission, SubmissionPipeline
+
+
+class CountingHandler:
+    """
+    Обработчик aiosmtpd, который только считает полученные письма.
+    """
+
+    def __init__(self):
+        self.received = 0
+
+    async def handle_DATA(self, server, session, envelope):
+        self.received += 1
+        return "250 OK"
+
+
+class OneShotPool(SmtpPool):
+    """
+    Пул без переиспользования: каждое письмо отправляется через новое соединение.
+    """
+
+    def release(self, client, broken=False):
+        super().release(client, broken=True)
+
+
+def measure(pool, submissions, port):
+    """
+    Пропускает серию заявок через очередь и обработчик канала "email".
+
+    Args:
+        pool (SmtpPool): Пул SMTP-соединений
+        submissions (int): Количество заявок
+        port (int): Порт локального SMTP-сервера
+
+    Returns:
+        dict: Метрики обработчика и число открытых соединений
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "bench.db")
+        pipeline = SubmissionPipeline(db_path, channels=["email"])
+        worker = OutboxWorker("email", SmtpSender(pool), db_path)
+        pipeline.add_listener(worker.notify)
+        pipeline.start()
+        worker.start()
+
+        for i in range(submissions):
+            pipeline.submit(Submission(f"Гость {i}", f"guest{i}@example.com", "Хочу медитировать с котом"))
+        pipeline.stop()
+        while worker.delivered + worker.dead < submissions:
+            time.sleep(0.01)
+        stats = worker.stats()
+        worker.stop()
+        worker.sender.close()
+        stats["opened"] = pool.opened
+        return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--submissions", type=int, default=500, help="Количество заявок")
+    parser.add_argument("--pool", type=int, default=4, help="Размер пула соединений")
+    args = parser.parse_args()
+
+    # Свободный порт для локального SMTP-сервера
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+
+    handler = CountingHandler()
+    controller = Controller(handler, hostname="127.0.0.1", port=port)
+    controller.start()
+    try:
+        print(f"{'вариант':<22} {'писем/с':>9} {'p50, мс':>9} {'p95, мс':>9} {'соединений':>11}")
+        variants = (
+            ("новое соединение", OneShotPool("127.0.0.1", port, size=1)),
+            (f"пул из {args.pool}", SmtpPool("127.0.0.1", port, size=args.pool)),
+        )
+        for name, pool in variants:
+            stats = measure(pool, args.submissions, port)
+            print(f"{name:<22} {stats['throughput']:>9.0f} {stats['latency_p50'] * 1000:>9.1f} "
+                  f"{stats['latency_p95'] * 1000:>9.1f} {stats['opened']:>11}")
+    finally:
+        controller.stop()
+    print(f"получено писем: {handler.received}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""
+Бенчмарк поиска по услугам.
+
+Строит индекс SearchIndex для каталога из --items услуг с заголовками
+и описаниями на русском и английском (слова из каталогов текстов и случайные
+слова, чтобы словарь был как у настоящего большого каталога) и выполняет
+набор запросов так, как их набирает посетитель: каждый префикс слова —
+отдельный запрос. Показывает время построения индекса и время запроса
+без кэша (кэши индекса очищаются перед каждым запросом) и с кэшем
+(повторный запрос, например, из другой сессии). Если p95 запроса без кэша
+больше --budget-us, завершается с кодом 1.
+
+Запуск:
+    python benchmarks/bench_search.py [--items 5000] [--budget-us 1000]
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import time
+
+import harness  # noqa: F401  (добавляет корень репозитория в sys.path)
+
+from zen_cat.utils.localization import Localization
+from zen_cat.utils.search import SearchIndex
+from zen_cat.utils.service_catalog import ServiceItem
+
+# Запросы, которые набирает посетитель (по словам; каждый префикс — отдельный запрос)
+QUERIES = (
+    "дизайн интерфейсов", "разработка приложений", "поддержка сервисов", "консалтинг",
+    "design", "development apps", "support", "consulting processes", "минимализм", "focus",
+)
+
+
+def vocabulary(lang, rng, extra):
+    """
+    Собирает слова языка: из каталога текстов и случайные.
+
+    Args:
+        lang (str): Язык (ru или en)
+        rng (random.Random): Генератор случайных чисел
+        extra (int): Количество случайных слов
+
+    Returns:
+        list: Слова
+    """
+    localization = Localization(lang)
+    words = {
+        word for key in ("main_subtitle", "about_text", "service_1_desc", "service_2_desc",
+                         "service_3_desc", "service_4_desc")
+        for word in localization.get(key).lower().split() if word.isalpha()
+    }
+    letters = "абвгдежзиклмнопрстуфхцчшэюя" if lang == "ru" else "abcdefghijklmnopqrstuvwxyz"
+    words.update("".join(rng.choice(letters) for _ in range(rng.randint(4, 11))) for _ in range(extra))
+    return sorted(words)
+
+
+def make_catalog(items, seed=1):
+    """
+    Создает услуги и тексты для них на русском и английском.
+
+    Args:
+        items (int): Количество услуг
+        seed (int): Начальное значение генератора
+
+    Returns:
+        tuple: (услуги, список словарей текстов по языкам)
+    """
+    rng = random.Random(seed)
+    catalogs = []
+    for lang in ("ru", "en"):
+        words = vocabulary(lang, rng, extra=items * 2)
+        texts = {}
+        for number in range(items):
+            texts[f"s{number}_title"] = " ".join(rng.choices(words, k=rng.randint(1, 3))).capitalize()
+            texts[f"s{number}_desc"] = " ".join(rng.choices(words, k=rng.randint(8, 16))).capitalize() + "."
+        catalogs.append(texts)
+    services = tuple(
+        ServiceItem(f"service-{number}", f"s{number}_title", f"s{number}_desc", "🐾", number)
+        for number in range(items)
+    )
+    return services, catalogs
+
+
+def typed(queries):
+    """
+    Разворачивает запросы в последовательность префиксов, как при наборе.
+
+    Args:
+        queries (tuple): Запросы
+
+    Returns:
+        list: Промежуточные запросы
+    """
+    return [query[:length] for query in queries for length in range(1, len(query) + 1)]
+
+
+def percentile(values, share):
+    """
+    Возвращает перцентиль списка значений.
+
+    Args:
+        values (list): Значения
+        share (float): Доля (0..1)
+
+    Returns:
+        float: Значение перцентиля
+    """
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * share))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--items", type=int, default=5000, help="Количество услуг в каталоге")
+    parser.add_argument("--repeat", type=int, default=5, help="Повторов набора запросов")
+    parser.add_argument("--budget-us", type=float, default=1000, help="Допустимый p95 запроса без кэша, мкс")
+    args = parser.parse_args()
+
+    services, catalogs = make_catalog(args.items)
+    started = time.perf_counter()
+    index = SearchIndex(services, catalogs)
+    build_ms = (time.perf_counter() - started) * 1000
+    print(f"{args.items} услуг, {len(index.terms)} основ; построение индекса {build_ms:.0f} мс")
+
+    queries = typed(QUERIES)
+    cold, warm, found = [], [], []
+    for _ in range(args.repeat):
+        for query in queries:
+            index._matches.cache_clear()
+            index._ranked.cache_clear()
+            started = time.perf_counter()
+            results = index.search(query)
+            cold.append((time.perf_counter() - started) * 1e6)
+            started = time.perf_counter()
+            index.search(query)
+            warm.append((time.perf_counter() - started) * 1e6)
+            found.append(len(results or ()))
+
+    print(f"{len(queries)} запросов, найдено в среднем {statistics.mean(found):.0f} услуг")
+    print(f"{'запрос':<10} {'p50, мкс':>10} {'p95, мкс':>10} {'max, мкс':>10}")
+    for name, values in (("без кэша", cold), ("с кэшем", warm)):
+        print(f"{name:<10} {statistics.median(values):>10.1f} {percentile(values, 0.95):>10.1f} {max(values):>10.1f}")
+
+    if percentile(cold, 0.95) > args.budget_us:
+        print(f"p95 запроса без кэша больше {args.budget_us:g} мкс")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+"""
+Бенчмарк блока услуг для большого каталога.
+
+Генерирует каталог из --items услуг и строит сессии ZenCatApp, когда все
+карточки создаются сразу (ZEN_CAT_SERVICES_PAGE_SIZE=0), и когда сразу создается
+только первая страница сетки, а остальные карточки догружаются при прокрутке.
+Показывает время построения сессии, число элементов и размер первого сообщения,
+память на сессию и стоимость догрузки одной страницы. Отдельно измеряются
+проверка изменений каталога и время, за которое новая версия каталога
+попадает в новые сессии.
+
+Запуск:
+    python benchmarks/bench_services.py [--items 500] [--sessions 50]
+"""
+
+import argparse
+import gc
+import json
+import os
+import statistics
+import tempfile
+import time
+import tracemalloc
+
+from harness import count_controls, make_page
+
+from zen_cat import config
+from zen_cat.main import ZenCatApp
+from zen_cat.utils.service_catalog import SERVICE_CATALOG
+from zen_cat.utils.templates import TemplateCache
+
+
+class ScrollEvent:
+    """Событие прокрутки сетки до конца (поля как у ft.OnScrollEvent)."""
+
+    pixels = 1000
+    max_scroll_extent = 1000
+    viewport_dimension = 600
+
+
+def write_catalog(path, items):
+    """
+    Записывает каталог услуг (тексты берутся из ключей четырех услуг по умолчанию).
+
+    Args:
+        path (str): Путь к файлу JSON
+        items (int): Количество услуг
+    """
+    records = [
+        {
+            "id": f"service-{number}",
+            "title_key": f"service_{number % 4 + 1}_title",
+            "desc_key": f"service_{number % 4 + 1}_desc",
+            "icon": "🐾",
+            "order": number,
+            "category": f"category-{number % 10}",
+        }
+        for number in range(items)
+    ]
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(records, f, ensure_ascii=False)
+
+
+def measure(sessions, page_size):
+    """
+    Измеряет построение сессий при заданном размере страницы карточек.
+
+    Args:
+        sessions (int): Количество сессий
+        page_size (int): Размер страницы (0 — все карточки сразу)
+
+    Returns:
+        dict: Время построения, элементы и байты первого сообщения, память на сессию
+            и время догрузки страницы
+    """
+    config.SERVICES_PAGE_SIZE = page_size
+    templates = TemplateCache()
+    ZenCatApp(make_page()[0], templates)  # Прогрев шаблонов и каталога
+
+    durations = []
+    for _ in range(sessions):
+        page, conn = make_page()
+        started = time.perf_counter()
+        app = ZenCatApp(page, templates)
+        durations.append((time.perf_counter() - started) * 1e6)
+    controls, size = count_controls(page.controls[-1]), conn.bytes_sent
+
+    more = []
+    if app.services is not None:
+        while app.services.has_more and len(more) < 20:
+            started = time.perf_counter()
+            app._on_services_scroll(ScrollEvent())
+            more.append((time.perf_counter() - started) * 1e6)
+
+    apps = []
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for _ in range(sessions):
+        apps.append(ZenCatApp(make_page()[0], templates))
+    gc.collect()
+    memory = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return {
+        "build_us": statistics.median(durations),
+        "controls": controls,
+        "bytes": size,
+        "memory": memory / sessions,
+        "more_us": statistics.median(more) if more else None,
+    }
+
+
+def measure_reload(path, items, checks=100000):
+    """
+    Измеряет проверку изменений каталога и задержку появления новой версии.
+
+    Args:
+        path (str): Путь к каталогу
+        items (int): Количество услуг
+        checks (int): Количество вызовов snapshot() без изменений
+
+    Returns:
+        tuple: (мкс на snapshot() внутри интервала проверки, мкс на snapshot()
+            с проверкой файла, мс от записи каталога до новой версии)
+    """
+    SERVICE_CATALOG.reload_interval = 3600
+    started = time.perf_counter()
+    for _ in range(checks):
+        SERVICE_CATALOG.snapshot()
+    cached_us = (time.perf_counter() - started) / checks * 1e6
+
+    SERVICE_CATALOG.reload_interval = 0
+    started = time.perf_counter()
+    for _ in range(checks // 10):
+        SERVICE_CATALOG.snapshot()
+    checked_us = (time.perf_counter() - started) / (checks // 10) * 1e6
+
+    version = SERVICE_CATALOG.snapshot().version
+    started = time.perf_counter()
+    write_catalog(path, items + 1)
+    while SERVICE_CATALOG.snapshot().version == version:
+        pass
+    return cached_us, checked_us, (time.perf_counter() - started) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--items", type=int, default=500, help="Количество услуг в каталоге")
+    parser.add_argument("--sessions", type=int, default=50, help="Количество сессий")
+    parser.add_argument("--page-size", type=int, default=8, help="Размер страницы карточек")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "services.json")
+        write_catalog(path, args.items)
+        SERVICE_CATALOG.path = path
+        SERVICE_CATALOG.reload_interval = 0
+
+        print(f"каталог из {args.items} услуг, {args.sessions} сессий")
+        print(f"{'вариант':<14} {'построение':>12} {'элементов':>10} {'байт':>9} {'память':>10} {'догрузка':>12}")
+        for name, page_size in (("все карточки", 0), ("постранично", args.page_size)):
+            result = measure(args.sessions, page_size)
+            more = f"{result['more_us']:>8.0f} мкс" if result["more_us"] is not None else f"{'—':>12}"
+            print(f"{name:<14} {result['build_us']:>8.0f} мкс {result['controls']:>10} {result['bytes']:>9} "
+                  f"{result['memory'] / 1024:>7.0f} КБ {more}")
+
+        cached_us, checked_us, reload_ms = measure_reload(path, args.items)
+        print(f"snapshot(): {cached_us:.2f} мкс в интервале, {checked_us:.1f} мкс с проверкой файла; "
+              f"новая версия каталога через {reload_ms:.1f} мс после записи")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Бенчмарк классификатора спама.
+
+Обучает классификатор на синтетическом размеченном наборе сообщений и измеряет
+скорость оценки (сообщений в секунду) для пачек разного размера, а также
+по одному сообщению, как если бы оценка выполнялась в обработчике формы.
+
+Запуск:
+    python benchmarks/bench_spam.py [--messages 5000]
+"""
+
+import argparse
+import random
+import time
+
+import harness  # noqa: F401  (добавляет корень репозитория в sys.path)
+
+from zen_cat.pipeline.spam import SpamClassifier
+
+
+HAM = [
+    "Здравствуйте, хочу записаться на медитацию в субботу",
+    "Подскажите, есть ли занятия по йоге для начинающих",
+    "Можно ли прийти с ребенком на дыхательные практики",
+    "Hello, I would like to book a meditation session for two",
+    "Do you offer evening yoga classes?",
+    "Спасибо за прекрасное занятие, придем еще",
+]
+SPAM = [
+    "Заработок в интернете от 100000 рублей в день, переходите по ссылке",
+    "Дешевое продвижение сайта в топ, пишите в телеграм",
+    "Buy cheap followers now, best price, click here http://spam.example",
+    "Casino bonus 500% free spins click the link",
+    "Кредит без проверок за 5 минут, звоните",
+    "SEO services cheap backlinks guaranteed ranking",
+]
+
+
+def generate(count, seed=1):
+    """
+    Генерирует размеченные сообщения из шаблонов со случайными добавками.
+
+    Args:
+        count (int): Количество сообщений
+        seed (int): Начальное значение генератора
+
+    Returns:
+        tuple: (тексты, метки)
+    """
+    rng = random.Random(seed)
+    texts, labels = [], []
+    for _ in range(count):
+        spam = rng.random() < 0.3
+        base = rng.choice(SPAM if spam else HAM)
+        texts.append(f"{base} {rng.randint(1, 999)} {rng.choice(['!', '?', '.', ''])}")
+        labels.append(spam)
+    return texts, labels
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--messages", type=int, default=5000, help="Количество сообщений для оценки")
+    args = parser.parse_args()
+
+    texts, labels = generate(2000)
+    started = time.perf_counter()
+    classifier = SpamClassifier.train(texts, labels)
+    print(f"обучение на {len(texts)} сообщениях: {(time.perf_counter() - started) * 1000:.0f} мс")
+
+    texts, labels = generate(args.messages, seed=2)
+    scores = classifier.score(texts)
+    accuracy = sum((score >= 0.9) == label for score, label in zip(scores, labels)) / len(labels)
+    print(f"точность на новых сообщениях: {accuracy:.1%}")
+
+    print(f"{'размер пачки':<14} {'сообщений/с':>12}")
+    for batch in (1, 10, 50, 500):
+        started = time.perf_counter()
+        for i in range(0, len(texts), batch):
+            classifier.score(texts[i:i + batch])
+        rate = len(texts) / (time.perf_counter() - started)
+        print(f"{batch:<14} {rate:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
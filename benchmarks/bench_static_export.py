@@ -0,0 +1,90 @@
+"""
+Бенчмарк статического экспорта страницы.
+
+Сравнивает стоимость одного читателя страницы: полная сессия ZenCatApp
+(построение интерфейса, первое сообщение клиенту и память, удерживаемая сессией),
+сессия только с формой обратной связи (загружается со статической страницы
+по нажатию кнопки) и статическая страница (размер HTML без сжатия и в gzip,
+общий файл стилей загружается один раз и кэшируется). Показывает также время
+экспорта всех языков.
+
+Запуск:
+    python benchmarks/bench_static_export.py [--sessions 200]
+"""
+
+import argparse
+import gc
+import gzip
+import time
+import tracemalloc
+
+from harness import make_page
+
+from zen_cat.main import ZenCatApp
+from zen_cat.export import StaticExporter
+
+
+def measure_sessions(sessions, contact_only):
+    """
+    Измеряет построение серии сессий.
+
+    Args:
+        sessions (int): Количество сессий
+        contact_only (bool): Сессии только с формой обратной связи
+
+    Returns:
+        dict: Время построения, байт в первом сообщении и память на сессию
+    """
+    # Первая сессия прогревает кэш шаблонов и каталог и в замер не входит
+    ZenCatApp(make_page()[0], contact_only=contact_only)
+
+    started = time.perf_counter()
+    for _ in range(sessions):
+        page, conn = make_page()
+        ZenCatApp(page, contact_only=contact_only)
+    elapsed = time.perf_counter() - started
+
+    # Память считается отдельным проходом: tracemalloc замедляет построение
+    apps = []
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for _ in range(sessions):
+        apps.append(ZenCatApp(make_page()[0], contact_only=contact_only))
+    gc.collect()
+    memory = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return {
+        "build_us": elapsed / sessions * 1e6,
+        "bytes": conn.bytes_sent,
+        "memory": memory / sessions,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=200, help="Количество сессий")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    files = StaticExporter().build()
+    export_ms = (time.perf_counter() - started) * 1000
+    pages = [text.encode("utf-8") for name, text in files.items() if name.endswith(".html")]
+    css = next(text.encode("utf-8") for name, text in files.items() if name.endswith(".css"))
+    html_bytes = sum(len(page) for page in pages) / len(pages)
+    gzip_bytes = sum(len(gzip.compress(page)) for page in pages) / len(pages)
+
+    full = measure_sessions(args.sessions, contact_only=False)
+    form = measure_sessions(args.sessions, contact_only=True)
+
+    print(f"{'читатель':<22} {'построение':>12} {'трафик':>10} {'память':>10}")
+    for name, result in (("сессия ZenCatApp", full), ("только форма", form)):
+        print(f"{name:<22} {result['build_us']:>8.0f} мкс {result['bytes'] / 1024:>7.1f} КБ "
+              f"{result['memory'] / 1024:>7.1f} КБ")
+    print(f"{'статическая страница':<22} {'—':>12} {html_bytes / 1024:>7.1f} КБ {'—':>10}"
+          f"  (gzip {gzip_bytes / 1024:.1f} КБ, стили {len(css) / 1024:.1f} КБ один раз)")
+    print(f"экспорт {len(pages)} страниц: {export_ms:.0f} мс")
+
+
+if __name__ == "__main__":
+    main()
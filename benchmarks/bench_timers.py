@@ -0,0 +1,93 @@
+"""
+Бенчмарк отложенных действий для множества сессий.
+
+Сравнивает три способа отложить действие на --delay секунд для --timers сессий:
+поток на таймер (threading.Timer), таймер цикла событий (loop.call_later, куча)
+и общее колесо таймеров (TimerWheel, действие передается в цикл событий).
+Показывает стоимость постановки таймера, рост памяти, число потоков и задержку
+срабатывания относительно срока.
+
+Запуск:
+    python benchmarks/bench_timers.py [--timers 2000] [--delay 1.0]
+"""
+
+import argparse
+import asyncio
+import statistics
+import threading
+import time
+import tracemalloc
+
+import harness  # noqa: F401  (добавляет корень репозитория в sys.path)
+
+from zen_cat.utils.timers import TimerWheel
+
+
+async def run(mode, timers, delay):
+    """
+    Ставит таймеры и ждет их срабатывания.
+
+    Args:
+        mode (str): Способ (thread, call_later, wheel)
+        timers (int): Количество таймеров
+        delay (float): Задержка в секундах
+
+    Returns:
+        dict: Стоимость постановки, память, потоки и задержки срабатывания
+    """
+    loop = asyncio.get_running_loop()
+    lags = []
+    done = asyncio.Event()
+
+    def make(due):
+        def fire():
+            lags.append(time.monotonic() - due)
+            if len(lags) == timers:
+                loop.call_soon_threadsafe(done.set)
+        return fire
+
+    wheel = TimerWheel() if mode == "wheel" else None
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    started = time.perf_counter()
+    for i in range(timers):
+        callback = make(time.monotonic() + delay)
+        if mode == "thread":
+            timer = threading.Timer(delay, callback)
+            timer.daemon = True
+            timer.start()
+        elif mode == "call_later":
+            loop.call_later(delay, callback)
+        else:
+            wheel.schedule(delay, callback, loop=loop, owner=f"session-{i}")
+    schedule_us = (time.perf_counter() - started) / timers * 1e6
+    memory = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    threads = threading.active_count()
+    await done.wait()
+    lags.sort()
+    return {
+        "schedule_us": schedule_us,
+        "bytes_per_timer": memory / timers,
+        "threads": threads,
+        "lag_p50_ms": statistics.median(lags) * 1000,
+        "lag_max_ms": lags[-1] * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--timers", type=int, default=2000, help="Количество таймеров (сессий)")
+    parser.add_argument("--delay", type=float, default=1.0, help="Задержка, секунды")
+    args = parser.parse_args()
+
+    print(f"{args.timers} таймеров по {args.delay:g} с")
+    print(f"{'способ':<12} {'постановка':>12} {'байт':>8} {'потоков':>8} {'лаг p50':>9} {'лаг max':>9}")
+    for mode in ("thread", "call_later", "wheel"):
+        result = asyncio.run(run(mode, args.timers, args.delay))
+        print(f"{mode:<12} {result['schedule_us']:>9.1f} мкс {result['bytes_per_timer']:>8.0f} "
+              f"{result['threads']:>8} {result['lag_p50_ms']:>6.1f} мс {result['lag_max_ms']:>6.1f} мс")
+
+
+if __name__ == "__main__":
+    main()
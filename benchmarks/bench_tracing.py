@@ -0,0 +1,83 @@
+"""
+Бенчмарк накладных расходов трассировки обработчиков.
+
+Измеряет время вызова пустого обработчика, обернутого декоратором traced,
+в трех режимах: трассировка отключена (нет выборки и порога медленных
+обработчиков), включена только запись медленных обработчиков (спаны создаются,
+но трассы отбрасываются) и выборка всех трасс с записью в файл.
+
+Запуск:
+    python benchmarks/bench_tracing.py [--calls 200000]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import harness  # noqa: F401  (добавляет корень репозитория в sys.path)
+
+from zen_cat.utils import tracing
+from zen_cat.utils.tracing import Tracer, traced
+
+
+class Handler:
+    """
+    Компонент с пустым обработчиком события.
+    """
+
+    page = None
+
+    @traced("Handler.on_click")
+    def on_click(self, e):
+        return None
+
+    def plain(self, e):
+        return None
+
+
+def per_call(func, calls):
+    """
+    Измеряет время одного вызова.
+
+    Args:
+        func (callable): Функция одного аргумента
+        calls (int): Количество вызовов
+
+    Returns:
+        float: Время вызова в наносекундах
+    """
+    started = time.perf_counter()
+    for _ in range(calls):
+        func(None)
+    return (time.perf_counter() - started) / calls * 1e9
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--calls", type=int, default=200000, help="Количество вызовов")
+    args = parser.parse_args()
+
+    handler = Handler()
+    path = os.path.join(tempfile.mkdtemp(prefix="zen-cat-traces-"), "traces.jsonl")
+    modes = {
+        "без декоратора": None,
+        "трассировка отключена": Tracer(sample_rate=0, slow_threshold=0, path=path),
+        "только медленные (500 мс)": Tracer(sample_rate=0, slow_threshold=0.5, path=path),
+        "выборка 100%": Tracer(sample_rate=1.0, slow_threshold=0, path=path),
+    }
+    for name, tracer in modes.items():
+        if tracer is None:
+            ns = per_call(handler.plain, args.calls)
+        else:
+            tracing.TRACER = tracer
+            ns = per_call(handler.on_click, args.calls)
+            tracer.flush()
+        print(f"{name:<28} {ns:>8.0f} нс/вызов")
+    sampled = modes["выборка 100%"]
+    print(f"записано трасс: {sampled.exported}, отброшено при переполнении очереди: {sampled.overflow}, "
+          f"файл: {os.path.getsize(path) // 1024} КБ")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Бенчмарк проверки полей формы при вводе.
+
+Имитирует набор email по одному символу с заданным интервалом и вызывает
+обработчик изменения поля, как это делает Flet. Сравнивает проверку на каждое
+нажатие и проверку после паузы в наборе (debounce): стоимость обработчика
+на одно нажатие, число проверок и число обновлений страницы. Также показывает
+попадания в кэш проверок при повторном наборе.
+
+Запуск:
+    python benchmarks/bench_validation.py [--interval-ms 40] [--sessions 20]
+"""
+
+import argparse
+import asyncio
+import time
+from types import SimpleNamespace
+
+from harness import make_page
+
+from zen_cat import config
+from zen_cat.main import ZenCatApp
+from zen_cat.utils.validation import validate
+
+
+TEXT = "anna.petrova@example.com"
+
+
+def measure(debounce, interval, sessions):
+    """
+    Набирает TEXT в поле email в нескольких сессиях.
+
+    Args:
+        debounce (float): Пауза перед проверкой в секундах (0 — проверка на каждое нажатие)
+        interval (float): Интервал между нажатиями в секундах
+        sessions (int): Количество сессий
+
+    Returns:
+        tuple: (мкс на нажатие, проверок на сессию, обновлений страницы на сессию)
+    """
+    config.VALIDATION_DEBOUNCE = debounce
+    loop = asyncio.new_event_loop()
+    handler_time = 0.0
+    validations = 0
+    updates = 0
+    for _ in range(sessions):
+        page, conn = make_page(loop)
+        form = ZenCatApp(page).contact_form
+        field = form.email_field
+        event = SimpleNamespace(control=field)
+        checks = [0]
+        original = form._validate_field
+
+        def counted(name, original=original, checks=checks):
+            checks[0] += 1
+            return original(name)
+
+        form._validate_field = counted
+        loop.run_until_complete(asyncio.sleep(0))
+        conn.reset()
+        for i in range(1, len(TEXT) + 1):
+            field.value = TEXT[:i]
+            started = time.perf_counter()
+            form._on_field_change(event)
+            handler_time += time.perf_counter() - started
+            loop.run_until_complete(asyncio.sleep(interval))
+        loop.run_until_complete(asyncio.sleep(debounce + 0.05))
+        validations += checks[0]
+        updates += conn.messages
+    loop.close()
+    keystrokes = len(TEXT) * sessions
+    return handler_time / keystrokes * 1e6, validations / sessions, updates / sessions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--interval-ms", type=float, default=40, help="Интервал между нажатиями")
+    parser.add_argument("--sessions", type=int, default=20, help="Количество сессий")
+    args = parser.parse_args()
+
+    print(f"{'вариант':<22} {'мкс/нажатие':>12} {'проверок':>9} {'обновлений':>11}")
+    for name, debounce in (("на каждое нажатие", 0.0), ("после паузы 300 мс", 0.3)):
+        validate.cache_clear()
+        cost, checks, updates = measure(debounce, args.interval_ms / 1000, args.sessions)
+        print(f"{name:<22} {cost:>12.1f} {checks:>9.1f} {updates:>11.1f}")
+    info = validate.cache_info()
+    print(f"кэш проверок: {info.hits} попаданий, {info.misses} промахов")
+
+
+if __name__ == "__main__":
+    main()
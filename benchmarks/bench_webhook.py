@@ -0,0 +1,125 @@
+"""
+Бенчмарк доставки заявок во внешнюю систему через webhook.
+
+Поднимает локальную заглушку HTTP-сервера и пропускает серию заявок через
+очередь записи и обработчик канала webhook. Сравнивает отправку по одной
+заявке и пакетную отправку, а также показывает работу предохранителя,
+когда заглушка отвечает с задержкой дольше таймаута.
+
+Для каждого варианта выводятся пропускная способность, задержка от создания
+заявки до доставки (p95), число HTTP-запросов, размер очереди канала
+и состояние предохранителя.
+
+Запуск:
+    python benchmarks/bench_webhook.py [--submissions 500]
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import harness  # noqa: F401  (добавляет корень репозитория в sys.path)
+
+from zen_cat.pipeline.breaker import CircuitBreaker
+from zen_cat.pipeline.outbox import OutboxWorker
+from zen_cat.pipeline.submissions import Submission, SubmissionPipeline
+from zen_cat.pipeline.webhook import WebhookSender
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """
+    Заглушка CRM: принимает заявки и отвечает 200 после задержки server.delay.
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        time.sleep(self.server.delay)
+        self.server.received += len(body.get("submissions", [body]))
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+def measure(url, submissions, batch, timeout=5.0, wait=None):
+    """
+    Пропускает серию заявок через очередь и обработчик канала webhook.
+
+    Args:
+        url (str): Адрес заглушки
+        submissions (int): Количество заявок
+        batch (int): Число заявок в одном запросе
+        timeout (float): Таймаут запроса в секундах
+        wait (float): Сколько ждать доставки (None — до доставки всех заявок)
+
+    Returns:
+        dict: Метрики обработчика канала
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "bench.db")
+        pipeline = SubmissionPipeline(db_path, channels=["webhook"])
+        sender = WebhookSender(url, batch=batch, timeout=timeout)
+        worker = OutboxWorker(
+            "webhook", sender, db_path,
+            breaker=CircuitBreaker(failure_threshold=3, reset_timeout=1.0),
+            max_backlog=submissions // 2,
+        )
+        pipeline.add_listener(worker.notify)
+        pipeline.start()
+        worker.start()
+
+        for i in range(submissions):
+            pipeline.submit(Submission(f"Гость {i}", f"guest{i}@example.com", "Хочу медитировать с котом"))
+        pipeline.stop()
+        if wait is None:
+            while worker.delivered < submissions:
+                time.sleep(0.01)
+        else:
+            time.sleep(wait)
+        worker.stop()
+        stats = worker.stats()
+        sender.close()
+        return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--submissions", type=int, default=500, help="Количество заявок")
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.daemon_threads = True
+    server.delay = 0.002
+    server.received = 0
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/crm"
+
+    print(f"{'вариант':<24} {'заявок/с':>9} {'p95, мс':>9} {'запросов':>9} {'очередь':>8} "
+          f"{'вытеснено':>10} {'предохранитель':>15}")
+    variants = (
+        ("по одной", dict(batch=1)),
+        ("пачками по 20", dict(batch=20)),
+        ("медленная CRM", dict(batch=1, timeout=0.05, wait=3.0)),
+    )
+    try:
+        for name, options in variants:
+            server.delay = 0.5 if name == "медленная CRM" else 0.002
+            stats = measure(url, args.submissions, **options)
+            breaker = stats["breaker"]
+            print(f"{name:<24} {stats['throughput']:>9.0f} {stats['latency_p95'] * 1000:>9.1f} "
+                  f"{stats['sender']['requests']:>9} {stats['backlog']:>8} {stats['shed']:>10} "
+                  f"{breaker['state']:>9} ({breaker['trips']})")
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Проверка копирования шаблонов секций.
+
+Строит шаблон каждой статической секции (MainScreen, Services, About, Footer)
+на всех языках каталога так же, как приложение (со свернутыми распорками),
+и проверяет копию (zen_cat/utils/templates.py, Template.check): новые элементы
+с чистыми uid, page и parent, обработчики событий на собственные EventHandler
+копии и ни одного изменяемого объекта стиля, общего с прототипом. Кроме того,
+проверяет, что две копии не разделяют Padding и Margin друг с другом.
+
+Копирование опирается на внутреннее устройство Flet, поэтому скрипт нужно
+запускать после каждого обновления Flet (версия закреплена в requirements.txt).
+При нарушениях скрипт завершается с кодом 1.
+
+Запуск:
+    python benchmarks/check_templates.py
+"""
+
+import sys
+
+import harness  # noqa: F401  (добавляет корень репозитория в sys.path)
+
+from zen_cat.main import THEME
+from zen_cat.utils.service_catalog import SERVICE_CATALOG
+from zen_cat.utils.bindings import TextBindings
+from zen_cat.utils.layout import compact
+from zen_cat.utils.localization import Localization
+from zen_cat.utils.templates import Template, _walk
+from zen_cat.components.main_screen import MainScreen
+from zen_cat.components.services import Services
+from zen_cat.components.about import About
+from zen_cat.components.footer import Footer
+
+
+SECTIONS = {
+    "MainScreen": lambda localization, bindings: MainScreen(localization, THEME, bindings),
+    "Services": lambda localization, bindings: Services(
+        localization, THEME, bindings, items=SERVICE_CATALOG.snapshot().items
+    ),
+    "About": lambda localization, bindings: About(localization, THEME, bindings),
+    "Footer": lambda localization, bindings: Footer(localization, THEME, bindings),
+}
+
+
+def shared_styles(first, second):
+    """
+    Находит изменяемые объекты, общие у двух копий одного шаблона.
+
+    Args:
+        first (ft.Control): Первая копия
+        second (ft.Control): Вторая копия
+
+    Returns:
+        list: Описания общих объектов
+    """
+    problems = []
+    for a, b in zip(_walk(first), _walk(second)):
+        for field, value in a.__dict__.items():
+            if hasattr(value, "__dataclass_fields__") and value is b.__dict__.get(field):
+                problems.append(f"{type(a).__name__}.{field}: объект общий у двух копий")
+    return problems
+
+
+def main():
+    failed = False
+    for lang in Localization().languages():
+        for name, component in SECTIONS.items():
+            localization = Localization(lang)
+            bindings = TextBindings(localization)
+            root = compact(component(localization, bindings).container)
+            template = Template(lang, root, bindings)
+            problems = template.check()
+            problems += shared_styles(
+                template.instantiate(TextBindings(localization)),
+                template.instantiate(TextBindings(localization)),
+            )
+            print(f"{name:<12} {lang:<4} {'ok' if not problems else 'НАРУШЕНИЯ'}")
+            for problem in problems:
+                print(f"    {problem}")
+            failed = failed or bool(problems)
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Вспомогательные средства для бенчмарков: страница Flet без браузера.
+
+RecordingConnection обрабатывает команды так же, как сервер Flet, но вместо
+отправки в веб-сокет сериализует сообщения и считает их количество и размер.
+Это позволяет измерять реальную нагрузку на сервер и объём трафика сессии.
+"""
+
+import asyncio
+import itertools
+import json
+import os
+import sys
+
+# Добавляем путь к проекту в sys.path для корректного импорта
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flet.core.local_connection import LocalConnection
+from flet.core.page import Page
+from flet.core.protocol import (
+    ClientActions,
+    ClientMessage,
+    CommandEncoder,
+    PageCommandsBatchResponsePayload,
+)
+
+
+class RecordingConnection(LocalConnection):
+    """
+    Соединение, которое считает отправленные клиенту сообщения и байты.
+
+    Атрибуты:
+        messages (int): Количество отправленных сообщений
+        bytes_sent (int): Суммарный размер сообщений в байтах (JSON, UTF-8)
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.messages = 0
+        self.bytes_sent = 0
+
+    def send_command(self, session_id, command):
+        return self.send_commands(session_id, [command])
+
+    def send_commands(self, session_id, commands):
+        results = []
+        messages = []
+        for command in commands:
+            result, message = self._process_command(command)
+            if command.name in ["add", "get"]:
+                results.append(result)
+            if message:
+                messages.append(message)
+        if messages:
+            payload = json.dumps(
+                ClientMessage(ClientActions.PAGE_CONTROLS_BATCH, messages),
+                cls=CommandEncoder,
+                separators=(",", ":"),
+            )
+            self.messages += 1
+            self.bytes_sent += len(payload.encode("utf-8"))
+        return PageCommandsBatchResponsePayload(results=results, error="")
+
+    def reset(self):
+        """
+        Сбрасывает счетчики сообщений и байтов.
+        """
+        self.messages = 0
+        self.bytes_sent = 0
+
+
+_session_ids = itertools.count(1)
+
+
+def make_page(loop=None):
+    """
+    Создает страницу Flet, подключенную к RecordingConnection.
+
+    Args:
+        loop (asyncio.AbstractEventLoop): Цикл событий страницы (по умолчанию новый)
+
+    Returns:
+        tuple: (ft.Page, RecordingConnection)
+    """
+    conn = RecordingConnection()
+    page = Page(conn, f"bench-{next(_session_ids)}", loop or asyncio.new_event_loop())
+    return page, conn
+
+
+def count_controls(control):
+    """
+    Считает элементы в дереве, начиная с указанного.
+
+    Args:
+        control (ft.Control): Корневой элемент
+
+    Returns:
+        int: Количество элементов, включая корневой
+    """
+    return 1 + sum(count_controls(child) for child in control._get_children())
@@ -0,0 +1,317 @@
+"""
+Бюджет размера компонентов интерфейса.
+
+Строит каждый компонент (Header, MainScreen, Services, About, ContactForm, Footer,
+Notice) на всех языках каталога, сворачивает распорки (zen_cat/utils/layout.py)
+и показывает число элементов и размер первого сообщения клиенту до и после
+сворачивания. Результат сравнивается с бюджетом из layout_budget.json: если
+компонент стал больше бюджета, скрипт завершается с кодом 1 — так новые
+распорки и лишние обертки не попадают в код незаметно.
+
+Кроме того, скрипт проверяет, что сворачивание не сдвигает элементы: для набора
+колонок и строк с распорками (одинаковые и разные промежутки, распорки по краям
+под контейнером и под строкой или колонкой, растягивающиеся распорки, скрытые
+элементы) положения элементов до и после compact() должны совпадать.
+
+Бюджет — текущий размер с запасом (по умолчанию 15%, --headroom), поэтому мелкие
+правки текстов и стилей его не превышают, а заметный рост — превышает.
+
+Запуск:
+    python benchmarks/layout_budget.py                  # сравнить с бюджетом
+    python benchmarks/layout_budget.py --save           # записать бюджет: текущие размеры + 15%
+    python benchmarks/layout_budget.py --save --headroom 0.25
+"""
+
+import argparse
+import copy
+import json
+import math
+import os
+import sys
+
+import harness  # noqa: F401  (добавляет корень репозитория в sys.path)
+
+import flet as ft
+from zen_cat.main import THEME
+from zen_cat.utils.localization import Localization
+from zen_cat.utils.bindings import TextBindings
+from zen_cat.utils.layout import compact, measure
+from zen_cat.components.header import Header
+from zen_cat.components.main_screen import MainScreen
+from zen_cat.components.services import Services
+from zen_cat.components.about import About
+from zen_cat.components.contact_form import ContactForm
+from zen_cat.components.footer import Footer
+from zen_cat.components.notice import Notice
+
+
+BUDGET_PATH = os.path.join(os.path.dirname(__file__), "layout_budget.json")
+
+# Запас бюджета над текущим размером
+HEADROOM = 0.15
+
+COMPONENTS = {
+    "Header": lambda loc, bindings: Header(loc, THEME, bindings),
+    "MainScreen": lambda loc, bindings: MainScreen(loc, THEME, bindings),
+    "Services": lambda loc, bindings: Services(loc, THEME, bindings),
+    "About": lambda loc, bindings: About(loc, THEME, bindings),
+    "ContactForm": lambda loc, bindings: ContactForm(loc, THEME, bindings),
+    "Footer": lambda loc, bindings: Footer(loc, THEME, bindings),
+    "Notice": lambda loc, bindings: Notice(loc, THEME, "busy"),
+}
+
+
+def _spacer(height):
+    return ft.Container(height=height)
+
+
+def _hspacer(width):
+    return ft.Container(width=width)
+
+
+def _spring():
+    return ft.Container(expand=True)
+
+
+def _hidden(value):
+    return ft.Text(value, visible=False)
+
+
+# Колонки (строки) с распорками и родитель, в который они вложены. Родитель —
+# обычный контейнер (края сворачиваются в его padding) или строка/колонка (края
+# остаются распоркой)
+LAYOUT_CASES = {
+    "одинаковые промежутки": lambda: ft.Row([ft.Column(
+        [ft.Text("a"), _spacer(16), ft.Text("b"), _spacer(16), ft.Text("c")]
+    )]),
+    "одинаковые промежутки в строке": lambda: ft.Container(content=ft.Row(
+        [ft.Text("a"), _hspacer(12), ft.Text("b"), _hspacer(12), ft.Text("c")], spacing=0
+    )),
+    "разные промежутки": lambda: ft.Row([ft.Column(
+        [ft.Text("a"), _spacer(16), ft.Container(content=ft.Text("b")), _spacer(24), ft.Text("c")]
+    )]),
+    "разные промежутки в строке": lambda: ft.Container(content=ft.Row([
+        ft.Container(content=ft.Text("a")), _hspacer(8), ft.Text("b"),
+        _hspacer(30), ft.Container(content=ft.Text("c"), margin=ft.margin.only(left=4)),
+    ], spacing=0)),
+    "края в строке": lambda: ft.Row([ft.Column(
+        [_spacer(20), ft.Text("a"), _spacer(30), ft.Text("b")], spacing=0
+    )]),
+    "широкий край в строке": lambda: ft.Row([ft.Column(
+        [_spacer(40), ft.Text("a"), _spacer(30), ft.Text("b"), _spacer(45)], spacing=0
+    )]),
+    "края в колонке": lambda: ft.Column([ft.Row(
+        [_hspacer(24), ft.Container(content=ft.Text("a")), _hspacer(16), ft.Text("b"), _hspacer(24)]
+    )]),
+    "края в контейнере": lambda: ft.Container(content=ft.Column(
+        [_spacer(20), ft.Text("a"), _spacer(30), ft.Text("b"), _spacer(8)], spacing=0
+    )),
+    "края в контейнере с отступами": lambda: ft.Container(content=ft.Column(
+        [_spacer(24), ft.Text("a"), _spacer(16), ft.Text("b"), _spacer(24)]
+    ), padding=ft.padding.only(top=8, bottom=4)),
+    "пружина в строке": lambda: ft.Container(content=ft.Row(
+        [ft.Text("a"), _spring(), ft.Text("b")]
+    ), padding=ft.padding.only(top=24, bottom=24)),
+    "пружина в колонке": lambda: ft.Row([ft.Column(
+        [ft.Text("a"), _spring(), ft.Container(content=ft.Text("b"))]
+    )]),
+    "пружина и распорки": lambda: ft.Row([ft.Column(
+        [_spacer(20), ft.Text("a"), _spring(), ft.Text("b"), _spacer(16), ft.Container(content=ft.Text("c"))]
+    )]),
+    "скрытые элементы": lambda: ft.Container(content=ft.Column([
+        _hidden("h1"), _spacer(16), ft.Text("a"), _spacer(16), _hidden("h2"), _spacer(8),
+        ft.Container(content=ft.Text("b")), _hidden("h3"), _spacer(24), ft.Text("c"), _spacer(16), _hidden("h4"),
+    ])),
+    "скрытые элементы в строке": lambda: ft.Row([ft.Column([
+        ft.Text("a"), _hidden("h1"), _spacer(16), ft.Text("b"), _spacer(16), _hidden("h2"), ft.Text("c"),
+    ])]),
+}
+
+
+def _side(value, side):
+    if value is None:
+        return 0
+    if isinstance(value, (int, float)):
+        return value
+    return getattr(value, side)
+
+
+def _label(control):
+    if isinstance(control, ft.Container):
+        return _label(control.content)
+    return control.value
+
+
+def _place(tokens, base):
+    """
+    Раскладывает участок колонки от его начала.
+
+    Args:
+        tokens (list): Участок: ("gap", размер), ("item", элемент, margin до, margin после)
+            и ("hidden", элемент)
+        base (float): Положение начала участка
+
+    Returns:
+        tuple: Положения элементов участка [(метка, положение)] и конец участка
+    """
+    result = []
+    offset = base
+    for token in tokens:
+        if token[0] == "gap":
+            offset += token[1]
+        elif token[0] == "hidden":
+            result.append((_label(token[1]), "скрыт"))
+        else:
+            _, control, margin_before, margin_after = token
+            result.append((_label(control), offset + margin_before))
+            offset += margin_before + margin_after
+    return result, offset
+
+
+def positions(root):
+    """
+    Вычисляет положения содержательных элементов колонки (строки) вдоль главной оси.
+
+    Элементы считаются нулевого размера, учитываются распорки, spacing, margin и padding.
+    Растягивающаяся распорка или выравнивание SPACE_BETWEEN (SPACE_AROUND, SPACE_EVENLY)
+    занимают неизвестное свободное место, поэтому элементы после первой такой пружины
+    отсчитываются от конца, а между пружинами — от начала своего участка. Скрытые
+    элементы места не занимают, но остаются в списке на своем месте среди соседей.
+
+    Args:
+        root (ft.Container | ft.Row | ft.Column): Родитель с единственной колонкой или строкой
+
+    Returns:
+        list: Метки элементов с положениями и конец колонки (если в ней нет пружин)
+    """
+    if isinstance(root, ft.Container):
+        flex, padding = root.content, root.padding
+    else:
+        flex, padding = root.controls[0], None
+    prop, before, after = ("height", "top", "bottom") if type(flex) is ft.Column else ("width", "left", "right")
+    spacing = 10 if flex.spacing is None else flex.spacing
+    spread = flex.alignment in (
+        ft.MainAxisAlignment.SPACE_BETWEEN, ft.MainAxisAlignment.SPACE_AROUND, ft.MainAxisAlignment.SPACE_EVENLY
+    )
+
+    # Участки между пружинами
+    segments = [[("gap", _side(padding, before))]]
+    seen = False
+    for control in flex.controls:
+        if control.visible is False:
+            segments[-1].append(("hidden", control))
+            continue
+        if seen:
+            if spread:
+                segments.append([])
+            segments[-1].append(("gap", spacing))
+        seen = True
+        if type(control) is ft.Container and control.content is None and control.expand:
+            segments.append([])
+        elif type(control) is ft.Container and control.content is None and getattr(control, prop) is not None:
+            segments[-1].append(("gap", getattr(control, prop)))
+        else:
+            margin = getattr(control, "margin", None)
+            segments[-1].append(("item", control, _side(margin, before), _side(margin, after)))
+    segments[-1].append(("gap", _side(padding, after)))
+
+    if len(segments) == 1:
+        result, end = _place(segments[0], 0)
+        return result + [("конец", end)]
+    result = []
+    for index, tokens in enumerate(segments[:-1]):
+        placed, _ = _place(tokens, 0)
+        result += [(label, (index, value)) for label, value in placed]
+    # Последний участок — от конца колонки
+    placed, length = _place(segments[-1], 0)
+    result += [(label, value if value == "скрыт" else ("от конца", length - value)) for label, value in placed]
+    return result
+
+
+def check_layout():
+    """
+    Проверяет, что compact() не сдвигает элементы в LAYOUT_CASES.
+
+    Returns:
+        list: Названия случаев, в которых положения изменились
+    """
+    broken = []
+    for name, factory in LAYOUT_CASES.items():
+        root = factory()
+        expected = positions(copy.deepcopy(root))
+        actual = positions(compact(root))
+        if actual != expected:
+            print(f"раскладка изменилась ({name}): {expected} -> {actual}")
+            broken.append(name)
+    return broken
+
+
+def measure_component(factory):
+    """
+    Измеряет компонент на всех языках до и после сворачивания распорок.
+
+    Args:
+        factory (callable): Функция (локализация, привязки) -> компонент
+
+    Returns:
+        tuple: Размеры до и после {"controls", "bytes"} (наибольшие по языкам)
+    """
+    before = {"controls": 0, "bytes": 0}
+    after = {"controls": 0, "bytes": 0}
+    for lang in Localization().languages():
+        localization = Localization(lang)
+        for result, transform in ((before, lambda control: control), (after, compact)):
+            container = transform(factory(localization, TextBindings(localization)).container)
+            size = measure(container)
+            for key in result:
+                result[key] = max(result[key], size[key])
+    return before, after
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--budget", default=BUDGET_PATH, help="Файл бюджета")
+    parser.add_argument("--save", action="store_true", help="Сохранить текущие размеры с запасом как бюджет")
+    parser.add_argument("--headroom", type=float, default=HEADROOM, help="Запас бюджета (доля, для --save)")
+    args = parser.parse_args()
+
+    budget = {}
+    if not args.save and os.path.exists(args.budget):
+        with open(args.budget, encoding="utf-8") as file:
+            budget = json.load(file)
+
+    results = {}
+    over = []
+    print(f"{'компонент':<12} {'элементов':>14} {'байт':>16} {'бюджет':>14}")
+    for name, factory in COMPONENTS.items():
+        before, after = measure_component(factory)
+        results[name] = after
+        line = (f"{name:<12} {before['controls']:>5} -> {after['controls']:<5} "
+                f"{before['bytes']:>6} -> {after['bytes']:<6}")
+        limit = budget.get(name)
+        if limit:
+            line += f" {limit['controls']:>5} / {limit['bytes']:<6}"
+            if after["controls"] > limit["controls"] or after["bytes"] > limit["bytes"]:
+                over.append(name)
+                line += "  ПРЕВЫШЕН"
+        print(line)
+
+    broken = check_layout()
+
+    if args.save:
+        limits = {
+            name: {key: math.ceil(value * (1 + args.headroom)) for key, value in size.items()}
+            for name, size in results.items()
+        }
+        with open(args.budget, "w", encoding="utf-8") as file:
+            json.dump(limits, file, ensure_ascii=False, indent=2)
+            file.write("\n")
+        print(f"Бюджет сохранен в {args.budget}")
+    elif over:
+        print(f"Бюджет превышен: {', '.join(over)}")
+    if broken or over:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
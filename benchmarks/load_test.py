@@ -0,0 +1,373 @@
+"""
+Нагрузочный тест: множество одновременных сессий Flet в одном процессе.
+
+Сессии обслуживаются так же, как в сервере Flet (flet/app.py): общий цикл событий,
+общий пул потоков, main(page) запускается в пуле, события клиента передаются
+в page.on_event_async. Вместо веб-сокета используется RecordingConnection,
+поэтому тест работает без сети и браузера.
+
+Каждая сессия:
+1. подключается (main(page) до первой отрисовки) — «build»;
+2. переключает язык через меню в шапке и ждет обновления страницы — «toggle»;
+3. прокручивает страницу до формы (в режиме ZEN_CAT_LAZY_SECTIONS секции ниже
+   первого экрана строятся при прокрутке), заполняет форму (изменения свойств и события change, как от клиента),
+   нажимает «Отправить» и ждет обновления страницы — «submit»;
+4. отключается (событие page close, как при истечении сессии, и page._close()).
+
+Сессия сверх предела ZEN_CAT_SESSION_MAX получает страницу «сервис занят»:
+такие сессии считаются отдельно (busy) и в задержки не попадают.
+
+Результат — JSON с сессиями в секунду, p50/p95/p99 задержек по шагам, ростом RSS
+на сессию и числом ошибок. Файл результата можно сравнить с результатом
+другой версии (--compare). С --memory включается учет памяти по сессиям
+(ZEN_CAT_MEMORY_TRACKING): в результат добавляются расход памяти на сессию
+по компонентам и сессии, объекты которых пережили отключение.
+
+Запуск:
+    python benchmarks/load_test.py [--sessions 1000] [--concurrency 100] [--output result.json]
+    python benchmarks/load_test.py --sessions 1000 --compare baseline.json
+    python benchmarks/load_test.py --sessions 200 --memory
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Заявки пишутся во временную базу, внешние каналы доставки отключены
+_TMP = tempfile.mkdtemp(prefix="zen-cat-load-")
+os.environ["ZEN_CAT_DB_PATH"] = os.path.join(_TMP, "load.db")
+os.environ["ZEN_CAT_SMTP_HOST"] = ""
+os.environ["ZEN_CAT_WEBHOOK_URLS"] = ""
+# Учет памяти включается до импорта приложения: трекер создается при импорте
+if "--memory" in sys.argv:
+    os.environ["ZEN_CAT_MEMORY_TRACKING"] = "1"
+
+from harness import RecordingConnection
+
+import flet as ft
+from flet.core.event import Event
+from flet.core.page import Page
+
+from zen_cat.main import main as zen_cat_main
+from zen_cat.pipeline.service import get_pipeline
+from zen_cat.utils.memory import MEMORY
+from zen_cat.utils.sessions import SESSIONS
+
+
+STEPS = ("build", "toggle", "submit")
+
+# Прокрутка страницы до конца построенной части (в отложенном режиме строит следующую секцию)
+SCROLL_TO_END = json.dumps({"t": "end", "p": 1000, "minse": 0, "maxse": 1000, "vd": 800})
+
+NAMES = ("Анна", "Борис", "Вера", "Глеб", "Дарья", "Егор", "Жанна", "Зоя", "Илья", "Кира")
+
+
+class WaitingConnection(RecordingConnection):
+    """
+    RecordingConnection, позволяющее дождаться следующего сообщения клиенту.
+    """
+
+    def __init__(self, loop):
+        super().__init__()
+        self.loop = loop
+        self._waiter = None
+
+    def expect(self):
+        """
+        Создает ожидание следующего сообщения клиенту.
+
+        Returns:
+            asyncio.Future: Будущее, которое завершится при отправке сообщения
+        """
+        self._waiter = self.loop.create_future()
+        return self._waiter
+
+    def send_commands(self, session_id, commands):
+        result = super().send_commands(session_id, commands)
+        waiter = self._waiter
+        if waiter is not None:
+            self._waiter = None
+            self.loop.call_soon_threadsafe(_resolve, waiter)
+        return result
+
+
+def _resolve(future):
+    if not future.done():
+        future.set_result(None)
+
+
+def rss_bytes():
+    """
+    Возвращает текущий размер резидентной памяти процесса (Linux).
+
+    Returns:
+        int: RSS в байтах
+    """
+    with open("/proc/self/statm") as statm:
+        return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+def find(page, predicate):
+    """
+    Находит элемент страницы по условию.
+
+    Args:
+        page (ft.Page): Страница
+        predicate (callable): Условие для элемента
+
+    Returns:
+        ft.Control: Первый подходящий элемент
+    """
+    return next(control for control in page._index.values() if predicate(control))
+
+
+async def dispatch(page, conn, target, name, data="", timeout=10.0):
+    """
+    Передает странице событие клиента и ждет ответного обновления.
+
+    Args:
+        page (ft.Page): Страница
+        conn (WaitingConnection): Соединение страницы
+        target (ft.Control): Элемент-источник события
+        name (str): Имя события
+        data (str): Данные события
+        timeout (float): Максимальное время ожидания в секундах
+
+    Returns:
+        float: Время до обновления страницы в секундах
+    """
+    waiter = conn.expect()
+    started = time.perf_counter()
+    await page.on_event_async(Event(target.uid, name, data))
+    await asyncio.wait_for(waiter, timeout)
+    return time.perf_counter() - started
+
+
+async def session(number, loop, executor, latencies):
+    """
+    Проводит одну сессию посетителя.
+
+    Args:
+        number (int): Номер сессии
+        loop (asyncio.AbstractEventLoop): Цикл событий
+        executor (ThreadPoolExecutor): Пул потоков обработчиков
+        latencies (dict): Списки задержек по шагам
+
+    Returns:
+        bool: False, если сессия получила страницу «сервис занят»
+    """
+    conn = WaitingConnection(loop)
+    page = Page(conn, f"load-{number}", loop=loop, executor=executor)
+    try:
+        started = time.perf_counter()
+        await loop.run_in_executor(executor, zen_cat_main, page)
+        elapsed = time.perf_counter() - started
+
+        # Переключаемся на один из языков, отличных от текущего
+        items = [c for c in page._index.values() if isinstance(c, ft.PopupMenuItem) and not c.checked]
+        if not items:
+            return False
+        latencies["build"].append(elapsed)
+        item = items[number % len(items)]
+        latencies["toggle"].append(await dispatch(page, conn, item, "click"))
+
+        # Прокручиваем страницу до формы (в режиме ZEN_CAT_LAZY_SECTIONS секции строятся при прокрутке)
+        while not any(isinstance(c, ft.TextField) for c in page._index.values()):
+            try:
+                await dispatch(page, conn, page.views[0], "scroll", SCROLL_TO_END, timeout=1.0)
+            except asyncio.TimeoutError:
+                pass  # Секции уже построены в паузе после первой отрисовки
+
+        values = {
+            "name": NAMES[number % len(NAMES)],
+            "email": f"guest{number}@example.com",
+            "message": f"Хочу записаться на медитацию, сессия {number}",
+        }
+        changes = []
+        for name, value in values.items():
+            field = find(page, lambda c, name=name: isinstance(c, ft.TextField) and c.data == name)
+            changes.append({"i": field.uid, "value": value})
+            await page.on_event_async(Event(field.uid, "change", value))
+        await page.on_event_async(Event("page", "change", json.dumps(changes)))
+
+        button = find(page, lambda c: isinstance(c, ft.ElevatedButton))
+        latencies["submit"].append(await dispatch(page, conn, button, "click"))
+        return True
+    finally:
+        await page.on_event_async(Event("page", "close", ""))
+        page._close()
+
+
+def percentiles(values):
+    """
+    Вычисляет p50/p95/p99 в миллисекундах.
+
+    Args:
+        values (list): Длительности в секундах
+
+    Returns:
+        dict: Перцентили и число замеров
+    """
+    if len(values) < 2:
+        return {"count": len(values)}
+    cuts = statistics.quantiles(values, n=100, method="inclusive")
+    return {
+        "count": len(values),
+        "p50_ms": round(cuts[49] * 1000, 3),
+        "p95_ms": round(cuts[94] * 1000, 3),
+        "p99_ms": round(cuts[98] * 1000, 3),
+    }
+
+
+def version():
+    """
+    Возвращает версию кода (git) для сравнения результатов.
+
+    Returns:
+        str: Хэш коммита (с пометкой -dirty при незакоммиченных изменениях) или "unknown"
+    """
+    try:
+        return subprocess.run(
+            ["git", "describe", "--always", "--dirty"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+async def run(sessions, concurrency, workers):
+    """
+    Проводит серию сессий с ограничением числа одновременных.
+
+    Args:
+        sessions (int): Количество сессий
+        concurrency (int): Максимум одновременных сессий
+        workers (int): Размер пула потоков обработчиков
+
+    Returns:
+        dict: Результаты теста
+    """
+    loop = asyncio.get_running_loop()
+    executor = ThreadPoolExecutor(workers, thread_name_prefix="load")
+    latencies = {step: [] for step in STEPS}
+    errors = {}
+    busy = 0
+    semaphore = asyncio.Semaphore(concurrency)
+
+    # Исключения в обработчиках событий (они выполняются в пуле потоков) тоже считаются ошибками
+    def on_exception(loop, context):
+        error = context.get("exception")
+        kind = f"handler:{type(error).__name__ if error else 'unknown'}"
+        errors[kind] = errors.get(kind, 0) + 1
+
+    loop.set_exception_handler(on_exception)
+
+    async def guarded(number):
+        nonlocal busy
+        async with semaphore:
+            try:
+                if not await session(number, loop, executor, latencies):
+                    busy += 1
+            except Exception as error:
+                kind = type(error).__name__
+                errors[kind] = errors.get(kind, 0) + 1
+
+    # Прогрев: кэши каталога и шаблонов, первая заявка запускает очередь записи.
+    # Сессия прогрева идет в отдельной задаче, как и остальные: Flet запоминает
+    # страницу в контекстной переменной, и контекст основной задачи удерживал бы ее
+    await asyncio.create_task(guarded(-1))
+    latencies = {step: [] for step in STEPS}
+    errors.clear()
+    busy = 0
+
+    gc.collect()
+    rss_before = rss_bytes()
+    started = time.perf_counter()
+    await asyncio.gather(*(guarded(number) for number in range(sessions)))
+    elapsed = time.perf_counter() - started
+    executor.shutdown(wait=True)
+    gc.collect()
+    rss_after = rss_bytes()
+    await asyncio.sleep(0)
+
+    get_pipeline().stop()
+    result = {
+        "version": version(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "flet": ft.version.version,
+        "params": {"sessions": sessions, "concurrency": concurrency, "workers": workers},
+        "elapsed_s": round(elapsed, 3),
+        "sessions_per_s": round(sessions / elapsed, 2),
+        "latency": {step: percentiles(values) for step, values in latencies.items()},
+        "rss_before_bytes": rss_before,
+        "rss_after_bytes": rss_after,
+        "rss_per_session_bytes": round((rss_after - rss_before) / sessions),
+        "errors": errors,
+        "busy": busy,
+        "sessions_registry": SESSIONS.stats(),
+        "submissions": get_pipeline().stats(),
+    }
+    if MEMORY.enabled:
+        # Пауза, чтобы завершились обработчики закрытия последних сессий
+        await asyncio.sleep(1.0)
+        result["leaks"] = MEMORY.leaks(grace=0)
+        result["memory"] = MEMORY.report()
+    return result
+
+
+def compare(result, baseline):
+    """
+    Печатает сравнение результата с результатом другой версии.
+
+    Args:
+        result (dict): Текущий результат
+        baseline (dict): Результат для сравнения
+    """
+    rows = [("sessions_per_s", result["sessions_per_s"], baseline["sessions_per_s"])]
+    for step in STEPS:
+        for key in ("p50_ms", "p95_ms", "p99_ms"):
+            rows.append((f"{step}.{key}", result["latency"][step].get(key), baseline["latency"][step].get(key)))
+    rows.append(("rss_per_session_bytes", result["rss_per_session_bytes"], baseline["rss_per_session_bytes"]))
+
+    print(f"{'метрика':<24} {baseline['version']:>14} {result['version']:>14} {'изменение':>10}", file=sys.stderr)
+    for name, current, previous in rows:
+        change = f"{(current - previous) / previous:+.1%}" if current is not None and previous else "—"
+        print(f"{name:<24} {previous!s:>14} {current!s:>14} {change:>10}", file=sys.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=1000, help="Количество сессий")
+    parser.add_argument("--concurrency", type=int, default=100, help="Максимум одновременных сессий")
+    parser.add_argument("--workers", type=int, default=32, help="Размер пула потоков обработчиков")
+    parser.add_argument("--output", help="Файл для результата в JSON (по умолчанию stdout)")
+    parser.add_argument("--compare", help="Файл с результатом другой версии для сравнения")
+    parser.add_argument("--memory", action="store_true", help="Учет памяти по сессиям и поиск утечек")
+    args = parser.parse_args()
+
+    result = asyncio.run(run(args.sessions, args.concurrency, args.workers))
+    text = json.dumps(result, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output:
+            output.write(text + "\n")
+    else:
+        print(text)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as baseline:
+            compare(result, json.load(baseline))
+
+
+if __name__ == "__main__":
+    main()
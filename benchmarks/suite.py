@@ -0,0 +1,200 @@
+"""
+Набор микро-бенчмарков с порогами регрессии.
+
+Покрывает локализацию (Localization.get, Localization.toggle_lang), построение
+компонентов (Header, MainScreen, Services, About, ContactForm, Footer),
+обновление интерфейса при смене языка (ZenCatApp.update_ui) и отправку формы
+(ContactForm._submit_form). Для каждого замера берется лучшее из нескольких
+повторов время одной операции; замедленный замер перепроверяется еще
+до двух раз.
+
+Базовые значения хранятся в benchmarks/baseline.json. Режим сравнения
+завершается с кодом 1, если какой-либо замер медленнее базового больше
+чем на --threshold процентов. Базовые значения зависят от машины: сохраняйте
+их заново (--save) на той машине, где выполняется сравнение.
+
+Запуск:
+    python benchmarks/suite.py                     # замер и сравнение с базовыми значениями
+    python benchmarks/suite.py --threshold 10      # допустимое замедление, %
+    python benchmarks/suite.py --save              # сохранить новые базовые значения
+    python benchmarks/suite.py --filter Localization
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import timeit
+
+from harness import make_page
+
+from zen_cat.main import THEME, ZenCatApp
+from zen_cat.components.header import Header
+from zen_cat.components.main_screen import MainScreen
+from zen_cat.components.services import Services
+from zen_cat.components.about import About
+from zen_cat.components.contact_form import ContactForm
+from zen_cat.components.footer import Footer
+from zen_cat.utils.bindings import TextBindings
+from zen_cat.utils.localization import Localization
+
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+
+def bench_localization_get():
+    """
+    Получение текста по ключу.
+    """
+    localization = Localization()
+    return lambda: localization.get("main_title")
+
+
+def bench_localization_toggle():
+    """
+    Переключение на следующий язык.
+    """
+    localization = Localization()
+    return localization.toggle_lang
+
+
+def bench_build(component):
+    """
+    Создание компонента (конструктор вызывает build) с новым реестром привязок.
+
+    Args:
+        component (type): Класс компонента
+
+    Returns:
+        callable: Функция, возвращающая измеряемую операцию
+    """
+    def setup():
+        localization = Localization()
+        return lambda: component(localization, THEME, TextBindings(localization))
+    return setup
+
+
+def bench_update_ui():
+    """
+    Смена языка в сессии: update_ui и отправка обновления планировщиком.
+    """
+    page, conn = make_page()
+    app = ZenCatApp(page)
+    loop = page.loop
+
+    def run():
+        app.localization.toggle_lang()
+        app.update_ui()
+        # Один проход цикла событий: планировщик отправляет обновление
+        loop.call_soon(loop.stop)
+        loop.run_forever()
+
+    return run
+
+
+def bench_submit_form():
+    """
+    Отправка заполненной формы: проверка полей, смена состояния и обновление страницы.
+    """
+    page, conn = make_page()
+    app = ZenCatApp(page)
+    form = app.contact_form
+    form.on_submit = lambda *args: True  # Без постановки в очередь заявок
+    loop = page.loop
+
+    def run():
+        form.name_field.value = "Анна"
+        form.email_field.value = "anna@example.com"
+        form.message_field.value = "Хочу на медитацию"
+        form._submit_form(None)
+        loop.call_soon(loop.stop)
+        loop.run_forever()
+
+    return run
+
+
+BENCHMARKS = {
+    "Localization.get": bench_localization_get,
+    "Localization.toggle_lang": bench_localization_toggle,
+    "Header.build": bench_build(Header),
+    "MainScreen.build": bench_build(MainScreen),
+    "Services.build": bench_build(Services),
+    "About.build": bench_build(About),
+    "ContactForm.build": bench_build(ContactForm),
+    "Footer.build": bench_build(Footer),
+    "ZenCatApp.update_ui": bench_update_ui,
+    "ContactForm._submit_form": bench_submit_form,
+}
+
+
+def measure(setup, repeat):
+    """
+    Измеряет время одной операции.
+
+    Args:
+        setup (callable): Функция, возвращающая измеряемую операцию
+        repeat (int): Количество повторов
+
+    Returns:
+        float: Лучшее время одной операции в секундах
+    """
+    # Сборщик мусора включен: элементы Flet связаны циклическими ссылками, и без него
+    # память растет от повтора к повтору, а время замеров «плывет»
+    timer = timeit.Timer(setup(), setup="import gc; gc.enable()")
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat, number)) / number
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="Файл базовых значений")
+    parser.add_argument("--save", action="store_true", help="Сохранить результаты как базовые")
+    parser.add_argument("--threshold", type=float, default=20.0, help="Допустимое замедление, %%")
+    parser.add_argument("--repeat", type=int, default=7, help="Количество повторов замера")
+    parser.add_argument("--filter", default="", help="Запускать только замеры, содержащие строку")
+    args = parser.parse_args()
+
+    baseline = {}
+    if not args.save and os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as file:
+            baseline = json.load(file)["results"]
+
+    results = {}
+    regressions = []
+    print(f"{'замер':<28} {'мкс/оп':>10} {'база':>10} {'изменение':>10}")
+    for name, setup in BENCHMARKS.items():
+        if args.filter not in name:
+            continue
+        results[name] = measure(setup, args.repeat)
+        if name in baseline:
+            # Замедление перепроверяется, чтобы случайный всплеск нагрузки на машине
+            # не считался регрессией
+            for _ in range(2):
+                if results[name] <= baseline[name] * (1 + args.threshold / 100):
+                    break
+                results[name] = min(results[name], measure(setup, args.repeat))
+        line = f"{name:<28} {results[name] * 1e6:>10.2f}"
+        if name in baseline:
+            change = (results[name] - baseline[name]) / baseline[name] * 100
+            line += f" {baseline[name] * 1e6:>10.2f} {change:>+9.1f}%"
+            if change > args.threshold:
+                regressions.append(name)
+                line += "  РЕГРЕССИЯ"
+        print(line)
+
+    if args.save:
+        with open(args.baseline, "w", encoding="utf-8") as file:
+            json.dump({
+                "machine": {"python": platform.python_version(), "platform": platform.platform()},
+                "results": results,
+            }, file, ensure_ascii=False, indent=2)
+            file.write("\n")
+        print(f"Базовые значения сохранены в {args.baseline}")
+    elif regressions:
+        print(f"Замедление больше {args.threshold:g}%: {', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,8 @@
 
 import flet as ft
 from zen_cat.utils.localization import Localization
+from zen_cat.utils.bindings import TextBindings
+from zen_cat.utils.theme import Theme
 
 
 class About:
@@ -14,19 +16,22 @@ class About:
     
     Атрибуты:
         localization (Localization): Объект локализации
-        theme (dict): Словарь с настройками темы
+        theme (Theme): Скомпилированная тема
+        bindings (TextBindings): Реестр привязок текстов к каталогу
     """
     
-    def __init__(self, localization: Localization, theme: dict):
+    def __init__(self, localization: Localization, theme: Theme, bindings: TextBindings):
         """
         Инициализирует компонент блока "О нас".
         
         Args:
             localization (Localization): Объект локализации
-            theme (dict): Словарь с настройками темы
+            theme (Theme): Скомпилированная тема
+            bindings (TextBindings): Реестр привязок текстов к каталогу
         """
         self.localization = localization
         self.theme = theme
+        self.bindings = bindings
         
         # Элементы компонента
         self.title = ft.Text()
@@ -43,21 +48,16 @@ class About:
             ft.Container: Контейнер с блоком "О нас"
         """
         # Заголовок блока
-        self.title = ft.Text(
-            value=self.localization.get("about_title"),
-            size=self.theme["font_sizes"]["lg"],
-            weight=ft.FontWeight.BOLD,
-            color=self.theme["colors"]["text"],
-            text_align=ft.TextAlign.LEFT
-        )
+        self.title = self.bindings.bind(ft.Text(
+            text_align=ft.TextAlign.LEFT,
+            **self.theme.title
+        ), "value", "about_title")
         
         # Описание
-        self.description = ft.Text(
-            value=self.localization.get("about_text"),
-            size=self.theme["font_sizes"]["sm"],
-            color=self.theme["colors"]["text_light"],
-            text_align=ft.TextAlign.LEFT
-        )
+        self.description = self.bindings.bind(ft.Text(
+            text_align=ft.TextAlign.LEFT,
+            **self.theme.body
+        ), "value", "about_text")
         
         # Изображение кота (временно заменено эмодзи в другой позе)
         cat_image = ft.Text(
@@ -75,16 +75,15 @@ class About:
                         content=self.title,
                         alignment=ft.alignment.center_left
                     ),
-                    ft.Container(height=self.theme["spacing"]["md"]),  # Отступ
+                    ft.Container(height=self.theme.spacing.md),  # Отступ
                     
                     # Создаем адаптивный контейнер для основного контента
                     self._create_responsive_content(self.description, cat_image)
                 ],
                 spacing=0,
             ),
-            margin=ft.margin.only(bottom=self.theme["spacing"]["xl"]),
-            padding=ft.padding.all(self.theme["spacing"]["md"]),
-            width=800
+            width=800,
+            **self.theme.section
         )
     
     def _create_responsive_content(self, description, cat_image):
@@ -103,7 +102,7 @@ class About:
         # Создаем контейнер с текстом
         text_container = ft.Container(
             content=description,
-            padding=ft.padding.only(right=self.theme["spacing"]["md"]),
+            padding=ft.padding.only(right=self.theme.spacing.md),
             expand=True
         )
         
@@ -113,9 +112,9 @@ class About:
             alignment=ft.alignment.center,
             width=150,
             height=150,
-            bgcolor=self.theme["colors"]["white"],
+            bgcolor=self.theme.colors.white,
             border_radius=75,  # Круглый контейнер
-            padding=self.theme["spacing"]["md"],
+            padding=self.theme.spacing.md,
         )
         
         # Вместо ResponsiveRow используем обычный Row
@@ -127,10 +126,4 @@ class About:
             alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
             vertical_alignment=ft.CrossAxisAlignment.CENTER
         )
-    
-    def update_texts(self):
-        """
-        Обновляет тексты компонента в соответствии с текущим языком.
-        """
-        self.title.value = self.localization.get("about_title")
-        self.description.value = self.localization.get("about_text") 
\ No newline at end of file
+ 
\ No newline at end of file
@@ -2,11 +2,32 @@
 Модуль, содержащий компонент формы обратной связи для приложения Zen-кот.
 
 Форма содержит поля для имени, email и сообщения, а также кнопку отправки.
-После отправки формы показывается сообщение с благодарностью и меняется изображение кота.
+После отправки формы заявка передается приложению через on_submit, показывается
+сообщение с благодарностью и меняется изображение кота.
+
+Каждая отрисовка формы получает свой ключ (form_key), который передается вместе
+с заявкой: повторные нажатия кнопки для одной и той же заявки приложение
+считает одной заявкой.
+
+Поля проверяются при вводе: проверка запускается после паузы в наборе
+(config.VALIDATION_DEBOUNCE) или при уходе из поля, а страница обновляется,
+только если текст ошибки поля изменился.
+
+Возврат кота в исходное состояние откладывается через общее колесо таймеров
+(TIMERS): действие выполняется в цикле событий страницы и отменяется вместе
+с остальными таймерами сессии, когда она закрывается.
 """
 
+import uuid
+
 import flet as ft
+from zen_cat import config
 from zen_cat.utils.localization import Localization
+from zen_cat.utils.bindings import TextBindings
+from zen_cat.utils.theme import Theme
+from zen_cat.utils.timers import TIMERS
+from zen_cat.utils.tracing import traced
+from zen_cat.utils.validation import validate
 
 
 class ContactForm:
@@ -15,20 +36,29 @@ class ContactForm:
     
     Атрибуты:
         localization (Localization): Объект локализации
-        theme (dict): Словарь с настройками темы
+        theme (Theme): Скомпилированная тема
+        bindings (TextBindings): Реестр привязок текстов к каталогу
+        on_submit (callable): Функция обратного вызова при отправке формы
     """
     
-    def __init__(self, localization: Localization, theme: dict):
+    def __init__(self, localization: Localization, theme: Theme, bindings: TextBindings, on_submit=None):
         """
         Инициализирует компонент формы обратной связи.
         
         Args:
             localization (Localization): Объект локализации
-            theme (dict): Словарь с настройками темы
+            theme (Theme): Скомпилированная тема
+            bindings (TextBindings): Реестр привязок текстов к каталогу
+            on_submit (callable): Функция on_submit(name, email, message, form_key) -> bool;
+                возвращает True, если заявка принята в обработку
         """
         self.localization = localization
         self.theme = theme
+        self.bindings = bindings
+        self.on_submit = on_submit
         self.page = None  # Будет установлено позже
+        self.scheduler = None  # Будет установлено позже
+        self.on_activity = None  # Будет установлено позже
         
         # Элементы формы
         self.title = ft.Text()
@@ -39,7 +69,11 @@ class ContactForm:
         
         # Состояние формы
         self.is_submitted = False
+        self._reset_timer = None  # Отложенный возврат кота в исходное состояние
+        self.form_key = uuid.uuid4().hex
+        self.errors = {}  # Имя поля -> ключ текста ошибки
         self.success_message = ft.Text()
+        self.error_message = ft.Text()
         
         # Изображение кота (меняется после отправки)
         self.cat_normal = ft.Text("😸", size=60, text_align=ft.TextAlign.CENTER)
@@ -57,72 +91,67 @@ class ContactForm:
             ft.Container: Контейнер с формой обратной связи
         """
         # Заголовок блока
-        self.title = ft.Text(
-            value=self.localization.get("contact_title"),
-            size=self.theme["font_sizes"]["lg"],
-            weight=ft.FontWeight.BOLD,
-            color=self.theme["colors"]["text"],
-            text_align=ft.TextAlign.CENTER
-        )
+        self.title = self.bindings.bind(ft.Text(
+            text_align=ft.TextAlign.CENTER,
+            **self.theme.title
+        ), "value", "contact_title")
         
         # Поле имени
-        self.name_field = ft.TextField(
-            label=self.localization.get("name_label"),
-            hint_text=self.localization.get("name_placeholder"),
-            border_color=self.theme["colors"]["text_light"],
-            focused_border_color=self.theme["colors"]["primary"],
-            text_size=self.theme["font_sizes"]["sm"]
-        )
+        self.name_field = ft.TextField(**self.theme.field)
         
         # Поле email
-        self.email_field = ft.TextField(
-            label=self.localization.get("email_label"),
-            hint_text=self.localization.get("email_placeholder"),
-            border_color=self.theme["colors"]["text_light"],
-            focused_border_color=self.theme["colors"]["primary"],
-            text_size=self.theme["font_sizes"]["sm"]
-        )
+        self.email_field = ft.TextField(**self.theme.field)
         
         # Поле сообщения
         self.message_field = ft.TextField(
-            label=self.localization.get("message_label"),
-            hint_text=self.localization.get("message_placeholder"),
-            border_color=self.theme["colors"]["text_light"],
-            focused_border_color=self.theme["colors"]["primary"],
             multiline=True,
             min_lines=3,
             max_lines=5,
-            text_size=self.theme["font_sizes"]["sm"]
+            **self.theme.field
         )
         
         # Кнопка отправки
         self.submit_button = ft.ElevatedButton(
-            text=self.localization.get("submit_button"),
             on_click=self._submit_form,
-            style=ft.ButtonStyle(
-                color=self.theme["colors"]["white"],
-                bgcolor=self.theme["colors"]["primary"],
-                shape=ft.RoundedRectangleBorder(radius=8),
-                animation_duration=300,
-            ),
+            style=self.theme.primary_button(),
             height=48
         )
         
         # Сообщение об успешной отправке
         self.success_message = ft.Text(
-            value=self.localization.get("form_success"),
-            size=self.theme["font_sizes"]["md"],
-            color=self.theme["colors"]["primary"],
-            weight=ft.FontWeight.BOLD,
             text_align=ft.TextAlign.CENTER,
-            visible=False
+            visible=False,
+            **self.theme.success
         )
         
+        # Сообщение об ошибке (заявку не удалось принять)
+        self.error_message = ft.Text(
+            text_align=ft.TextAlign.CENTER,
+            visible=False,
+            **self.theme.error
+        )
+        
+        # Привязываем тексты формы к каталогу локализации и подключаем проверку полей
+        for field, prefix in (
+            (self.name_field, "name"),
+            (self.email_field, "email"),
+            (self.message_field, "message")
+        ):
+            field.data = prefix
+            field.on_change = self._on_field_change
+            field.on_blur = self._on_field_blur
+            self.bindings.bind(field, "label", f"{prefix}_label")
+            self.bindings.bind(field, "hint_text", f"{prefix}_placeholder")
+            self.bindings.bind(field, "error_text", lambda localization, name=prefix: self._error_text(localization, name))
+        self.bindings.bind(self.submit_button, "text", "submit_button")
+        self.bindings.bind(self.success_message, "value", "form_success")
+        self.bindings.bind(self.error_message, "value", "form_error")
+        
         # Контейнер с изображением кота
         self.cat_container = ft.Container(
             content=self.cat_normal,
             alignment=ft.alignment.center,
-            margin=ft.margin.only(bottom=self.theme["spacing"]["md"])
+            margin=ft.margin.only(bottom=self.theme.spacing.md)
         )
         
         # Форма
@@ -130,19 +159,23 @@ class ContactForm:
             [
                 self.cat_container,
                 self.name_field,
-                ft.Container(height=self.theme["spacing"]["sm"]),  # Отступ
+                ft.Container(height=self.theme.spacing.sm),  # Отступ
                 self.email_field,
-                ft.Container(height=self.theme["spacing"]["sm"]),  # Отступ
+                ft.Container(height=self.theme.spacing.sm),  # Отступ
                 self.message_field,
-                ft.Container(height=self.theme["spacing"]["md"]),  # Отступ
+                ft.Container(height=self.theme.spacing.md),  # Отступ
                 ft.Container(
                     content=self.submit_button,
                     alignment=ft.alignment.center
                 ),
-                ft.Container(height=self.theme["spacing"]["sm"]),  # Отступ
+                ft.Container(height=self.theme.spacing.sm),  # Отступ
                 ft.Container(
                     content=self.success_message,
                     alignment=ft.alignment.center
+                ),
+                ft.Container(
+                    content=self.error_message,
+                    alignment=ft.alignment.center
                 )
             ],
             spacing=0,
@@ -154,17 +187,17 @@ class ContactForm:
             content=ft.Column(
                 [
                     self.title,
-                    ft.Container(height=self.theme["spacing"]["md"]),  # Отступ
+                    ft.Container(height=self.theme.spacing.md),  # Отступ
                     form
                 ],
                 horizontal_alignment=ft.CrossAxisAlignment.CENTER,
                 spacing=0
             ),
-            margin=ft.margin.only(bottom=self.theme["spacing"]["xl"]),
-            padding=ft.padding.all(self.theme["spacing"]["md"]),
-            alignment=ft.alignment.center
+            alignment=ft.alignment.center,
+            **self.theme.section
         )
     
+    @traced("ContactForm._submit_form")
     def _submit_form(self, e):
         """
         Обрабатывает отправку формы.
@@ -172,53 +205,134 @@ class ContactForm:
         Args:
             e: Событие нажатия кнопки
         """
-        # Валидация полей (можно расширить в будущем)
-        if not self.name_field.value or not self.email_field.value:
+        # Проверяем все поля сразу, не дожидаясь отложенных проверок
+        results = [self._validate_field(name) for name in ("name", "email", "message")]
+        if any(results):
             return
         
-        # Выводим данные формы в консоль (имитация отправки)
-        print(f"Form submitted:")
-        print(f"Name: {self.name_field.value}")
-        print(f"Email: {self.email_field.value}")
-        print(f"Message: {self.message_field.value}")
+        # Передаем заявку приложению (только постановка в очередь, без ожидания записи)
+        if self.on_submit and not self.on_submit(
+            self.name_field.value,
+            self.email_field.value,
+            self.message_field.value or "",
+            self.form_key
+        ):
+            self.error_message.visible = True
+            self._request_update()
+            return
         
-        # Меняем состояние формы
+        # Меняем состояние формы; следующая заявка получит новый ключ
         self.is_submitted = True
+        self.form_key = uuid.uuid4().hex
         self.success_message.visible = True
+        self.error_message.visible = False
         
         # Меняем изображение кота
         self.cat_container.content = self.cat_happy
         
-        # Очищаем поля
-        self.name_field.value = ""
-        self.email_field.value = ""
-        self.message_field.value = ""
+        # Очищаем поля (и отменяем проверки, отложенные до очистки)
+        for name in ("name", "email", "message"):
+            self._field(name).value = ""
+            if self.scheduler:
+                self.scheduler.cancel(name)
+        self._request_update()
         
-        # Через 5 секунд возвращаем кота в нормальное состояние
-        if hasattr(self, 'page') and self.page:
-            self.page.add_delayed_action(5, self._reset_cat)
+        # Через 5 секунд возвращаем кота в нормальное состояние (отсчет заново
+        # при повторной отправке)
+        if self.page:
+            if self._reset_timer is not None:
+                self._reset_timer.cancel()
+            self._reset_timer = TIMERS.schedule(
+                5, self._reset_cat, loop=self.page.loop, owner=str(self.page.session_id)
+            )
     
     def _reset_cat(self):
         """
         Возвращает изображение кота в нормальное состояние.
         """
+        self._reset_timer = None
         if not self.is_submitted:
             return
             
         self.cat_container.content = self.cat_normal
         self.success_message.visible = False
         self.is_submitted = False
+        self._request_update()
+    
+    def _field(self, name):
+        """
+        Возвращает поле формы по имени.
+        
+        Args:
+            name (str): Имя поля (name, email, message)
+        
+        Returns:
+            ft.TextField: Поле формы
+        """
+        return getattr(self, f"{name}_field")
+    
+    def _error_text(self, localization, name):
+        """
+        Возвращает текст ошибки поля на текущем языке.
+        
+        Args:
+            localization (Localization): Объект локализации
+            name (str): Имя поля
+        
+        Returns:
+            str: Текст ошибки или None, если ошибки нет
+        """
+        key = self.errors.get(name)
+        return localization.get(key) if key else None
+    
+    def _validate_field(self, name):
+        """
+        Проверяет поле и показывает ошибку, если результат изменился.
+        
+        Args:
+            name (str): Имя поля
+        
+        Returns:
+            str: Ключ текста ошибки или None
+        """
+        field = self._field(name)
+        key = validate(name, field.value)
+        if key != self.errors.get(name):
+            self.errors[name] = key
+            field.error_text = self._error_text(self.localization, name)
+            self._request_update(field)
+        return key
     
-    def update_texts(self):
-        """
-        Обновляет тексты компонента в соответствии с текущим языком.
-        """
-        self.title.value = self.localization.get("contact_title")
-        self.name_field.label = self.localization.get("name_label")
-        self.name_field.hint_text = self.localization.get("name_placeholder")
-        self.email_field.label = self.localization.get("email_label")
-        self.email_field.hint_text = self.localization.get("email_placeholder")
-        self.message_field.label = self.localization.get("message_label")
-        self.message_field.hint_text = self.localization.get("message_placeholder")
-        self.submit_button.text = self.localization.get("submit_button")
-        self.success_message.value = self.localization.get("form_success") 
\ No newline at end of file
+    def _on_field_change(self, e):
+        """
+        Откладывает проверку поля до паузы в наборе текста.
+        
+        Args:
+            e: Событие изменения поля
+        """
+        name = e.control.data
+        if self.on_activity:
+            self.on_activity()
+        if self.scheduler:
+            self.scheduler.debounce(name, config.VALIDATION_DEBOUNCE, lambda: self._validate_field(name))
+        else:
+            self._validate_field(name)
+    
+    def _on_field_blur(self, e):
+        """
+        Проверяет поле сразу при уходе из поля.
+        
+        Args:
+            e: Событие потери фокуса
+        """
+        self._validate_field(e.control.data)
+    
+    def _request_update(self, *controls):
+        """
+        Запрашивает обновление формы (или отдельных ее элементов) через планировщик обновлений.
+        
+        Args:
+            *controls (ft.Control): Элементы для обновления (по умолчанию вся форма)
+        """
+        if self.scheduler:
+            self.scheduler.request(*(controls or (self.container,)))
@@ -6,6 +6,8 @@
 
 import flet as ft
 from zen_cat.utils.localization import Localization
+from zen_cat.utils.bindings import TextBindings
+from zen_cat.utils.theme import Theme
 
 
 class Footer:
@@ -14,19 +16,22 @@ class Footer:
     
     Атрибуты:
         localization (Localization): Объект локализации
-        theme (dict): Словарь с настройками темы
+        theme (Theme): Скомпилированная тема
+        bindings (TextBindings): Реестр привязок текстов к каталогу
     """
     
-    def __init__(self, localization: Localization, theme: dict):
+    def __init__(self, localization: Localization, theme: Theme, bindings: TextBindings):
         """
         Инициализирует компонент футера.
         
         Args:
             localization (Localization): Объект локализации
-            theme (dict): Словарь с настройками темы
+            theme (Theme): Скомпилированная тема
+            bindings (TextBindings): Реестр привязок текстов к каталогу
         """
         self.localization = localization
         self.theme = theme
+        self.bindings = bindings
         
         # Копирайт
         self.copyright = ft.Text()
@@ -42,16 +47,14 @@ class Footer:
             ft.Container: Контейнер с футером
         """
         # Создаем текст копирайта
-        self.copyright = ft.Text(
-            value=self.localization.get("copyright"),
-            size=self.theme["font_sizes"]["xs"],
-            color=self.theme["colors"]["text_light"],
-            text_align=ft.TextAlign.CENTER
-        )
+        self.copyright = self.bindings.bind(ft.Text(
+            text_align=ft.TextAlign.CENTER,
+            **self.theme.caption
+        ), "value", "copyright")
         
         # Создаем разделительную линию
         divider = ft.Divider(
-            color=self.theme["colors"]["text_light"],
+            color=self.theme.colors.text_light,
             height=1,
             thickness=1
         )
@@ -61,18 +64,13 @@ class Footer:
             content=ft.Column(
                 [
                     divider,
-                    ft.Container(height=self.theme["spacing"]["md"]),  # Отступ
+                    ft.Container(height=self.theme.spacing.md),  # Отступ
                     self.copyright,
-                    ft.Container(height=self.theme["spacing"]["md"])   # Отступ
+                    ft.Container(height=self.theme.spacing.md)   # Отступ
                 ],
                 horizontal_alignment=ft.CrossAxisAlignment.CENTER,
                 spacing=0
             ),
-            padding=ft.padding.only(top=self.theme["spacing"]["md"])
+            **self.theme.footer
         )
-    
-    def update_texts(self):
-        """
-        Обновляет тексты компонента в соответствии с текущим языком.
-        """
-        self.copyright.value = self.localization.get("copyright") 
\ No newline at end of file
+ 
\ No newline at end of file
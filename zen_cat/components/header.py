@@ -1,36 +1,46 @@
 """
 Модуль, содержащий компонент шапки (Header) для приложения Zen-кот.
 
-Шапка включает в себя логотип и переключатель языка.
+Шапка включает в себя логотип и меню выбора языка.
 """
 
 import flet as ft
 from zen_cat.utils.localization import Localization
+from zen_cat.utils.bindings import TextBindings
+from zen_cat.utils.theme import Theme
+from zen_cat.utils.tracing import traced
 
 
 class Header:
     """
-    Компонент шапки сайта, содержащий логотип и переключатель языка.
+    Компонент шапки сайта, содержащий логотип и меню выбора языка.
     
     Атрибуты:
         localization (Localization): Объект локализации
+        theme (Theme): Скомпилированная тема
+        bindings (TextBindings): Реестр привязок текстов к каталогу
         on_language_change (callable): Функция обратного вызова при изменении языка
     """
     
-    def __init__(self, localization: Localization, on_language_change):
+    def __init__(self, localization: Localization, theme: Theme, bindings: TextBindings, on_language_change=None):
         """
         Инициализирует компонент шапки.
         
         Args:
             localization (Localization): Объект локализации
+            theme (Theme): Скомпилированная тема
+            bindings (TextBindings): Реестр привязок текстов к каталогу
             on_language_change (callable): Функция обратного вызова при изменении языка
         """
         self.localization = localization
+        self.theme = theme
+        self.bindings = bindings
         self.on_language_change = on_language_change
         
         # Элементы компонента
         self.logo_text = ft.Text()
-        self.language_button = ft.TextButton()
+        self.language_label = ft.Text()
+        self.language_button = ft.PopupMenuButton()
         
         # Создаем контейнер
         self.container = self.build()
@@ -42,26 +52,31 @@ class Header:
         Returns:
             ft.Container: Контейнер с компонентом шапки
         """
-        # Обновляем тексты перед построением
-        self._update_texts()
-        
         # Создаем логотип в виде текста с эмодзи кота
         self.logo_text = ft.Text(
             "😺 Zen-кот",
-            size=24,
-            weight=ft.FontWeight.BOLD,
-            color="#333333"
+            **self.theme.title
         )
         
-        # Создаем кнопку переключения языка
-        self.language_button = ft.TextButton(
-            text=self.localization.get("language_switch"),
-            on_click=self._toggle_language,
-            style=ft.ButtonStyle(
-                color={"": "#333333"},
-                animation_duration=300,
-            )
-        )
+        # Создаем меню выбора языка: в кнопке показываем код текущего языка
+        self.language_label = self.bindings.bind(ft.Text(
+            size=self.theme.font_sizes.sm,
+            color=self.theme.colors.text
+        ), "value", lambda localization: localization.lang.upper())
+        self.language_button = self.bindings.bind(ft.PopupMenuButton(
+            content=ft.Container(
+                content=self.language_label,
+                padding=ft.padding.symmetric(horizontal=12, vertical=8)
+            ),
+            items=[
+                self.bindings.bind(ft.PopupMenuItem(
+                    text=lang.upper(),
+                    data=lang,
+                    on_click=self._toggle_language
+                ), "checked", lambda localization, lang=lang: localization.lang == lang)
+                for lang in self.localization.languages()
+            ]
+        ), "tooltip", "language_tooltip")
         
         # Создаем контейнер с шапкой
         return ft.Container(
@@ -74,25 +89,18 @@ class Header:
                 alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
                 vertical_alignment=ft.CrossAxisAlignment.CENTER
             ),
-            padding=ft.padding.only(top=24, bottom=24),
-            margin=ft.margin.only(bottom=24),
+            padding=ft.padding.only(top=self.theme.spacing.md, bottom=self.theme.spacing.md),
+            margin=ft.margin.only(bottom=self.theme.spacing.md),
         )
     
+    @traced("Header._toggle_language")
     def _toggle_language(self, e):
         """
         Переключает язык и обновляет компонент.
         
         Args:
-            e: Событие нажатия кнопки
-        """
-        # Вызываем функцию обратного вызова для уведомления основного приложения
-        self.on_language_change(e)
-        # Обновляем тексты в компоненте
-        self._update_texts()
-    
-    def _update_texts(self):
-        """
-        Обновляет тексты компонента в соответствии с текущим языком.
+            e: Событие выбора пункта меню (код языка в e.control.data)
         """
-        if hasattr(self, 'language_button') and self.language_button:
-            self.language_button.text = self.localization.get("language_switch") 
\ No newline at end of file
+        # Вызываем функцию обратного вызова для уведомления основного приложения;
+        # тексты шапки обновляются через общий реестр привязок
+        self.on_language_change(e) 
\ No newline at end of file
@@ -0,0 +1,83 @@
+"""
+Модуль, содержащий компонент основного (первого) экрана для приложения Zen-кот.
+
+Основной экран содержит заголовок, подзаголовок и изображение кота.
+"""
+
+import flet as ft
+from zen_cat.utils.localization import Localization
+from zen_cat.utils.bindings import TextBindings
+from zen_cat.utils.theme import Theme
+
+
+class MainScreen:
+    """
+    Компонент основного экрана с заголовком, подзаголовком и изображением кота.
+
+    Атрибуты:
+        localization (Localization): Объект локализации
+        theme (Theme): Скомпилированная тема
+        bindings (TextBindings): Реестр привязок текстов к каталогу
+    """
+
+    def __init__(self, localization: Localization, theme: Theme, bindings: TextBindings):
+        """
+        Инициализирует компонент основного экрана.
+
+        Args:
+            localization (Localization): Объект локализации
+            theme (Theme): Скомпилированная тема
+            bindings (TextBindings): Реестр привязок текстов к каталогу
+        """
+        self.localization = localization
+        self.theme = theme
+        self.bindings = bindings
+
+        # Элементы основного экрана
+        self.title = ft.Text()
+        self.subtitle = ft.Text()
+
+        # Создаем контейнер
+        self.container = self.build()
+
+    def build(self):
+        """
+        Создает основной экран с заголовком, подзаголовком и изображением кота.
+
+        Returns:
+            ft.Container: Контейнер с основным экраном
+        """
+        # Создаем заголовок
+        self.title = self.bindings.bind(ft.Text(
+            text_align=ft.TextAlign.CENTER,
+            **self.theme.display
+        ), "value", "main_title")
+
+        # Создаем подзаголовок
+        self.subtitle = self.bindings.bind(ft.Text(
+            text_align=ft.TextAlign.CENTER,
+            **self.theme.subtitle
+        ), "value", "main_subtitle")
+
+        # Временная замена изображения кота эмодзи (в будущем будет заменено на реальное изображение)
+        cat_image = ft.Text(
+            "😸",
+            size=120,
+            text_align=ft.TextAlign.CENTER
+        )
+
+        # Создаем контейнер для основного экрана
+        return ft.Container(
+            content=ft.Column(
+                [
+                    self.title,
+                    ft.Container(height=self.theme.spacing.md),  # Отступ
+                    self.subtitle,
+                    ft.Container(height=self.theme.spacing.lg),  # Отступ
+                    cat_image
+                ],
+                horizontal_alignment=ft.CrossAxisAlignment.CENTER,
+                spacing=self.theme.spacing.sm
+            ),
+            **self.theme.hero
+        )
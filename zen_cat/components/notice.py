@@ -0,0 +1,72 @@
+"""
+Модуль, содержащий компонент служебного сообщения для приложения Zen-кот.
+
+Сообщение показывается вместо основного интерфейса: когда достигнут предел
+одновременных сессий («сервис занят») и когда неактивная сессия вытеснена
+(«сессия истекла»). Компонент легкий: несколько текстов без привязок
+и обработчиков событий.
+"""
+
+import flet as ft
+from zen_cat.utils.localization import Localization
+from zen_cat.utils.theme import Theme
+
+
+class Notice:
+    """
+    Компонент служебного сообщения.
+
+    Атрибуты:
+        localization (Localization): Объект локализации
+        theme (Theme): Скомпилированная тема
+        kind (str): Вид сообщения (busy, expired); тексты берутся
+            по ключам <kind>_title и <kind>_text
+    """
+
+    def __init__(self, localization: Localization, theme: Theme, kind: str):
+        """
+        Инициализирует компонент служебного сообщения.
+
+        Args:
+            localization (Localization): Объект локализации
+            theme (Theme): Скомпилированная тема
+            kind (str): Вид сообщения (busy, expired)
+        """
+        self.localization = localization
+        self.theme = theme
+        self.kind = kind
+
+        # Создаем контейнер
+        self.container = self.build()
+
+    def build(self):
+        """
+        Строит компонент служебного сообщения.
+
+        Returns:
+            ft.Container: Контейнер с сообщением
+        """
+        return ft.Container(
+            content=ft.Column(
+                [
+                    ft.Text("😿", size=60, text_align=ft.TextAlign.CENTER),
+                    ft.Container(height=self.theme.spacing.md),  # Отступ
+                    ft.Text(
+                        self.localization.get(f"{self.kind}_title"),
+                        text_align=ft.TextAlign.CENTER,
+                        **self.theme.title
+                    ),
+                    ft.Container(height=self.theme.spacing.sm),  # Отступ
+                    ft.Text(
+                        self.localization.get(f"{self.kind}_text"),
+                        text_align=ft.TextAlign.CENTER,
+                        **self.theme.body
+                    )
+                ],
+                horizontal_alignment=ft.CrossAxisAlignment.CENTER,
+                spacing=0
+            ),
+            width=500,
+            alignment=ft.alignment.center,
+            **self.theme.notice
+        )
@@ -1,11 +1,39 @@
 """
 Модуль, содержащий компонент блока услуг для приложения Zen-кот.
 
-Блок услуг содержит 4 карточки с иконками и описанием предоставляемых услуг.
+Блок услуг содержит карточки с иконками и описанием предоставляемых услуг.
+Список услуг берется из каталога (zen_cat/utils/service_catalog.py).
+
+Небольшой каталог (не больше page_size услуг) показывается адаптивной сеткой
+по две карточки в строке. Большой каталог показывается сеткой ft.GridView
+с собственной прокруткой: сразу создаются только первые page_size карточек,
+а следующие добавляются через load_more(), когда посетитель прокручивает
+сетку к концу. Так каждая сессия держит и отправляет клиенту только те
+карточки, до которых посетитель дошел.
+
+Над сеткой большого каталога — строка поиска (если передана функция search):
+запрос выполняется после паузы в наборе (config.SEARCH_DEBOUNCE), и сетка
+показывает найденные услуги в порядке релевантности с той же догрузкой.
+Карточки, уже созданные в сессии, при повторном показе не создаются заново.
 """
 
+import threading
+
 import flet as ft
+from zen_cat import config
 from zen_cat.utils.localization import Localization
+from zen_cat.utils.bindings import TextBindings
+from zen_cat.utils.layout import compact
+from zen_cat.utils.service_catalog import SERVICE_CATALOG
+from zen_cat.utils.theme import Theme
+
+
+# Размер ячейки сетки большого каталога: карточка 350x180 и отступы вокруг нее
+_TILE_EXTENT = 376
+_TILE_ASPECT_RATIO = 376 / 196
+
+# Высота сетки большого каталога (три ряда карточек)
+_GRID_HEIGHT = 3 * 196
 
 
 class Services:
@@ -14,25 +42,53 @@ class Services:
     
     Атрибуты:
         localization (Localization): Объект локализации
-        theme (dict): Словарь с настройками темы
+        theme (Theme): Скомпилированная тема
+        bindings (TextBindings): Реестр привязок текстов к каталогу
+        items (tuple): Услуги каталога (ServiceItem) в порядке отображения
+        page_size (int): Сколько карточек создается сразу и при каждой догрузке
+            (0 — все карточки сразу)
+        search (callable): Функция search(query) -> найденные услуги или None
+            (пустой запрос); без нее строка поиска не показывается
+        results (tuple): Услуги, которые показывает сетка (все или найденные)
+        grid (ft.Control): Сетка карточек (ft.GridView для большого каталога)
     """
     
-    def __init__(self, localization: Localization, theme: dict):
+    def __init__(self, localization: Localization, theme: Theme, bindings: TextBindings, items=None, page_size=None,
+                 search=None):
         """
         Инициализирует компонент блока услуг.
         
         Args:
             localization (Localization): Объект локализации
-            theme (dict): Словарь с настройками темы
+            theme (Theme): Скомпилированная тема
+            bindings (TextBindings): Реестр привязок текстов к каталогу
+            items (tuple): Услуги (по умолчанию — текущий снимок SERVICE_CATALOG)
+            page_size (int): Размер страницы карточек (по умолчанию config.SERVICES_PAGE_SIZE)
+            search (callable): Поиск по услугам для строки поиска большого каталога
         """
         self.localization = localization
         self.theme = theme
+        self.bindings = bindings
+        self.items = SERVICE_CATALOG.snapshot().items if items is None else items
+        self.page_size = config.SERVICES_PAGE_SIZE if page_size is None else page_size
+        self.search = search
+        self.results = self.items
+        self.scheduler = None  # Будет установлено позже
+        self.on_activity = None  # Будет установлено позже
+        self._lock = threading.Lock()
         
         # Заголовок блока
         self.title = ft.Text()
         
-        # Карточки услуг
+        # Карточки услуг в сетке и все карточки, созданные в сессии (по id услуги)
         self.service_cards = []
+        self._cards = {}
+        self.grid = None
+        
+        # Строка поиска и сообщение «ничего не найдено» (только для большого каталога)
+        self.search_field = None
+        self.empty_message = None
+        self.container = None
         
         # Создаем контейнер
         self.container = self.build()
@@ -45,89 +101,176 @@ class Services:
             ft.Container: Контейнер с блоком услуг
         """
         # Заголовок блока
-        self.title = ft.Text(
-            value=self.localization.get("services_title"),
-            size=self.theme["font_sizes"]["lg"],
-            weight=ft.FontWeight.BOLD,
-            color=self.theme["colors"]["text"],
-            text_align=ft.TextAlign.CENTER
-        )
+        self.title = self.bindings.bind(ft.Text(
+            text_align=ft.TextAlign.CENTER,
+            **self.theme.title
+        ), "value", "services_title")
         
-        # Создаем карточки услуг
-        self.service_cards = [
-            self._create_service_card("service_1_title", "service_1_desc", "💻"),
-            self._create_service_card("service_2_title", "service_2_desc", "🎨"),
-            self._create_service_card("service_3_title", "service_3_desc", "📊"),
-            self._create_service_card("service_4_title", "service_4_desc", "🔧")
-        ]
+        # Создаем карточки услуг: все или только первую страницу большого каталога
+        count = self.page_size if self.virtual else len(self.items)
+        self.service_cards = [self._card(item) for item in self.items[:count]]
         
-        # Создаем адаптивное размещение карточек (2x2 на мобильных, 4x1 на десктопе)
-        services_grid = self._create_responsive_grid(self.service_cards)
+        # Небольшой каталог — адаптивная сетка, большой — сетка с прокруткой и догрузкой
+        controls = [self.title, ft.Container(height=self.theme.spacing.md)]  # Заголовок и отступ
+        if self.virtual:
+            self.grid = self._create_virtual_grid(self.service_cards)
+            if self.search is not None:
+                controls += self._create_search()
+        else:
+            self.grid = self._create_responsive_grid(self.service_cards)
+        controls.append(self.grid)
+        if self.empty_message is not None:
+            controls.append(self.empty_message)
         
         # Создаем контейнер с блоком услуг
         return ft.Container(
             content=ft.Column(
-                [
-                    self.title,
-                    ft.Container(height=self.theme["spacing"]["md"]),  # Отступ
-                    services_grid
-                ],
+                controls,
                 horizontal_alignment=ft.CrossAxisAlignment.CENTER,
                 spacing=0
             ),
-            margin=ft.margin.only(bottom=self.theme["spacing"]["xl"]),
-            padding=ft.padding.all(self.theme["spacing"]["md"])
+            **self.theme.section
         )
     
-    def _create_service_card(self, title_key, desc_key, icon):
+    @property
+    def virtual(self):
+        """
+        Показывается ли каталог сеткой с догрузкой карточек.
+        
+        Returns:
+            bool: True, если услуг больше, чем помещается на одну страницу
+        """
+        return 0 < self.page_size < len(self.items)
+    
+    @property
+    def has_more(self):
+        """
+        Остались ли услуги без карточек.
+        
+        Returns:
+            bool: True, если load_more() добавит карточки
+        """
+        return len(self.service_cards) < len(self.results)
+    
+    def load_more(self, count=None):
+        """
+        Создает карточки следующей страницы и добавляет их в сетку.
+        
+        Страницу клиенту отправляет вызывающий код (обновлением self.grid).
+        
+        Args:
+            count (int): Сколько карточек добавить (по умолчанию page_size)
+            
+        Returns:
+            list: Добавленные карточки (пустой список, если добавлять нечего)
+        """
+        with self._lock:
+            start = len(self.service_cards)
+            cards = [
+                self._card(item)
+                for item in self.results[start:start + (count or self.page_size or len(self.results))]
+            ]
+            self.service_cards.extend(cards)
+            self.grid.controls.extend(cards)
+        return cards
+    
+    def show(self, query):
+        """
+        Показывает в сетке услуги, найденные по запросу (первую страницу).
+        
+        Страницу клиенту отправляет вызывающий код (обновлением self.grid
+        и self.empty_message).
+        
+        Args:
+            query (str): Запрос (пустой — все услуги)
+            
+        Returns:
+            tuple: Показываемые услуги
+        """
+        results = self.search(query) if self.search is not None else None
+        with self._lock:
+            self.results = self.items if results is None else results
+            self.service_cards = [self._card(item) for item in self.results[:self.page_size or None]]
+            self.grid.controls = list(self.service_cards)
+            self.grid.visible = bool(self.results)
+            if self.empty_message is not None:
+                self.empty_message.visible = not self.results
+        return self.results
+    
+    def _apply_search(self):
+        """
+        Выполняет запрос из строки поиска и отправляет обновленную сетку.
+        """
+        self.show(self.search_field.value or "")
+        if self.scheduler:
+            self.scheduler.request(self.grid, self.empty_message)
+    
+    def _on_search_change(self, e):
+        """
+        Откладывает поиск до паузы в наборе запроса.
+        
+        Args:
+            e: Событие изменения строки поиска
+        """
+        if self.on_activity:
+            self.on_activity()
+        if self.scheduler:
+            self.scheduler.debounce("services_search", config.SEARCH_DEBOUNCE, self._apply_search)
+        else:
+            self._apply_search()
+    
+    def _card(self, item):
+        """
+        Возвращает карточку услуги, созданную в этой сессии, или создает новую.
+        
+        Args:
+            item (ServiceItem): Услуга из каталога
+            
+        Returns:
+            ft.Container: Карточка услуги
+        """
+        card = self._cards.get(item.id)
+        if card is None:
+            card = self._cards[item.id] = self._create_service_card(item)
+            if self.container is not None:
+                compact(card)  # Секция уже свернута — новые карточки сворачиваются сразу
+        return card
+    
+    def _create_service_card(self, item):
         """
         Создает карточку услуги.
         
         Args:
-            title_key (str): Ключ для заголовка услуги
-            desc_key (str): Ключ для описания услуги
-            icon (str): Эмодзи для иконки услуги
+            item (ServiceItem): Услуга из каталога
             
         Returns:
             ft.Container: Контейнер с карточкой услуги
         """
-        card_title = ft.Text(
-            value=self.localization.get(title_key),
-            size=self.theme["font_sizes"]["md"],
-            weight=ft.FontWeight.BOLD,
-            color=self.theme["colors"]["text"]
-        )
+        card_title = self.bindings.bind(ft.Text(**self.theme.card_title), "value", item.title_key)
         
-        card_description = ft.Text(
-            value=self.localization.get(desc_key),
-            size=self.theme["font_sizes"]["sm"],
-            color=self.theme["colors"]["text_light"]
-        )
+        card_description = self.bindings.bind(ft.Text(**self.theme.body), "value", item.desc_key)
         
         icon_text = ft.Text(
-            value=icon,
+            value=item.icon,
             size=32,
-            color=self.theme["colors"]["primary"]
+            color=self.theme.colors.primary
         )
         
         return ft.Container(
             content=ft.Column(
                 [
                     icon_text,
-                    ft.Container(height=self.theme["spacing"]["xs"]),  # Отступ
+                    ft.Container(height=self.theme.spacing.xs),  # Отступ
                     card_title,
-                    ft.Container(height=self.theme["spacing"]["xs"]),  # Отступ
+                    ft.Container(height=self.theme.spacing.xs),  # Отступ
                     card_description
                 ],
                 spacing=0,
                 horizontal_alignment=ft.CrossAxisAlignment.START
             ),
-            padding=self.theme["spacing"]["md"],
-            border_radius=8,
-            bgcolor=self.theme["colors"]["white"],
             width=350,  # Максимальная ширина карточки
             height=180,  # Высота карточки
-            margin=ft.margin.all(self.theme["spacing"]["xs"])
+            **self.theme.card
         )
     
     def _create_responsive_grid(self, cards):
@@ -140,42 +283,59 @@ class Services:
         Returns:
             ft.Column: Адаптивная сетка карточек
         """
-        # На мобильных устройствах - 2 колонки, на десктопе - 4 колонки
+        # По две карточки в строке; на мобильных строка переносится в одну колонку
         return ft.Column(
             [
                 ft.Row(
-                    [cards[0], cards[1]],
-                    alignment=ft.MainAxisAlignment.CENTER,
-                    wrap=True
-                ),
-                ft.Row(
-                    [cards[2], cards[3]],
+                    cards[index:index + 2],
                     alignment=ft.MainAxisAlignment.CENTER,
                     wrap=True
                 )
+                for index in range(0, len(cards), 2)
             ],
-            spacing=self.theme["spacing"]["sm"],
+            spacing=self.theme.spacing.sm,
             horizontal_alignment=ft.CrossAxisAlignment.CENTER
         )
     
-    def update_texts(self):
-        """
-        Обновляет тексты компонента в соответствии с текущим языком.
-        """
-        self.title.value = self.localization.get("services_title")
-        
-        # Обновляем тексты в карточках
-        service_keys = [
-            ("service_1_title", "service_1_desc"),
-            ("service_2_title", "service_2_desc"),
-            ("service_3_title", "service_3_desc"),
-            ("service_4_title", "service_4_desc")
-        ]
-        
-        for i, (title_key, desc_key) in enumerate(service_keys):
-            if i < len(self.service_cards):
-                card_content = self.service_cards[i].content
-                # Заголовок находится на позиции 2 (после иконки и отступа)
-                card_content.controls[2].value = self.localization.get(title_key)
-                # Описание находится на позиции 4 (после заголовка и отступа)
-                card_content.controls[4].value = self.localization.get(desc_key) 
\ No newline at end of file
+    def _create_search(self):
+        """
+        Создает строку поиска над сеткой и сообщение «ничего не найдено».
+        
+        Returns:
+            list: Строка поиска и отступ под ней
+        """
+        self.search_field = self.bindings.bind(ft.TextField(
+            prefix_icon=ft.Icons.SEARCH,
+            width=500,
+            on_change=self._on_search_change,
+            **self.theme.field
+        ), "hint_text", "services_search")
+        self.empty_message = self.bindings.bind(ft.Text(
+            text_align=ft.TextAlign.CENTER,
+            visible=False,
+            **self.theme.body
+        ), "value", "services_search_empty")
+        return [self.search_field, ft.Container(height=self.theme.spacing.sm)]  # Отступ
+    
+    def _create_virtual_grid(self, cards):
+        """
+        Создает сетку большого каталога с собственной прокруткой.
+        
+        Клиент отрисовывает только видимые ячейки ft.GridView, а сервер держит
+        только карточки, созданные к этому моменту (см. load_more).
+        
+        Args:
+            cards (list): Карточки первой страницы
+            
+        Returns:
+            ft.GridView: Сетка карточек
+        """
+        return ft.GridView(
+            cards,
+            max_extent=_TILE_EXTENT,
+            child_aspect_ratio=_TILE_ASPECT_RATIO,
+            spacing=0,
+            run_spacing=0,
+            height=_GRID_HEIGHT,
+            on_scroll_interval=100  # Не чаще одного события прокрутки в 100 мс
+        )
@@ -0,0 +1,129 @@
+"""
+Настройки приложения Zen-кот.
+
+Значения читаются из переменных окружения; при наличии файла .env
+в рабочем каталоге переменные сначала загружаются из него.
+"""
+
+import os
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+# Локализация: ограничение памяти под загруженные языки
+LOCALE_CACHE_BYTES = int(os.getenv("ZEN_CAT_LOCALE_CACHE_BYTES", 1024 * 1024))
+
+# Интерфейс: окно объединения обновлений страницы (0 — до следующего прохода цикла событий)
+UPDATE_WINDOW = float(os.getenv("ZEN_CAT_UPDATE_WINDOW_MS", "0")) / 1000
+
+# Хранилище заявок с формы обратной связи
+DB_PATH = os.getenv("ZEN_CAT_DB_PATH", "zen_cat.db")
+SUBMIT_QUEUE_SIZE = int(os.getenv("ZEN_CAT_SUBMIT_QUEUE_SIZE", "1000"))
+SUBMIT_BATCH_SIZE = int(os.getenv("ZEN_CAT_SUBMIT_BATCH_SIZE", "50"))
+SUBMIT_FLUSH_INTERVAL = float(os.getenv("ZEN_CAT_SUBMIT_FLUSH_MS", "200")) / 1000
+SUBMIT_MAX_ATTEMPTS = int(os.getenv("ZEN_CAT_SUBMIT_MAX_ATTEMPTS", "5"))
+SUBMIT_RETRY_BASE = float(os.getenv("ZEN_CAT_SUBMIT_RETRY_MS", "250")) / 1000
+SUBMIT_SPILL_PATH = os.getenv("ZEN_CAT_SUBMIT_SPILL_PATH", "submissions.spill.jsonl")
+
+# Доставка заявок из outbox: общие параметры повторных попыток
+OUTBOX_BATCH_SIZE = int(os.getenv("ZEN_CAT_OUTBOX_BATCH_SIZE", "20"))
+OUTBOX_POLL_INTERVAL = float(os.getenv("ZEN_CAT_OUTBOX_POLL_MS", "1000")) / 1000
+OUTBOX_MAX_ATTEMPTS = int(os.getenv("ZEN_CAT_OUTBOX_MAX_ATTEMPTS", "8"))
+OUTBOX_BACKOFF_BASE = float(os.getenv("ZEN_CAT_OUTBOX_BACKOFF_BASE_S", "2"))
+OUTBOX_BACKOFF_MAX = float(os.getenv("ZEN_CAT_OUTBOX_BACKOFF_MAX_S", "600"))
+
+# Доставка заявок по email (пустой ZEN_CAT_SMTP_HOST отключает канал)
+SMTP_HOST = os.getenv("ZEN_CAT_SMTP_HOST", "")
+SMTP_PORT = int(os.getenv("ZEN_CAT_SMTP_PORT", "25"))
+SMTP_USER = os.getenv("ZEN_CAT_SMTP_USER", "")
+SMTP_PASSWORD = os.getenv("ZEN_CAT_SMTP_PASSWORD", "")
+SMTP_STARTTLS = os.getenv("ZEN_CAT_SMTP_STARTTLS", "0") == "1"
+SMTP_TIMEOUT = float(os.getenv("ZEN_CAT_SMTP_TIMEOUT_S", "10"))
+SMTP_POOL_SIZE = int(os.getenv("ZEN_CAT_SMTP_POOL_SIZE", "2"))
+SMTP_FROM = os.getenv("ZEN_CAT_SMTP_FROM", "noreply@zen-cat.local")
+SMTP_TO = os.getenv("ZEN_CAT_SMTP_TO", "hello@zen-cat.local")
+
+# Доставка заявок во внешние системы (CRM) через webhook; адреса через запятую,
+# пустое значение отключает канал
+WEBHOOK_URLS = [url.strip() for url in os.getenv("ZEN_CAT_WEBHOOK_URLS", "").split(",") if url.strip()]
+WEBHOOK_TOKEN = os.getenv("ZEN_CAT_WEBHOOK_TOKEN", "")
+WEBHOOK_BATCH = int(os.getenv("ZEN_CAT_WEBHOOK_BATCH", "1"))
+WEBHOOK_TIMEOUT = float(os.getenv("ZEN_CAT_WEBHOOK_TIMEOUT_S", "5"))
+WEBHOOK_POOL_SIZE = int(os.getenv("ZEN_CAT_WEBHOOK_POOL_SIZE", "4"))
+WEBHOOK_MAX_BACKLOG = int(os.getenv("ZEN_CAT_WEBHOOK_MAX_BACKLOG", "5000"))
+BREAKER_FAILURES = int(os.getenv("ZEN_CAT_BREAKER_FAILURES", "5"))
+BREAKER_RESET = float(os.getenv("ZEN_CAT_BREAKER_RESET_S", "30"))
+
+# Защита формы: ограничение частоты заявок и подавление повторов
+RATE_SESSION_PER_MIN = float(os.getenv("ZEN_CAT_RATE_SESSION_PER_MIN", "3"))
+RATE_SESSION_BURST = int(os.getenv("ZEN_CAT_RATE_SESSION_BURST", "3"))
+RATE_IP_PER_MIN = float(os.getenv("ZEN_CAT_RATE_IP_PER_MIN", "20"))
+RATE_IP_BURST = int(os.getenv("ZEN_CAT_RATE_IP_BURST", "10"))
+RATE_MAX_KEYS = int(os.getenv("ZEN_CAT_RATE_MAX_KEYS", "100000"))
+DEDUP_TTL = float(os.getenv("ZEN_CAT_DEDUP_TTL_S", "600"))
+DEDUP_MAX_SIZE = int(os.getenv("ZEN_CAT_DEDUP_MAX_SIZE", "10000"))
+
+# Оценка заявок на спам (без файла модели оценка отключена)
+SPAM_MODEL_PATH = os.getenv("ZEN_CAT_SPAM_MODEL_PATH", "spam_model.npz")
+SPAM_THRESHOLD = float(os.getenv("ZEN_CAT_SPAM_THRESHOLD", "0.9"))
+SPAM_FEATURES = 2 ** int(os.getenv("ZEN_CAT_SPAM_FEATURES_BITS", "18"))
+
+# Проверка полей формы при вводе
+VALIDATION_DEBOUNCE = float(os.getenv("ZEN_CAT_VALIDATION_DEBOUNCE_MS", "300")) / 1000
+VALIDATION_CACHE_SIZE = int(os.getenv("ZEN_CAT_VALIDATION_CACHE_SIZE", "4096"))
+
+# Учет памяти по сессиям и поиск утечек (включается только для диагностики)
+MEMORY_TRACKING = os.getenv("ZEN_CAT_MEMORY_TRACKING", "0") == "1"
+MEMORY_LEAK_GRACE = float(os.getenv("ZEN_CAT_MEMORY_LEAK_GRACE_S", "30"))
+
+# Реестр сессий: предел одновременных сессий (0 — без предела; сверх предела
+# показывается легкая страница «сервис занят») и вытеснение неактивных сессий
+SESSION_MAX = int(os.getenv("ZEN_CAT_SESSION_MAX", "500"))
+SESSION_IDLE_TIMEOUT = float(os.getenv("ZEN_CAT_SESSION_IDLE_TIMEOUT_S", "1800"))
+SESSION_DISCONNECT_TIMEOUT = float(os.getenv("ZEN_CAT_SESSION_DISCONNECT_TIMEOUT_S", "300"))
+SESSION_SWEEP_INTERVAL = float(os.getenv("ZEN_CAT_SESSION_SWEEP_INTERVAL_S", "30"))
+
+# Метрики в формате Prometheus на локальном порту (0 — сервер метрик отключен)
+METRICS_HOST = os.getenv("ZEN_CAT_METRICS_HOST", "127.0.0.1")
+METRICS_PORT = int(os.getenv("ZEN_CAT_METRICS_PORT", "9108"))
+
+# Трассировка обработчиков: доля трасс в выборке (0..1), порог медленных
+# обработчиков, которые записываются всегда (0 — отключено), и файл трасс
+TRACE_SAMPLE_RATE = float(os.getenv("ZEN_CAT_TRACE_SAMPLE_RATE", "0"))
+TRACE_SLOW_MS = float(os.getenv("ZEN_CAT_TRACE_SLOW_MS", "500"))
+TRACE_PATH = os.getenv("ZEN_CAT_TRACE_PATH", "traces.jsonl")
+TRACE_QUEUE_SIZE = int(os.getenv("ZEN_CAT_TRACE_QUEUE_SIZE", "1000"))
+
+# Колесо таймеров для отложенных действий интерфейса: длительность тика
+# и число ячеек на уровне (степень двойки)
+TIMER_TICK_MS = float(os.getenv("ZEN_CAT_TIMER_TICK_MS", "100"))
+TIMER_SLOTS = int(os.getenv("ZEN_CAT_TIMER_SLOTS", "64"))
+
+# Статический экспорт страницы: каталог для файлов и адрес приложения,
+# из которого статическая страница загружает форму обратной связи
+EXPORT_DIR = os.getenv("ZEN_CAT_EXPORT_DIR", "dist")
+EXPORT_APP_URL = os.getenv("ZEN_CAT_EXPORT_APP_URL", "/app/")
+
+# Отложенное построение секций ниже первого экрана: секции строятся при прокрутке
+# к ним или в паузе ZEN_CAT_LAZY_IDLE_MS после первой отрисовки
+LAZY_SECTIONS = os.getenv("ZEN_CAT_LAZY_SECTIONS", "0") == "1"
+LAZY_IDLE = float(os.getenv("ZEN_CAT_LAZY_IDLE_MS", "1000")) / 1000
+
+# Тема оформления: файл JSON с цветами, отступами и размерами шрифта
+# (пустое значение — тема по умолчанию); проверяется один раз при запуске
+THEME_FILE = os.getenv("ZEN_CAT_THEME_FILE", "")
+
+# Каталог услуг: файл JSON или база SQLite (таблица services); пустое значение —
+# каталог из пакета. Изменения проверяются не чаще раза в ZEN_CAT_SERVICES_RELOAD_S;
+# сессия получает сразу не больше ZEN_CAT_SERVICES_PAGE_SIZE карточек, остальные
+# добавляются при прокрутке сетки
+SERVICES_PATH = os.getenv("ZEN_CAT_SERVICES_PATH", "")
+SERVICES_RELOAD = float(os.getenv("ZEN_CAT_SERVICES_RELOAD_S", "2"))
+SERVICES_PAGE_SIZE = int(os.getenv("ZEN_CAT_SERVICES_PAGE_SIZE", "8"))
+
+# Поиск по услугам: языки, тексты которых попадают в индекс, и пауза в наборе,
+# после которой выполняется запрос
+SEARCH_LANGUAGES = [lang.strip() for lang in os.getenv("ZEN_CAT_SEARCH_LANGS", "ru,en").split(",") if lang.strip()]
+SEARCH_DEBOUNCE = float(os.getenv("ZEN_CAT_SEARCH_DEBOUNCE_MS", "250")) / 1000
@@ -0,0 +1,325 @@
+"""
+Статический экспорт страницы Zen-кот.
+
+Большинство посетителей только читают страницу, а каждому из них сервер Flet
+держит websocket и полноценную сессию ZenCatApp. Экспорт строит секции теми же
+компонентами (Header, MainScreen, Services, About, Footer) с той же темой THEME
+и каталогом текстов и сохраняет их как статические HTML-страницы — по одной
+на язык — и общий файл стилей, который отдает любой статический веб-сервер.
+
+Единственная интерактивная часть — форма обратной связи: на статической странице
+вместо нее кнопка, по нажатию на которую форма загружается из приложения
+(адрес config.EXPORT_APP_URL с параметрами view=contact и lang) во встроенный
+фрейм. Без JavaScript кнопка ведет на полное приложение на том же языке.
+
+Структура результата:
+    index.html              страница на языке по умолчанию
+    <язык>/index.html       страницы на каждом языке каталога
+    styles.<хэш>.css        общие стили (имя меняется вместе с содержимым,
+                            поэтому файл можно кэшировать без ограничения срока)
+
+Запуск:
+    python -m zen_cat.export [--out dist] [--app-url /app/]
+"""
+
+import argparse
+import hashlib
+import html
+import os
+import urllib.parse
+
+import flet as ft
+from zen_cat import config
+from zen_cat.utils.localization import Localization
+from zen_cat.utils.bindings import TextBindings
+from zen_cat.utils.layout import compact
+from zen_cat.utils.static_html import HtmlRenderer, StyleSheet
+from zen_cat.main import THEME, ZenCatApp
+from zen_cat.components.header import Header
+from zen_cat.components.main_screen import MainScreen
+from zen_cat.components.services import Services
+from zen_cat.components.about import About
+from zen_cat.components.contact_form import ContactForm
+from zen_cat.components.footer import Footer
+
+
+# Стили страницы, соответствующие настройкам страницы в ZenCatApp
+BASE_CSS = (
+    "*{box-sizing:border-box}\n"
+    f"body{{margin:0;display:flex;justify-content:center;background:{THEME.colors.background};"
+    f"color:{THEME.colors.text};font-family:Roboto,'Segoe UI',Helvetica,Arial,sans-serif;"
+    "font-size:14px;line-height:1.4}\n"
+    "a{color:inherit}\n"
+)
+
+# Загрузка формы обратной связи во встроенный фрейм по нажатию кнопки
+SCRIPT = (
+    "document.querySelectorAll('[data-frame]').forEach(function(link){"
+    "link.addEventListener('click',function(event){"
+    "event.preventDefault();"
+    "var frame=document.createElement('iframe');"
+    "frame.src=link.dataset.frame;frame.title=link.textContent;frame.className=link.dataset.frameClass;"
+    "link.replaceWith(frame);});});"
+)
+
+
+class StaticExporter:
+    """
+    Экспорт страницы в статические HTML-файлы для всех языков каталога.
+
+    Атрибуты:
+        app_url (str): Адрес приложения, из которого загружается форма обратной связи
+        languages (tuple): Экспортируемые языки
+        default_lang (str): Язык страницы index.html в корне
+        sheet (StyleSheet): Общая таблица стилей всех страниц
+    """
+
+    def __init__(self, app_url=None, languages=None, default_lang=None):
+        """
+        Инициализирует экспорт.
+
+        Args:
+            app_url (str): Адрес приложения (по умолчанию config.EXPORT_APP_URL)
+            languages (list): Языки (по умолчанию все языки каталога)
+            default_lang (str): Язык страницы в корне (по умолчанию язык Localization)
+        """
+        self.app_url = app_url or config.EXPORT_APP_URL
+        self.languages = tuple(languages or Localization().languages())
+        self.default_lang = default_lang or Localization().lang
+        self.sheet = StyleSheet()
+
+    def _app_link(self, lang, **params):
+        """
+        Формирует адрес приложения с параметрами.
+
+        Args:
+            lang (str): Язык
+            **params: Дополнительные параметры запроса
+
+        Returns:
+            str: Адрес
+        """
+        return f"{self.app_url}?{urllib.parse.urlencode({**params, 'lang': lang})}"
+
+    def _language_menu(self, localization, prefix):
+        """
+        Формирует меню языков: вместо всплывающего меню шапки — ссылки на страницы языков.
+
+        Args:
+            localization (Localization): Локализация страницы
+            prefix (str): Путь от страницы к корню экспорта
+
+        Returns:
+            str: Разметка меню
+        """
+        # Размеры ссылок как у кнопки меню языка в шапке; текущий язык выделен
+        declarations = [
+            ("padding", "8px 12px"),
+            ("border-radius", "8px"),
+            ("font-size", "16px"),
+            ("color", THEME.colors.text),
+            ("text-decoration", "none"),
+        ]
+        link = self.sheet.class_for(declarations)
+        current = self.sheet.class_for(
+            declarations + [("background", THEME.colors.white), ("font-weight", "700")]
+        )
+        nav = self.sheet.class_for([
+            ("display", "flex"),
+            ("flex-wrap", "wrap"),
+            ("justify-content", "flex-end"),
+            ("gap", "4px"),
+        ])
+        items = "".join(
+            f'<a class="{current}" href="{prefix}{lang}/" hreflang="{lang}" aria-current="page">{lang.upper()}</a>'
+            if lang == localization.lang else
+            f'<a class="{link}" href="{prefix}{lang}/" hreflang="{lang}">{lang.upper()}</a>'
+            for lang in self.languages
+        )
+        label = html.escape(localization.get("language_tooltip"), quote=True)
+        return f'<nav class="{nav}" aria-label="{label}">{items}</nav>'
+
+    def _contact_section(self, localization, bindings, replace):
+        """
+        Строит секцию формы обратной связи для статической страницы.
+
+        Заголовок, кот и отступы берутся из ContactForm, а вместо полей формы —
+        кнопка, загружающая форму из приложения.
+
+        Args:
+            localization (Localization): Локализация страницы
+            bindings (TextBindings): Привязки текстов страницы
+            replace (dict): Готовая разметка вместо элементов (дополняется кнопкой)
+
+        Returns:
+            tuple: Контейнер секции и заголовок формы
+        """
+        form = ContactForm(localization, THEME, bindings)
+        placeholder = ft.Container()
+        button = self.sheet.class_for([
+            ("display", "inline-flex"),
+            ("align-items", "center"),
+            ("height", "48px"),
+            ("padding", "0 24px"),
+            ("border-radius", "8px"),
+            ("background", THEME.colors.primary),
+            ("color", THEME.colors.white),
+            ("font-size", f"{THEME.font_sizes.sm}px"),
+            ("font-weight", "500"),
+            ("text-decoration", "none"),
+        ])
+        frame = self.sheet.class_for([
+            ("width", "100%"),
+            ("max-width", "548px"),
+            ("height", "720px"),
+            ("border", "0"),
+        ])
+        lang = localization.lang
+        replace[id(placeholder)] = (
+            f'<a class="{button}" href="{html.escape(self._app_link(lang), quote=True)}" '
+            f'data-frame="{html.escape(self._app_link(lang, view="contact"), quote=True)}" '
+            f'data-frame-class="{frame}">{html.escape(localization.get("contact_open"))}</a>'
+        )
+        section = ft.Container(
+            content=ft.Column(
+                [
+                    form.title,
+                    ft.Container(height=THEME.spacing.md),  # Отступ
+                    form.cat_container,
+                    placeholder
+                ],
+                horizontal_alignment=ft.CrossAxisAlignment.CENTER,
+                spacing=0
+            ),
+            margin=form.container.margin,
+            padding=form.container.padding,
+            alignment=form.container.alignment
+        )
+        return section, form.title
+
+    def render_body(self, lang, prefix):
+        """
+        Отрисовывает содержимое страницы на заданном языке.
+
+        Args:
+            lang (str): Язык
+            prefix (str): Путь от страницы к корню экспорта ("" или "../")
+
+        Returns:
+            str: Разметка основного контейнера страницы
+        """
+        localization = Localization(lang)
+        bindings = TextBindings(localization)
+        header = Header(localization, THEME, bindings)
+        main_screen = MainScreen(localization, THEME, bindings)
+        services = Services(localization, THEME, bindings, page_size=0)  # Все карточки каталога
+        about = About(localization, THEME, bindings)
+        footer = Footer(localization, THEME, bindings)
+        replace = {id(header.language_button): self._language_menu(localization, prefix)}
+        contact, contact_title = self._contact_section(localization, bindings, replace)
+
+        tags = {
+            id(main_screen.title): "h1",
+            id(services.title): "h2",
+            id(about.title): "h2",
+            id(contact_title): "h2",
+        }
+        content = compact(ZenCatApp.layout([
+            header.container,
+            main_screen.container,
+            services.container,
+            about.container,
+            ft.Container(content=contact),
+            footer.container
+        ]))
+        return HtmlRenderer(self.sheet, tags=tags, replace=replace).render(content)
+
+    def _document(self, lang, prefix, body, stylesheet):
+        """
+        Формирует HTML-документ страницы.
+
+        Args:
+            lang (str): Язык
+            prefix (str): Путь от страницы к корню экспорта
+            body (str): Разметка содержимого
+            stylesheet (str): Имя файла стилей
+
+        Returns:
+            str: Документ
+        """
+        localization = Localization(lang)
+        alternates = "".join(
+            f'<link rel="alternate" hreflang="{code}" href="{prefix}{code}/">\n'
+            for code in self.languages
+        )
+        return (
+            "<!DOCTYPE html>\n"
+            f'<html lang="{lang}">\n'
+            "<head>\n"
+            '<meta charset="utf-8">\n'
+            '<meta name="viewport" content="width=device-width, initial-scale=1">\n'
+            "<title>Zen-кот</title>\n"
+            f'<meta name="description" content="{html.escape(localization.get("main_subtitle"), quote=True)}">\n'
+            f"{alternates}"
+            f'<link rel="stylesheet" href="{prefix}{stylesheet}">\n'
+            "</head>\n"
+            "<body>\n"
+            f"{body}\n"
+            f"<script>{SCRIPT}</script>\n"
+            "</body>\n"
+            "</html>\n"
+        )
+
+    def build(self):
+        """
+        Строит все файлы экспорта.
+
+        Returns:
+            dict: Содержимое файлов {относительный путь: текст}
+        """
+        bodies = {lang: self.render_body(lang, "../") for lang in self.languages}
+        root_body = self.render_body(self.default_lang, "")
+
+        css = BASE_CSS + self.sheet.render()
+        stylesheet = f"styles.{hashlib.sha256(css.encode('utf-8')).hexdigest()[:10]}.css"
+        files = {stylesheet: css, "index.html": self._document(self.default_lang, "", root_body, stylesheet)}
+        for lang, body in bodies.items():
+            files[f"{lang}/index.html"] = self._document(lang, "../", body, stylesheet)
+        return files
+
+    def export(self, out_dir=None):
+        """
+        Записывает файлы экспорта в каталог.
+
+        Args:
+            out_dir (str): Каталог (по умолчанию config.EXPORT_DIR)
+
+        Returns:
+            dict: Размеры записанных файлов {путь: байт}
+        """
+        out_dir = out_dir or config.EXPORT_DIR
+        written = {}
+        for name, text in self.build().items():
+            path = os.path.join(out_dir, *name.split("/"))
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            data = text.encode("utf-8")
+            with open(path, "wb") as f:
+                f.write(data)
+            written[path] = len(data)
+        return written
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Статический экспорт страницы Zen-кот")
+    parser.add_argument("--out", default=config.EXPORT_DIR, help="Каталог для файлов")
+    parser.add_argument("--app-url", default=config.EXPORT_APP_URL,
+                        help="Адрес приложения, из которого загружается форма обратной связи")
+    args = parser.parse_args()
+
+    written = StaticExporter(app_url=args.app_url).export(args.out)
+    for path, size in written.items():
+        print(f"{path:<32} {size / 1024:>7.1f} КБ")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,39 +4,54 @@
 Инициализирует Flet-приложение, настраивает тему и управляет основным пользовательским интерфейсом.
 """
 
+import functools
+import threading
+import time
+import urllib.parse
+
 import flet as ft
+from flet.core.page import PageDisconnectedException
+from zen_cat import config
 from zen_cat.utils.localization import Localization
+from zen_cat.utils.bindings import TextBindings
+from zen_cat.utils.layout import compact
+from zen_cat.utils.memory import MEMORY
+from zen_cat.utils.metrics import METRICS
+from zen_cat.utils.scheduler import UpdateScheduler
+from zen_cat.utils.search import SEARCH
+from zen_cat.utils.service_catalog import SERVICE_CATALOG
+from zen_cat.utils.sessions import SESSIONS
+from zen_cat.utils.templates import TEMPLATES
+from zen_cat.utils.theme import load_theme
+from zen_cat.utils.timers import TIMERS
+from zen_cat.utils.tracing import traced
+from zen_cat.pipeline.guard import GUARD, ACCEPTED, DUPLICATE
+from zen_cat.pipeline.submissions import Submission
+from zen_cat.pipeline.service import get_pipeline
 from zen_cat.components.header import Header
+from zen_cat.components.main_screen import MainScreen
 from zen_cat.components.services import Services
 from zen_cat.components.about import About
 from zen_cat.components.contact_form import ContactForm
 from zen_cat.components.footer import Footer
+from zen_cat.components.notice import Notice
+
+
+# Тема приложения: компилируется и проверяется один раз при запуске
+THEME = load_theme(config.THEME_FILE)
 
 
-# Тема приложения с цветами и отступами
-THEME = {
-    "colors": {
-        "primary": "#2dd4bf",      # Бирюзовый акцент
-        "background": "#f8f5f0",   # Светлый беж
-        "text": "#333333",         # Тёмно-серый
-        "text_light": "#666666",   # Серый
-        "white": "#ffffff"         # Белый
-    },
-    "spacing": {
-        "xs": 8,    # Очень маленький отступ
-        "sm": 16,   # Маленький отступ
-        "md": 24,   # Средний отступ
-        "lg": 32,   # Большой отступ
-        "xl": 48    # Очень большой отступ
-    },
-    "font_sizes": {
-        "xs": 14,   # Очень маленький текст
-        "sm": 16,   # Маленький текст
-        "md": 18,   # Средний текст
-        "lg": 24,   # Большой текст (заголовки)
-        "xl": 32    # Очень большой текст (главный заголовок)
-    }
-}
+# Метрики обработчиков (счетчики по потокам, без блокировок при записи)
+SESSION_BUILD_SECONDS = METRICS.histogram(
+    "zen_cat_session_build_seconds", "Построение интерфейса новой сессии, секунды"
+)
+LANGUAGE_TOGGLES = METRICS.counter("zen_cat_language_toggles_total", "Смены языка")
+LANGUAGE_TOGGLE_SECONDS = METRICS.histogram(
+    "zen_cat_language_toggle_seconds", "Смена языка от обработчика до отправки обновления, секунды"
+)
+SUBMISSIONS = METRICS.counter(
+    "zen_cat_submissions_total", "Заявки с формы по результату проверки", ("result",)
+)
 
 
 class ZenCatApp:
@@ -47,145 +62,401 @@ class ZenCatApp:
     и отвечает за построение основного пользовательского интерфейса.
     """
     
-    def __init__(self, page: ft.Page):
+    def __init__(self, page: ft.Page, templates=TEMPLATES, submissions=None, guard=GUARD, sessions=None,
+                 lang=None, contact_only=False, lazy=None):
         """
         Инициализирует экземпляр приложения.
         
         Args:
             page (ft.Page): Объект страницы Flet
+            templates (TemplateCache): Кэш шаблонов статических секций
+                (None — строить секции заново для каждой сессии)
+            submissions (SubmissionPipeline): Очередь заявок
+                (по умолчанию общая очередь процесса, создается при первой заявке)
+            guard (SubmissionGuard): Проверка заявок на повторы и частоту
+                (None — без проверки)
+            sessions (SessionRegistry): Реестр сессий, вытесняющий неактивные сессии
+                (None — сессия не регистрируется)
+            lang (str): Начальный язык (неизвестный код игнорируется)
+            contact_only (bool): Показывать только форму обратной связи (форма,
+                встроенная в статическую страницу; см. zen_cat/export.py)
+            lazy (bool): Строить секции ниже первого экрана после первой отрисовки
+                (None — по config.LAZY_SECTIONS)
         """
         self.page = page
+        self.templates = templates
+        self.submissions = submissions
+        self.guard = guard
+        self.sessions = sessions
+        self.contact_only = contact_only
+        MEMORY.track(self)  # Учет памяти сессии (только в режиме ZEN_CAT_MEMORY_TRACKING)
         self.localization = Localization()  # Создаем объект локализации
+        if lang:
+            self.localization.set_lang(lang)
+        self.bindings = TextBindings(self.localization)  # Реестр привязок текстов
+        self.scheduler = UpdateScheduler(page, config.UPDATE_WINDOW)  # Планировщик обновлений
         
         # Настройка страницы
         self.page.title = "Zen-кот"
-        self.page.bgcolor = THEME["colors"]["background"]
+        self.page.bgcolor = THEME.colors.background
         self.page.padding = 0
         self.page.horizontal_alignment = ft.CrossAxisAlignment.CENTER
         self.page.scroll = ft.ScrollMode.AUTO
+        self.page.on_connect = self._on_connect
+        self.page.on_disconnect = self._on_disconnect
+        self.page.on_close = self._on_close
         
-        # Создание компонентов
-        self.header = Header(self.localization, self.toggle_language)
-        self.services = Services(self.localization, THEME)
-        self.about = About(self.localization, THEME)
-        self.contact_form = ContactForm(self.localization, THEME)
-        self.contact_form.page = self.page  # Устанавливаем page для формы
-        self.footer = Footer(self.localization, THEME)
-        
-        # Элементы основного экрана
-        self.main_title = ft.Text()
-        self.main_subtitle = ft.Text()
-        
-        # Создание контейнеров для компонентов
-        self.header_container = ft.Container(content=self.header.container)
-        self.main_container = self._create_main_screen()
-        self.services_container = ft.Container(content=self.services.container)
-        self.about_container = ft.Container(content=self.about.container)
-        self.contact_container = ft.Container(content=self.contact_form.container)
-        self.footer_container = ft.Container(content=self.footer.container)
+        # Создание компонентов первого экрана, состояние которых у каждой сессии свое
+        self.header = self.header_container = self.main_container = None
+        self.contact_form = None  # Создается вместе с секцией формы
+        self.services = None  # Создается только для большого каталога услуг (см. _create_services)
+        if not contact_only:
+            with MEMORY.measure(self, "Header"):
+                self.header = Header(self.localization, THEME, self.bindings, self.toggle_language)
+                self.header_container = ft.Container(content=compact(self.header.container))
+            self.main_container = self._create_section(MainScreen)
+        
+        # Контейнеры остальных секций (статические секции берутся из шаблонов)
+        self.services_container = ft.Container()
+        self.about_container = ft.Container()
+        self.contact_container = ft.Container()
+        self.footer_container = ft.Container()
+        if contact_only:
+            sections = [(self.contact_container, self._create_contact_form)]
+        else:
+            sections = [
+                (self.services_container, self._create_services),
+                (self.about_container, lambda: self._create_section(About)),
+                (self.contact_container, self._create_contact_form),
+                (self.footer_container, lambda: self._create_section(Footer))
+            ]
+        
+        # В отложенном режиме секции ниже первого экрана остаются пустыми контейнерами
+        # и строятся при прокрутке к ним или в паузе после первой отрисовки
+        self.lazy = (config.LAZY_SECTIONS if lazy is None else lazy) and not contact_only
+        self._deferred = sections if self.lazy else []
+        self._deferred_lock = threading.Lock()
+        if self.lazy:
+            self.page.on_scroll_interval = 100  # Не чаще одного события прокрутки в 100 мс
+            self.page.on_scroll = self._on_scroll
+        else:
+            for container, factory in sections:
+                container.content = factory()
         
         # Добавляем основной контейнер на страницу
-        self.build()
+        with MEMORY.measure(self, "page"):
+            self.build()
+        MEMORY.attach(self)
+        if self.sessions is not None:
+            self.sessions.register(self)
+        if self._deferred:
+            TIMERS.schedule(config.LAZY_IDLE, self._build_idle, loop=self.page.loop, owner=str(self.page.session_id))
     
-    def _create_main_screen(self):
+    def _create_section(self, component, version=None, **kwargs):
         """
-        Создает основной экран с заголовком, подзаголовком и изображением кота.
+        Создает статическую секцию страницы.
+        
+        Секция копируется из шаблона для текущего языка, а если кэш шаблонов
+        отключен — строится компонентом заново. Распорки-отступы секции
+        сворачиваются в spacing и отступы соседей (zen_cat/utils/layout.py).
         
+        Args:
+            component (type): Класс компонента (MainScreen, Services, About, Footer)
+            version: Версия данных секции (шаблон другой версии строится заново)
+            **kwargs: Дополнительные аргументы компонента
+            
         Returns:
-            ft.Container: Контейнер с основным экраном
-        """
-        # Создаем заголовок
-        self.main_title = ft.Text(
-            value=self.localization.get("main_title"),
-            size=THEME["font_sizes"]["xl"],
-            weight=ft.FontWeight.BOLD,
-            color=THEME["colors"]["text"],
-            text_align=ft.TextAlign.CENTER
-        )
+            ft.Container: Контейнер секции
+        """
+        def factory(localization, bindings):
+            return compact(component(localization, THEME, bindings, **kwargs).container)
         
-        # Создаем подзаголовок
-        self.main_subtitle = ft.Text(
-            value=self.localization.get("main_subtitle"),
-            size=THEME["font_sizes"]["md"],
-            color=THEME["colors"]["text_light"],
-            text_align=ft.TextAlign.CENTER
-        )
+        with MEMORY.measure(self, component.__name__):
+            if self.templates is None:
+                return factory(self.localization, self.bindings)
+            return self.templates.instantiate(
+                component.__name__, self.localization, self.bindings, factory, version
+            )
+    
+    def _create_services(self):
+        """
+        Создает секцию услуг из текущего снимка каталога услуг.
         
-        # Временная замена изображения кота эмодзи (в будущем будет заменено на реальное изображение)
-        cat_image = ft.Text(
-            "😸",
-            size=120,
-            text_align=ft.TextAlign.CENTER
-        )
+        Небольшой каталог — статическая секция из шаблона (шаблон перестраивается,
+        когда меняется версия каталога). Большой каталог строится для сессии
+        отдельно: карточки догружаются при прокрутке сетки, а над сеткой — строка
+        поиска по общему индексу SEARCH; у каждой сессии своя прокрутка и свой запрос.
+        
+        Returns:
+            ft.Container: Контейнер секции
+        """
+        snapshot = SERVICE_CATALOG.snapshot()
+        if not 0 < config.SERVICES_PAGE_SIZE < len(snapshot):
+            return self._create_section(Services, snapshot.version, items=snapshot.items)
+        with MEMORY.measure(self, "Services"):
+            self.services = Services(
+                self.localization, THEME, self.bindings,
+                items=snapshot.items, search=functools.partial(SEARCH.search, snapshot)
+            )
+            self.services.scheduler = self.scheduler  # Планировщик обновлений для результатов поиска
+            self.services.on_activity = self._touch  # Поиск — активность посетителя
+            self.services.grid.on_scroll = self._on_services_scroll
+            return compact(self.services.container)
+    
+    def _create_contact_form(self):
+        """
+        Создает форму обратной связи сессии.
+        
+        Returns:
+            ft.Container: Контейнер формы
+        """
+        with MEMORY.measure(self, "ContactForm"):
+            self.contact_form = ContactForm(self.localization, THEME, self.bindings, self.submit_contact)
+            self.contact_form.page = self.page  # Устанавливаем page для формы
+            self.contact_form.scheduler = self.scheduler  # и планировщик обновлений
+            self.contact_form.on_activity = self._touch  # Ввод в форму — активность посетителя
+            return compact(self.contact_form.container)
+    
+    def build_deferred(self, count=None):
+        """
+        Строит отложенные секции (по порядку сверху вниз) и отправляет их клиенту.
         
-        # Создаем контейнер для основного экрана
+        Секции вставляются в уже отправленные пустые контейнеры одним обновлением
+        страницы; тексты, если язык сменился во время построения, выравниваются
+        реестром привязок.
+        
+        Args:
+            count (int): Сколько секций построить (None — все оставшиеся)
+            
+        Returns:
+            int: Количество построенных секций
+        """
+        with self._deferred_lock:
+            if count is None:
+                count = len(self._deferred)
+            sections, self._deferred = self._deferred[:count], self._deferred[count:]
+        for container, factory in sections:
+            container.content = factory()
+        if sections:
+            self.scheduler.request(*(container for container, _ in sections), prepare=self.bindings.apply)
+        return len(sections)
+    
+    def _on_scroll(self, e):
+        """
+        Строит следующую отложенную секцию, когда до конца построенной части
+        страницы остается меньше одного экрана.
+        
+        Args:
+            e (ft.OnScrollEvent): Событие прокрутки страницы
+        """
+        if not self._deferred or e.max_scroll_extent is None:
+            return
+        if e.max_scroll_extent - e.pixels <= e.viewport_dimension:
+            self.build_deferred(1)
+    
+    def _on_services_scroll(self, e):
+        """
+        Догружает карточки услуг, когда до конца сетки остается меньше одного
+        ее экрана.
+        
+        Args:
+            e (ft.OnScrollEvent): Событие прокрутки сетки услуг
+        """
+        if not self.services.has_more or e.max_scroll_extent is None:
+            return
+        if e.max_scroll_extent - e.pixels <= e.viewport_dimension:
+            self.services.load_more()
+            self.scheduler.request(self.services.grid)
+    
+    def _build_idle(self):
+        """
+        Строит следующую отложенную секцию в паузе после первой отрисовки;
+        следующая секция строится на следующем тике колеса таймеров.
+        """
+        if self.build_deferred(1) and self._deferred:
+            TIMERS.schedule(0, self._build_idle, loop=self.page.loop, owner=str(self.page.session_id))
+    
+    @staticmethod
+    def layout(sections):
+        """
+        Собирает секции в основной контейнер страницы.
+        
+        Используется и для страницы сессии, и для статического экспорта.
+        
+        Args:
+            sections (list): Контейнеры секций сверху вниз
+            
+        Returns:
+            ft.Container: Основной контейнер с максимальной шириной для контента
+        """
         return ft.Container(
-            content=ft.Column(
-                [
-                    self.main_title,
-                    ft.Container(height=THEME["spacing"]["md"]),  # Отступ
-                    self.main_subtitle,
-                    ft.Container(height=THEME["spacing"]["lg"]),  # Отступ
-                    cat_image
-                ],
-                horizontal_alignment=ft.CrossAxisAlignment.CENTER,
-                spacing=THEME["spacing"]["sm"]
-            ),
-            margin=ft.margin.only(top=THEME["spacing"]["xl"], bottom=THEME["spacing"]["xl"]),
-            padding=ft.padding.all(THEME["spacing"]["md"])
+            content=ft.Column(sections, spacing=0),
+            width=800,  # Максимальная ширина контента
+            **THEME.page,
         )
     
     def build(self):
         """
         Строит основной интерфейс приложения и добавляет его на страницу.
         """
-        # Основной контейнер с максимальной шириной для контента
-        content = ft.Container(
-            content=ft.Column(
-                [
-                    self.header_container,
-                    self.main_container,
-                    self.services_container,
-                    self.about_container,
-                    self.contact_container,
-                    self.footer_container
-                ],
-                spacing=0,
-            ),
-            width=800,  # Максимальная ширина контента
-            padding=ft.padding.only(left=THEME["spacing"]["md"], right=THEME["spacing"]["md"]),
-        )
+        if self.contact_only:
+            sections = [self.contact_container]
+        else:
+            sections = [
+                self.header_container,
+                self.main_container,
+                self.services_container,
+                self.about_container,
+                self.contact_container,
+                self.footer_container
+            ]
         
         # Добавляем контент на страницу
-        self.page.add(content)
+        self.page.add(self.layout(sections))
+    
+    def _touch(self):
+        """
+        Отмечает действие посетителя в реестре сессий.
+        """
+        if self.sessions is not None:
+            self.sessions.touch(self)
+    
+    def _on_connect(self, e):
+        """
+        Обрабатывает повторное подключение клиента к сессии.
+        
+        Args:
+            e: Событие подключения
+        """
+        if self.sessions is not None:
+            self.sessions.connected(self)
+    
+    def _on_disconnect(self, e):
+        """
+        Обрабатывает отключение клиента (сессия пока сохраняется).
+        
+        Args:
+            e: Событие отключения
+        """
+        if self.sessions is not None:
+            self.sessions.disconnected(self)
+    
+    def _on_close(self, e):
+        """
+        Обрабатывает закрытие сессии (клиент отключился и сессия истекла).
+        
+        Args:
+            e: Событие закрытия страницы
+        """
+        if self.sessions is not None:
+            self.sessions.remove(self)
+        self.scheduler.close()
+        TIMERS.cancel_owner(str(self.page.session_id))
+        MEMORY.closed(self)
+    
+    def release(self):
+        """
+        Освобождает сессию, вытесненную реестром сессий.
+        
+        Отменяет отложенные действия, отвязывает обработчики событий страницы
+        и заменяет интерфейс сообщением «сессия истекла», поэтому дерево элементов
+        и само приложение больше ничем не удерживаются.
+        """
+        self.scheduler.close()
+        TIMERS.cancel_owner(str(self.page.session_id))
+        self.page.on_connect = None
+        self.page.on_disconnect = None
+        self.page.on_close = None
+        self.page.on_scroll = None
+        MEMORY.closed(self)
+        try:
+            self.page.clean()
+            self.page.add(compact(Notice(self.localization, THEME, "expired").container))
+        except PageDisconnectedException:
+            pass
     
+    @traced("ZenCatApp.toggle_language")
     def toggle_language(self, e):
         """
         Переключает язык приложения и обновляет интерфейс.
         
         Args:
-            e: Событие нажатия кнопки
+            e: Событие выбора языка; код языка берется из e.control.data,
+                а если его нет — выбирается следующий доступный язык
         """
-        self.localization.toggle_lang()
-        self.update_ui()
+        started = time.perf_counter()
+        self._touch()
+        lang = getattr(getattr(e, "control", None), "data", None)
+        if not lang or not self.localization.set_lang(lang):
+            self.localization.toggle_lang()
+        LANGUAGE_TOGGLES.inc()
+        self.update_ui(done=lambda: LANGUAGE_TOGGLE_SECONDS.observe(time.perf_counter() - started))
     
-    def update_ui(self):
+    def submit_contact(self, name, email, message, form_key=""):
+        """
+        Проверяет заявку с формы обратной связи и передает ее в очередь на сохранение.
+        
+        Повтор уже принятой заявки (двойной клик, та же заявка еще раз) считается
+        успешным, но в очередь не попадает; заявка сверх лимита частоты отклоняется.
+        
+        Args:
+            name (str): Имя
+            email (str): Email
+            message (str): Сообщение
+            form_key (str): Ключ отрисовки формы
+            
+        Returns:
+            bool: True, если заявка принята (или уже была принята)
         """
-        Обновляет все компоненты интерфейса с текущим языком.
+        self._touch()
+        submission = Submission(
+            name=name,
+            email=email,
+            message=message,
+            session_id=str(self.page.session_id),
+            client_ip=self.page.client_ip or ""
+        )
+        if self.guard is not None:
+            verdict = self.guard.check(submission, form_key)
+            if verdict != ACCEPTED:
+                SUBMISSIONS.labels(verdict).inc()
+                return verdict == DUPLICATE
+        
+        if self.submissions is None:
+            self.submissions = get_pipeline()
+        if self.submissions.submit(submission):
+            SUBMISSIONS.labels(ACCEPTED).inc()
+            return True
+        SUBMISSIONS.labels("queue_full" if self.submissions.healthy else "unavailable").inc()
+        if self.guard is not None:
+            self.guard.forget(submission, form_key)
+        return False
+    
+    def update_ui(self, done=None):
         """
-        # Обновление компонентов
-        self.header._update_texts()
-        self.services.update_texts()
-        self.about.update_texts()
-        self.contact_form.update_texts()
-        self.footer.update_texts()
+        Запрашивает обновление всех компонентов интерфейса с текущим языком.
         
-        # Обновление текстов основного экрана
-        self.main_title.value = self.localization.get("main_title")
-        self.main_subtitle.value = self.localization.get("main_subtitle")
+        Запросы, сделанные подряд (например, при частых кликах по меню языка),
+        объединяются планировщиком: реестр привязок применяется один раз и меняет
+        только отличающиеся свойства, а страница получает одно точечное обновление.
         
-        # Обновляем страницу
-        self.page.update()
+        Args:
+            done (callable): Функция, вызываемая после отправки обновления
+        """
+        self.scheduler.request(prepare=self.bindings.apply, done=done)
+
+
+def _route_params(page: ft.Page):
+    """
+    Возвращает параметры запроса из адреса, по которому открыта страница.
+    
+    Args:
+        page (ft.Page): Объект страницы Flet
+        
+    Returns:
+        dict: Параметры (lang — язык, view=contact — только форма обратной связи)
+    """
+    return dict(urllib.parse.parse_qsl(urllib.parse.urlparse(page.route or "").query))
 
 
 def main(page: ft.Page):
@@ -195,10 +466,30 @@ def main(page: ft.Page):
     Args:
         page (ft.Page): Объект страницы Flet
     """
+    params = _route_params(page)
+    
+    # Сверх предела одновременных сессий показываем легкую страницу вместо интерфейса
+    if not SESSIONS.admit(page):
+        localization = Localization()
+        localization.set_lang(params.get("lang", ""))
+        page.title = "Zen-кот"
+        page.bgcolor = THEME.colors.background
+        page.horizontal_alignment = ft.CrossAxisAlignment.CENTER
+        page.add(compact(Notice(localization, THEME, "busy").container))
+        return
+    
     # Создаем экземпляр приложения
-    app = ZenCatApp(page)
+    started = time.perf_counter()
+    app = ZenCatApp(
+        page,
+        sessions=SESSIONS,
+        lang=params.get("lang"),
+        contact_only=params.get("view") == "contact"
+    )
+    SESSION_BUILD_SECONDS.observe(time.perf_counter() - started)
 
 
 # Запуск приложения в веб-браузере
 if __name__ == "__main__":
+    METRICS.serve()  # Метрики на локальном порту (ZEN_CAT_METRICS_PORT)
     ft.app(target=main, view=ft.WEB_BROWSER) 
\ No newline at end of file
@@ -0,0 +1,93 @@
+"""
+Модуль предохранителя (circuit breaker) для каналов доставки приложения Zen-кот.
+
+Если внешняя система подряд не принимает пачки (ошибки или таймауты),
+предохранитель размыкается, и обработчик канала перестает к ней обращаться
+на reset_timeout секунд. Затем пропускается одна пробная пачка: при успехе
+предохранитель замыкается, при неудаче снова размыкается.
+"""
+
+import threading
+import time
+
+from zen_cat import config
+
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Предохранитель для обращений к внешней системе.
+
+    Атрибуты:
+        failure_threshold (int): Число неудач подряд, после которого предохранитель размыкается
+        reset_timeout (float): Время в разомкнутом состоянии в секундах
+        state (str): Текущее состояние (closed, open, half_open)
+    """
+
+    def __init__(self, failure_threshold=None, reset_timeout=None):
+        """
+        Инициализирует замкнутый предохранитель.
+
+        Args:
+            failure_threshold (int): Порог неудач подряд (по умолчанию config.BREAKER_FAILURES)
+            reset_timeout (float): Время в разомкнутом состоянии в секундах
+                (по умолчанию config.BREAKER_RESET)
+        """
+        self.failure_threshold = failure_threshold or config.BREAKER_FAILURES
+        self.reset_timeout = config.BREAKER_RESET if reset_timeout is None else reset_timeout
+        self.state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+
+        # Метрики
+        self.trips = 0
+        self.rejected = 0
+
+    def allow(self):
+        """
+        Проверяет, можно ли сейчас обращаться к внешней системе.
+
+        Returns:
+            bool: True, если обращение разрешено (в том числе пробное)
+        """
+        with self._lock:
+            if self.state == OPEN:
+                if time.monotonic() - self._opened_at < self.reset_timeout:
+                    self.rejected += 1
+                    return False
+                self.state = HALF_OPEN
+            return True
+
+    def record_success(self):
+        """
+        Отмечает успешное обращение и замыкает предохранитель.
+        """
+        with self._lock:
+            self._failures = 0
+            self.state = CLOSED
+
+    def record_failure(self):
+        """
+        Отмечает неудачное обращение и при достижении порога размыкает предохранитель.
+        """
+        with self._lock:
+            self._failures += 1
+            if self.state == HALF_OPEN or self._failures >= self.failure_threshold:
+                if self.state != OPEN:
+                    self.trips += 1
+                self.state = OPEN
+                self._opened_at = time.monotonic()
+
+    def stats(self):
+        """
+        Возвращает состояние и счетчики предохранителя.
+
+        Returns:
+            dict: Состояние, число размыканий и отклоненных обращений
+        """
+        return {"state": self.state, "trips": self.trips, "rejected": self.rejected}
@@ -0,0 +1,141 @@
+"""
+Модуль защиты формы обратной связи от повторов и частых заявок для приложения Zen-кот.
+
+Перед постановкой в очередь заявка проверяется:
+1. Повтор: ключ отрисовки формы (двойной клик) или хэш содержимого заявки
+   уже встречался за последние DEDUP_TTL секунд — заявка считается принятой,
+   но повторно не обрабатывается.
+2. Частота: у сессии и у адреса клиента должен остаться токен в ведре.
+   Если отказал ограничитель адреса, токен сессии возвращается: посетитель
+   за общим адресом (NAT) не теряет из-за чужих заявок и свой лимит.
+"""
+
+import hashlib
+import threading
+
+from zen_cat import config
+from zen_cat.pipeline.submissions import Submission
+from zen_cat.utils.ratelimit import RateLimiter, TTLCache
+
+
+ACCEPTED = "accepted"
+DUPLICATE = "duplicate"
+RATE_LIMITED = "rate_limited"
+
+
+def content_hash(submission: Submission):
+    """
+    Вычисляет хэш содержимого заявки без учета регистра email и крайних пробелов.
+
+    Args:
+        submission (Submission): Заявка
+
+    Returns:
+        str: Хэш содержимого
+    """
+    content = "\0".join((
+        submission.name.strip(),
+        submission.email.strip().lower(),
+        submission.message.strip(),
+    ))
+    return hashlib.blake2b(content.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class SubmissionGuard:
+    """
+    Проверка заявок на повторы и превышение частоты.
+
+    Атрибуты:
+        sessions (RateLimiter): Ограничитель по сессиям
+        addresses (RateLimiter): Ограничитель по адресам клиентов
+        recent (TTLCache): Ключи форм и хэши недавних заявок
+    """
+
+    def __init__(self, sessions=None, addresses=None, recent=None):
+        """
+        Инициализирует проверку заявок.
+
+        Args:
+            sessions (RateLimiter): Ограничитель по сессиям (по умолчанию по настройкам)
+            addresses (RateLimiter): Ограничитель по адресам (по умолчанию по настройкам)
+            recent (TTLCache): Набор недавних заявок (по умолчанию по настройкам)
+        """
+        self.sessions = sessions if sessions is not None else RateLimiter(
+            config.RATE_SESSION_PER_MIN / 60, config.RATE_SESSION_BURST, config.RATE_MAX_KEYS
+        )
+        self.addresses = addresses if addresses is not None else RateLimiter(
+            config.RATE_IP_PER_MIN / 60, config.RATE_IP_BURST, config.RATE_MAX_KEYS
+        )
+        self.recent = recent if recent is not None else TTLCache(config.DEDUP_TTL, config.DEDUP_MAX_SIZE)
+        self._lock = threading.Lock()
+
+        # Метрики
+        self.accepted = 0
+        self.duplicates = 0
+        self.limited_session = 0
+        self.limited_address = 0
+
+    def check(self, submission: Submission, form_key=""):
+        """
+        Проверяет заявку и, если она принята, запоминает ее как недавнюю.
+
+        Args:
+            submission (Submission): Заявка
+            form_key (str): Ключ отрисовки формы (пустой — не проверяется)
+
+        Returns:
+            str: ACCEPTED, DUPLICATE или RATE_LIMITED
+        """
+        digest = content_hash(submission)
+        with self._lock:
+            if (form_key and f"form:{form_key}" in self.recent) or digest in self.recent:
+                self.duplicates += 1
+                return DUPLICATE
+            if submission.session_id and not self.sessions.allow(submission.session_id):
+                self.limited_session += 1
+                return RATE_LIMITED
+            if submission.client_ip and not self.addresses.allow(submission.client_ip):
+                if submission.session_id:
+                    self.sessions.refund(submission.session_id)
+                self.limited_address += 1
+                return RATE_LIMITED
+            if form_key:
+                self.recent.add(f"form:{form_key}")
+            self.recent.add(digest)
+            self.accepted += 1
+            return ACCEPTED
+
+    def forget(self, submission: Submission, form_key=""):
+        """
+        Забывает принятую заявку (например, если очередь не смогла ее принять),
+        чтобы повторная отправка не считалась повтором.
+
+        Args:
+            submission (Submission): Заявка
+            form_key (str): Ключ отрисовки формы
+        """
+        if form_key:
+            self.recent.discard(f"form:{form_key}")
+        self.recent.discard(content_hash(submission))
+
+    def stats(self):
+        """
+        Возвращает счетчики проверок.
+
+        Returns:
+            dict: Принятые заявки, повторы, отказы по сессии и по адресу,
+                число отслеживаемых ключей
+        """
+        return {
+            "accepted": self.accepted,
+            "duplicates": self.duplicates,
+            "limited_session": self.limited_session,
+            "limited_address": self.limited_address,
+            "tracked_sessions": len(self.sessions),
+            "tracked_addresses": len(self.addresses),
+            "recent": len(self.recent),
+        }
+
+
+# Проверка заявок, общая для всех сессий процесса
+GUARD = SubmissionGuard()
@@ -0,0 +1,238 @@
+"""
+Модуль отправки заявок по email для приложения Zen-кот.
+
+SmtpPool держит несколько открытых SMTP-соединений и переиспользует их между
+пачками, поэтому установка TCP/TLS-сессии и авторизация не повторяются для
+каждого письма. SmtpSender рассылает пачку заявок параллельно по соединениям
+пула и используется как отправитель канала "email" в OutboxWorker.
+"""
+
+import queue
+import smtplib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from email.message import EmailMessage
+
+from zen_cat import config
+
+
+class SmtpPool:
+    """
+    Пул переиспользуемых SMTP-соединений.
+
+    Атрибуты:
+        host (str): Адрес SMTP-сервера
+        port (int): Порт SMTP-сервера
+        size (int): Максимальное число одновременно открытых соединений
+    """
+
+    def __init__(self, host=None, port=None, user=None, password=None, starttls=None, timeout=None, size=None):
+        """
+        Инициализирует пул (соединения открываются по мере необходимости).
+
+        Args:
+            host (str): Адрес SMTP-сервера (по умолчанию config.SMTP_HOST)
+            port (int): Порт SMTP-сервера (по умолчанию config.SMTP_PORT)
+            user (str): Имя пользователя (по умолчанию config.SMTP_USER; пустое — без авторизации)
+            password (str): Пароль (по умолчанию config.SMTP_PASSWORD)
+            starttls (bool): Включать ли STARTTLS (по умолчанию config.SMTP_STARTTLS)
+            timeout (float): Таймаут операций в секундах (по умолчанию config.SMTP_TIMEOUT)
+            size (int): Размер пула (по умолчанию config.SMTP_POOL_SIZE)
+        """
+        self.host = host or config.SMTP_HOST
+        self.port = port or config.SMTP_PORT
+        self.user = config.SMTP_USER if user is None else user
+        self.password = config.SMTP_PASSWORD if password is None else password
+        self.starttls = config.SMTP_STARTTLS if starttls is None else starttls
+        self.timeout = timeout or config.SMTP_TIMEOUT
+        self.size = size or config.SMTP_POOL_SIZE
+        # LIFO: чаще используются недавно возвращенные (еще живые) соединения
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(self.size)
+
+        # Метрики
+        self.opened = 0
+        self.reused = 0
+
+    def _open(self):
+        """
+        Открывает новое SMTP-соединение.
+
+        Returns:
+            smtplib.SMTP: Соединение, готовое к отправке
+        """
+        client = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        if self.starttls:
+            client.starttls()
+        if self.user:
+            client.login(self.user, self.password)
+        self.opened += 1
+        return client
+
+    def acquire(self):
+        """
+        Берет соединение из пула, при необходимости открывая новое.
+
+        Returns:
+            smtplib.SMTP: Соединение
+        """
+        self._slots.acquire()
+        try:
+            client = self._idle.get_nowait()
+        except queue.Empty:
+            try:
+                return self._open()
+            except Exception:
+                self._slots.release()
+                raise
+        self.reused += 1
+        return client
+
+    def release(self, client, broken=False):
+        """
+        Возвращает соединение в пул.
+
+        Args:
+            client (smtplib.SMTP): Соединение
+            broken (bool): Соединение неисправно и должно быть закрыто
+        """
+        if broken:
+            self._discard(client)
+        else:
+            self._idle.put(client)
+        self._slots.release()
+
+    def send(self, message):
+        """
+        Отправляет письмо через соединение из пула.
+
+        Если сервер закрыл простаивавшее соединение, письмо один раз
+        отправляется повторно через новое соединение.
+
+        Args:
+            message (EmailMessage): Письмо
+        """
+        client = self.acquire()
+        try:
+            client.send_message(message)
+        except smtplib.SMTPServerDisconnected:
+            self.release(client, broken=True)
+            client = self.acquire()
+            try:
+                client.send_message(message)
+            except Exception:
+                self.release(client, broken=True)
+                raise
+        except (smtplib.SMTPRecipientsRefused, smtplib.SMTPSenderRefused, smtplib.SMTPDataError):
+            # Сервер отклонил письмо, но соединение осталось рабочим
+            self.release(client)
+            raise
+        except Exception:
+            self.release(client, broken=True)
+            raise
+        self.release(client)
+
+    def _discard(self, client):
+        """
+        Закрывает соединение без возврата в пул.
+
+        Args:
+            client (smtplib.SMTP): Соединение
+        """
+        try:
+            client.quit()
+        except Exception:
+            client.close()
+
+    def close(self):
+        """
+        Закрывает все простаивающие соединения пула.
+        """
+        while True:
+            try:
+                client = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(client)
+
+
+class SmtpSender:
+    """
+    Отправитель канала "email": превращает заявки в письма и рассылает их через пул.
+
+    Атрибуты:
+        pool (SmtpPool): Пул SMTP-соединений
+        sender (str): Адрес отправителя
+        recipient (str): Адрес получателя заявок
+    """
+
+    def __init__(self, pool: SmtpPool = None, sender=None, recipient=None):
+        """
+        Инициализирует отправителя.
+
+        Args:
+            pool (SmtpPool): Пул соединений (по умолчанию создается по настройкам)
+            sender (str): Адрес отправителя (по умолчанию config.SMTP_FROM)
+            recipient (str): Адрес получателя (по умолчанию config.SMTP_TO)
+        """
+        self.pool = pool or SmtpPool()
+        self.sender = sender or config.SMTP_FROM
+        self.recipient = recipient or config.SMTP_TO
+        self._executor = ThreadPoolExecutor(self.pool.size, thread_name_prefix="zen-cat-smtp")
+
+    def compose(self, item):
+        """
+        Формирует письмо по заявке.
+
+        Args:
+            item: Запись заявки (sqlite3.Row или словарь с полями заявки)
+
+        Returns:
+            EmailMessage: Письмо
+        """
+        message = EmailMessage()
+        message["From"] = self.sender
+        message["To"] = self.recipient
+        message["Reply-To"] = item["email"]
+        message["Subject"] = f"Zen-кот: заявка от {item['name']}"
+        message.set_content(
+            f"Имя: {item['name']}\n"
+            f"Email: {item['email']}\n\n"
+            f"{item['message']}\n"
+        )
+        return message
+
+    def _send_one(self, item):
+        """
+        Отправляет одну заявку.
+
+        Args:
+            item: Запись заявки
+
+        Returns:
+            str: Текст ошибки или None, если письмо отправлено
+        """
+        try:
+            self.pool.send(self.compose(item))
+        except Exception as error:
+            return repr(error)
+        return None
+
+    def send_batch(self, items):
+        """
+        Отправляет пачку заявок параллельно по соединениям пула.
+
+        Args:
+            items (list): Записи заявок
+
+        Returns:
+            list: Ошибки по заявкам (None — заявка доставлена)
+        """
+        return list(self._executor.map(self._send_one, items))
+
+    def close(self):
+        """
+        Останавливает потоки отправки и закрывает соединения пула.
+        """
+        self._executor.shutdown(wait=True)
+        self.pool.close()
@@ -0,0 +1,371 @@
+"""
+Модуль доставки заявок из outbox для приложения Zen-кот.
+
+OutboxWorker — фоновый поток одного канала доставки (email, webhook).
+Он забирает из таблицы outbox пачку заявок, срок отправки которых наступил,
+передает ее отправителю канала и по результату удаляет доставленные записи,
+переносит неудачные на более позднее время (экспоненциальная задержка)
+или, исчерпав попытки, перемещает их в таблицу dead_letters.
+
+Отправитель канала — любой объект с методом send_batch(items), который
+возвращает список ошибок по заявкам (None — заявка доставлена).
+
+Для внешних систем, которые могут подолгу не отвечать, обработчику передается
+предохранитель (CircuitBreaker): пока он разомкнут, заявки не забираются и их
+попытки не расходуются, а очередь канала ограничивается max_backlog записями —
+самые старые сверх лимита переносятся в dead_letters.
+
+База открывается с повторами (экспоненциальная задержка, как у доставки).
+Если открыть ее не удалось или поток остановился из-за ошибки, ошибка
+записывается в журнал, а канал помечается неисправным (healthy = False,
+метрика zen_cat_outbox_healthy).
+
+Размер очереди канала (backlog) пересчитывается самим потоком доставки
+на его соединении после каждого прохода, поэтому чтение метрик не обращается
+к базе.
+"""
+
+import collections
+import logging
+import sqlite3
+import threading
+import time
+
+from zen_cat import config
+from zen_cat.pipeline.submissions import connect_retrying
+
+
+logger = logging.getLogger(__name__)
+
+
+class OutboxWorker:
+    """
+    Фоновая доставка заявок одного канала из outbox.
+
+    Атрибуты:
+        channel (str): Имя канала доставки
+        sender: Отправитель канала с методом send_batch(items)
+        batch_size (int): Максимальный размер пачки
+        max_attempts (int): Число попыток до переноса заявки в dead_letters
+        breaker (CircuitBreaker): Предохранитель канала или None
+        max_backlog (int): Ограничение очереди канала при разомкнутом предохранителе
+        healthy (bool): False, если поток доставки остановился из-за ошибки
+    """
+
+    def __init__(self, channel, sender, db_path=None, batch_size=None, poll_interval=None,
+                 max_attempts=None, backoff_base=None, backoff_max=None, breaker=None, max_backlog=None):
+        """
+        Инициализирует обработчик канала (поток запускается методом start).
+
+        Args:
+            channel (str): Имя канала доставки
+            sender: Отправитель канала с методом send_batch(items)
+            db_path (str): Путь к файлу SQLite (по умолчанию config.DB_PATH)
+            batch_size (int): Максимальный размер пачки (по умолчанию config.OUTBOX_BATCH_SIZE)
+            poll_interval (float): Период опроса outbox в секундах, если новых заявок нет
+                (по умолчанию config.OUTBOX_POLL_INTERVAL)
+            max_attempts (int): Число попыток (по умолчанию config.OUTBOX_MAX_ATTEMPTS)
+            backoff_base (float): Задержка перед второй попыткой в секундах
+                (по умолчанию config.OUTBOX_BACKOFF_BASE)
+            backoff_max (float): Максимальная задержка между попытками в секундах
+                (по умолчанию config.OUTBOX_BACKOFF_MAX)
+            breaker (CircuitBreaker): Предохранитель канала (по умолчанию не используется)
+            max_backlog (int): Ограничение очереди канала при разомкнутом предохранителе
+                (по умолчанию не ограничена)
+        """
+        self.channel = channel
+        self.sender = sender
+        self.db_path = db_path or config.DB_PATH
+        self.batch_size = batch_size or config.OUTBOX_BATCH_SIZE
+        self.poll_interval = config.OUTBOX_POLL_INTERVAL if poll_interval is None else poll_interval
+        self.max_attempts = max_attempts or config.OUTBOX_MAX_ATTEMPTS
+        self.backoff_base = config.OUTBOX_BACKOFF_BASE if backoff_base is None else backoff_base
+        self.backoff_max = config.OUTBOX_BACKOFF_MAX if backoff_max is None else backoff_max
+        self.breaker = breaker
+        self.max_backlog = max_backlog
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._thread = None
+        self._lock = threading.Lock()
+        self.healthy = True
+
+        # Метрики
+        self.delivered = 0
+        self.failed = 0
+        self.dead = 0
+        self.shed = 0
+        self._backlog = 0
+        self._latencies = collections.deque(maxlen=1024)
+        self._started_at = None
+
+    def start(self):
+        """
+        Запускает фоновый поток доставки (повторный вызов ничего не делает).
+        """
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._stopping.clear()
+            self.healthy = True
+            self._started_at = time.monotonic()
+            self._thread = threading.Thread(
+                target=self._run, name=f"zen-cat-outbox-{self.channel}", daemon=True
+            )
+            self._thread.start()
+
+    def notify(self):
+        """
+        Будит поток доставки (вызывается после записи новых заявок).
+        """
+        self._wakeup.set()
+
+    def stop(self, timeout=10.0):
+        """
+        Останавливает поток доставки после текущей пачки.
+
+        Недоставленные заявки остаются в outbox и будут отправлены при следующем запуске.
+
+        Args:
+            timeout (float): Максимальное время ожидания в секундах
+        """
+        with self._lock:
+            thread = self._thread
+            self._thread = None
+        if thread is None:
+            return
+        self._stopping.set()
+        self._wakeup.set()
+        thread.join(timeout)
+
+    def backoff(self, attempts):
+        """
+        Вычисляет задержку перед следующей попыткой.
+
+        Args:
+            attempts (int): Число уже сделанных попыток
+
+        Returns:
+            float: Задержка в секундах
+        """
+        return min(self.backoff_base * 2 ** (attempts - 1), self.backoff_max)
+
+    def _run(self):
+        """
+        Основной цикл фонового потока доставки.
+        """
+        conn = None
+        try:
+            conn = connect_retrying(self.db_path, self.max_attempts, self.backoff, self._stopping)
+            while not self._stopping.is_set():
+                self._wakeup.clear()
+                if self.deliver(conn) < self.batch_size:
+                    self._wakeup.wait(self.poll_interval)
+        except Exception:
+            logger.exception("Обработчик канала %s остановлен из-за ошибки", self.channel)
+            self.healthy = False
+        finally:
+            if conn is not None:
+                conn.close()
+
+    def deliver(self, conn):
+        """
+        Доставляет одну пачку заявок, срок отправки которых наступил,
+        и пересчитывает размер очереди канала.
+
+        Args:
+            conn (sqlite3.Connection): Соединение с базой
+
+        Returns:
+            int: Число обработанных заявок (0 — outbox канала пуст или предохранитель разомкнут)
+        """
+        processed = self._deliver(conn)
+        try:
+            self._backlog = conn.execute(
+                "SELECT COUNT(*) FROM outbox WHERE channel = ?", (self.channel,)
+            ).fetchone()[0]
+        except sqlite3.Error:
+            pass  # Остается предыдущее значение
+        return processed
+
+    def _deliver(self, conn):
+        """
+        Доставляет одну пачку заявок (см. deliver).
+
+        Args:
+            conn (sqlite3.Connection): Соединение с базой
+
+        Returns:
+            int: Число обработанных заявок
+        """
+        if self.breaker is not None and not self.breaker.allow():
+            try:
+                self._shed(conn)
+            except sqlite3.Error:
+                pass
+            return 0
+
+        try:
+            items = self._claim(conn)
+        except sqlite3.Error:
+            return 0
+        if not items:
+            return 0
+
+        try:
+            errors = self.sender.send_batch(items)
+        except Exception as error:  # Отправитель не должен останавливать поток доставки
+            errors = [repr(error)] * len(items)
+
+        if self.breaker is not None:
+            # Отдельные отклоненные заявки не говорят о неисправности внешней системы
+            if any(error is None for error in errors):
+                self.breaker.record_success()
+            else:
+                self.breaker.record_failure()
+
+        try:
+            self._complete(conn, items, errors)
+        except sqlite3.Error:
+            # Записи остались в outbox и будут отправлены повторно после истечения аренды
+            pass
+        return len(items)
+
+    def _claim(self, conn):
+        """
+        Выбирает пачку заявок и откладывает ее записи на время отправки.
+
+        Пока пачка отправляется, ее записи не видны другим обработчикам того же
+        канала; если процесс упадет во время отправки, записи снова станут
+        доступны через backoff_max секунд.
+
+        Args:
+            conn (sqlite3.Connection): Соединение с базой
+
+        Returns:
+            list: Список записей sqlite3.Row (поля outbox и заявки)
+        """
+        now = time.time()
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            items = conn.execute(
+                "SELECT o.id AS outbox_id, o.attempts, s.* FROM outbox o "
+                "JOIN submissions s ON s.id = o.submission_id "
+                "WHERE o.channel = ? AND o.next_attempt_at <= ? "
+                "ORDER BY o.next_attempt_at LIMIT ?",
+                (self.channel, now, self.batch_size),
+            ).fetchall()
+            if items:
+                conn.executemany(
+                    "UPDATE outbox SET next_attempt_at = ? WHERE id = ?",
+                    [(now + self.backoff_max, item["outbox_id"]) for item in items],
+                )
+        return items
+
+    def _complete(self, conn, items, errors):
+        """
+        Записывает результат отправки пачки одной транзакцией.
+
+        Args:
+            conn (sqlite3.Connection): Соединение с базой
+            items (list): Записи пачки
+            errors (list): Ошибки по записям (None — доставлено)
+        """
+        now = time.time()
+        delivered, retry, dead = [], [], []
+        for item, error in zip(items, errors):
+            attempts = item["attempts"] + 1
+            if error is None:
+                delivered.append((item["outbox_id"],))
+                self._latencies.append(now - item["created_at"])
+            elif attempts >= self.max_attempts:
+                dead.append((item["outbox_id"], item["id"], attempts, str(error)))
+            else:
+                retry.append((attempts, now + self.backoff(attempts), str(error), item["outbox_id"]))
+
+        with conn:
+            conn.executemany("DELETE FROM outbox WHERE id = ?", delivered)
+            conn.executemany(
+                "UPDATE outbox SET attempts = ?, next_attempt_at = ?, last_error = ? WHERE id = ?",
+                retry,
+            )
+            conn.executemany(
+                "INSERT INTO dead_letters (submission_id, channel, attempts, failed_at, last_error) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [(submission_id, self.channel, attempts, now, error)
+                 for _, submission_id, attempts, error in dead],
+            )
+            conn.executemany("DELETE FROM outbox WHERE id = ?", [(row[0],) for row in dead])
+
+        self.delivered += len(delivered)
+        self.failed += len(retry)
+        self.dead += len(dead)
+
+    def _shed(self, conn):
+        """
+        Переносит в dead_letters самые старые заявки канала сверх max_backlog.
+
+        Args:
+            conn (sqlite3.Connection): Соединение с базой
+        """
+        if not self.max_backlog:
+            return
+        now = time.time()
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            excess = conn.execute(
+                "SELECT COUNT(*) FROM outbox WHERE channel = ?", (self.channel,)
+            ).fetchone()[0] - self.max_backlog
+            if excess <= 0:
+                return
+            rows = conn.execute(
+                "SELECT id, submission_id, attempts FROM outbox WHERE channel = ? ORDER BY id LIMIT ?",
+                (self.channel, excess),
+            ).fetchall()
+            conn.executemany(
+                "INSERT INTO dead_letters (submission_id, channel, attempts, failed_at, last_error) "
+                "VALUES (?, ?, ?, ?, 'backlog limit')",
+                [(row["submission_id"], self.channel, row["attempts"], now) for row in rows],
+            )
+            conn.executemany("DELETE FROM outbox WHERE id = ?", [(row["id"],) for row in rows])
+        self.shed += len(rows)
+
+    def backlog(self):
+        """
+        Возвращает число недоставленных заявок канала на момент последнего прохода доставки.
+
+        Returns:
+            int: Число записей канала в outbox
+        """
+        return self._backlog
+
+    def stats(self):
+        """
+        Возвращает метрики доставки канала.
+
+        Returns:
+            dict: Исправность канала, счетчики доставленных, отложенных, перенесенных в dead_letters
+                и вытесненных по лимиту очереди заявок,
+                размер очереди, пропускная способность (заявок в секунду) и задержка
+                от создания заявки до доставки (p50/p95, секунды); при наличии —
+                состояние предохранителя и метрики отправителя
+        """
+        latencies = sorted(self._latencies)
+        elapsed = time.monotonic() - self._started_at if self._started_at else 0.0
+        stats = {
+            "channel": self.channel,
+            "healthy": self.healthy,
+            "delivered": self.delivered,
+            "failed": self.failed,
+            "dead": self.dead,
+            "shed": self.shed,
+            "backlog": self.backlog(),
+            "throughput": self.delivered / elapsed if elapsed else 0.0,
+            "latency_p50": latencies[len(latencies) // 2] if latencies else 0.0,
+            "latency_p95": latencies[int(len(latencies) * 0.95)] if latencies else 0.0,
+        }
+        if self.breaker is not None:
+            stats["breaker"] = self.breaker.stats()
+        sender_stats = getattr(self.sender, "stats", None)
+        if sender_stats is not None:
+            stats["sender"] = sender_stats()
+        return stats
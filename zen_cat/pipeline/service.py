@@ -0,0 +1,182 @@
+"""
+Модуль сборки конвейера заявок для приложения Zen-кот.
+
+Связывает очередь записи заявок в SQLite с обработчиками доставки из outbox:
+каналы включаются настройками, а после записи каждой пачки обработчики
+каналов будятся без ожидания очередного опроса.
+"""
+
+import atexit
+import os
+import sqlite3
+import threading
+
+from zen_cat import config
+from zen_cat.pipeline.breaker import CircuitBreaker
+from zen_cat.pipeline.outbox import OutboxWorker
+from zen_cat.pipeline.submissions import SubmissionPipeline, connect
+from zen_cat.utils.metrics import METRICS
+
+
+_pipeline = None
+_workers = []
+_pipeline_lock = threading.Lock()
+
+
+def _create_workers():
+    """
+    Создает обработчики доставки для каналов, включенных в настройках.
+
+    Returns:
+        list: Список OutboxWorker
+
+    Raises:
+        ValueError: Если имена каналов webhook повторяются
+    """
+    workers = []
+    if config.SMTP_HOST:
+        from zen_cat.pipeline.mailer import SmtpSender
+
+        workers.append(OutboxWorker("email", SmtpSender()))
+    if config.WEBHOOK_URLS:
+        from zen_cat.pipeline.webhook import WebhookSender, webhook_channel
+
+        channels = [webhook_channel(entry) for entry in config.WEBHOOK_URLS]
+        names = [channel for channel, _ in channels]
+        if len(set(names)) != len(names):
+            raise ValueError(f"Повторяются имена каналов webhook: {', '.join(names)}")
+        for channel, url in channels:
+            workers.append(OutboxWorker(
+                channel,
+                WebhookSender(url),
+                breaker=CircuitBreaker(),
+                max_backlog=config.WEBHOOK_MAX_BACKLOG,
+            ))
+    return workers
+
+
+def _prepare_database(workers):
+    """
+    Создает и обновляет схему базы до запуска фоновых потоков, чтобы они
+    не выполняли миграцию одновременно, и переименовывает каналы webhook,
+    записанные в базу под полным адресом (webhook:<адрес>, так называли каналы
+    раньше): недоставленные заявки не теряются, а адреса с токенами
+    не остаются в базе.
+
+    Args:
+        workers (list): Обработчики доставки
+    """
+    renames = [
+        (worker.channel, f"webhook:{worker.sender.url}")
+        for worker in workers if worker.channel.startswith("webhook:")
+    ]
+    try:
+        conn = connect(config.DB_PATH)
+        try:
+            with conn:
+                for table in ("outbox", "dead_letters"):
+                    conn.executemany(f"UPDATE {table} SET channel = ? WHERE channel = ?", renames)
+        finally:
+            conn.close()
+    except sqlite3.Error:
+        pass  # База недоступна: потоки повторят попытки открыть ее и сообщат об ошибке
+
+
+def _load_classifier():
+    """
+    Загружает модель классификатора спама, если файл модели есть.
+
+    Returns:
+        SpamClassifier: Классификатор или None
+    """
+    if not os.path.exists(config.SPAM_MODEL_PATH):
+        return None
+    from zen_cat.pipeline.spam import SpamClassifier
+
+    return SpamClassifier.load(config.SPAM_MODEL_PATH)
+
+
+def get_pipeline():
+    """
+    Возвращает общую для процесса очередь заявок, запуская ее и обработчики
+    доставки при первом обращении.
+
+    Returns:
+        SubmissionPipeline: Очередь заявок
+    """
+    global _pipeline
+    with _pipeline_lock:
+        if _pipeline is None:
+            workers = _create_workers()
+            _prepare_database(workers)
+            pipeline = SubmissionPipeline(
+                channels=[worker.channel for worker in workers],
+                classifier=_load_classifier(),
+            )
+            for worker in workers:
+                pipeline.add_listener(worker.notify)
+                worker.start()
+                atexit.register(worker.sender.close)
+                atexit.register(worker.stop)
+            # Очередь регистрирует остановку последней, поэтому при выходе
+            # она дописывается раньше, чем останавливаются обработчики
+            pipeline.start()
+            _workers.extend(workers)
+            _pipeline = pipeline
+        return _pipeline
+
+
+def get_workers():
+    """
+    Возвращает запущенные обработчики доставки.
+
+    Returns:
+        list: Список OutboxWorker
+    """
+    return list(_workers)
+
+
+@METRICS.collector
+def _collect_metrics():
+    """
+    Собирает метрики очереди заявок и каналов доставки (если очередь уже запущена).
+
+    Returns:
+        list: Метрики (имя, тип, описание, значения)
+    """
+    pipeline = _pipeline
+    if pipeline is None:
+        return []
+    stats = pipeline.stats()
+    channels = [worker.stats() for worker in get_workers()]
+
+    def by_channel(key):
+        return [({"channel": channel["channel"]}, channel[key]) for channel in channels]
+
+    return [
+        ("zen_cat_pipeline_healthy", "gauge", "Поток записи заявок работает", [({}, int(stats["healthy"]))]),
+        ("zen_cat_pipeline_queue_depth", "gauge", "Заявки в очереди на запись", [({}, stats["queue_depth"])]),
+        ("zen_cat_pipeline_written_total", "counter", "Заявки, записанные в базу", [({}, stats["written"])]),
+        ("zen_cat_pipeline_dropped_total", "counter", "Заявки, не принятые очередью (переполнена или неисправна)",
+         [({}, stats["dropped"])]),
+        ("zen_cat_pipeline_retries_total", "counter", "Повторные попытки записи пачки", [({}, stats["retries"])]),
+        ("zen_cat_pipeline_failed_batches_total", "counter", "Пачки, которые не удалось записать в базу",
+         [({}, stats["failed_batches"])]),
+        ("zen_cat_pipeline_spilled_total", "counter", "Заявки, перенесенные в запасной файл",
+         [({}, stats["spilled"])]),
+        ("zen_cat_pipeline_lost_total", "counter", "Заявки, не записанные ни в базу, ни в запасной файл",
+         [({}, stats["lost"])]),
+        ("zen_cat_pipeline_spam_total", "counter", "Заявки, оцененные как спам", [({}, stats["spam"])]),
+        ("zen_cat_outbox_healthy", "gauge", "Поток доставки канала работает", [
+            ({"channel": channel["channel"]}, int(channel["healthy"])) for channel in channels
+        ]),
+        ("zen_cat_outbox_backlog", "gauge", "Недоставленные заявки в outbox", by_channel("backlog")),
+        ("zen_cat_outbox_delivered_total", "counter", "Доставленные заявки", by_channel("delivered")),
+        ("zen_cat_outbox_failed_total", "counter", "Неудачные попытки доставки", by_channel("failed")),
+        ("zen_cat_outbox_dead_total", "counter", "Заявки, перенесенные в dead_letters", by_channel("dead")),
+        ("zen_cat_outbox_shed_total", "counter", "Заявки, вытесненные по лимиту outbox", by_channel("shed")),
+        ("zen_cat_breaker_open", "gauge", "Предохранитель канала разомкнут", [
+            ({"channel": channel["channel"]}, int(channel["breaker"]["state"] != "closed"))
+            for channel in channels if "breaker" in channel
+        ]),
+    ]
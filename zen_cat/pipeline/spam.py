@@ -0,0 +1,222 @@
+"""
+Модуль оценки заявок на спам для приложения Zen-кот.
+
+SpamClassifier — наивный байесовский классификатор (мультиномиальный) над
+хэшированными признаками: словами, парами слов и символьными триграммами.
+Модель — один вектор весов log P(признак | спам) - log P(признак | не спам)
+и смещение, поэтому оценка пачки сообщений сводится к одному np.bincount
+по всем признакам пачки.
+
+Оценка выполняется в фоновом потоке записи заявок (см. SubmissionPipeline):
+каждая пачка оценивается целиком, оценка сохраняется в submissions.spam_score,
+а заявки с оценкой не ниже порога не ставятся в outbox.
+
+Обучение по размеченным заявкам (submissions.label = 'spam' или 'ham'):
+    python -m zen_cat.pipeline.spam label <id заявки> spam|ham [--db zen_cat.db]
+    python -m zen_cat.pipeline.spam train [--db zen_cat.db] [--model spam_model.npz]
+"""
+
+import argparse
+import re
+import zlib
+
+import numpy as np
+
+from zen_cat import config
+from zen_cat.pipeline.submissions import connect
+
+
+# Слова: буквы и цифры любого алфавита
+_WORD = re.compile(r"\w+", re.UNICODE)
+
+# Допустимые метки заявок
+LABELS = ("ham", "spam")
+
+
+def features(text, n_features):
+    """
+    Извлекает хэшированные признаки сообщения.
+
+    Хэш crc32 одинаков во всех процессах (в отличие от встроенного hash),
+    поэтому обученная модель переносима.
+
+    Args:
+        text (str): Текст сообщения
+        n_features (int): Размер пространства признаков (степень двойки)
+
+    Returns:
+        list: Номера признаков (с повторами — частоты учитываются)
+    """
+    mask = n_features - 1
+    text = text.lower()
+    words = _WORD.findall(text)
+    tokens = [f"w:{word}" for word in words]
+    tokens += [f"b:{a} {b}" for a, b in zip(words, words[1:])]
+    padded = f" {' '.join(words)} "
+    tokens += [f"c:{padded[i:i + 3]}" for i in range(len(padded) - 2)]
+    return [zlib.crc32(token.encode("utf-8")) & mask for token in tokens]
+
+
+class SpamClassifier:
+    """
+    Наивный байесовский классификатор сообщений.
+
+    Атрибуты:
+        weights (np.ndarray): Логарифм отношения правдоподобий по признакам
+        bias (float): Логарифм отношения априорных вероятностей
+        n_features (int): Размер пространства признаков
+    """
+
+    def __init__(self, weights, bias, n_features):
+        """
+        Инициализирует классификатор обученными параметрами.
+
+        Args:
+            weights (np.ndarray): Веса признаков
+            bias (float): Смещение
+            n_features (int): Размер пространства признаков
+        """
+        self.weights = np.asarray(weights, dtype=np.float32)
+        self.bias = float(bias)
+        self.n_features = n_features
+
+    @classmethod
+    def train(cls, texts, labels, n_features=None, alpha=1.0):
+        """
+        Обучает классификатор.
+
+        Args:
+            texts (list): Тексты сообщений
+            labels (list): Метки (1 — спам, 0 — не спам)
+            n_features (int): Размер пространства признаков (по умолчанию config.SPAM_FEATURES)
+            alpha (float): Сглаживание Лапласа
+
+        Returns:
+            SpamClassifier: Обученный классификатор
+        """
+        n_features = n_features or config.SPAM_FEATURES
+        labels = np.asarray(labels, dtype=bool)
+        counts = []
+        for label in (False, True):
+            indices = [f for text, spam in zip(texts, labels) if spam == label for f in features(text, n_features)]
+            counts.append(np.bincount(np.asarray(indices, dtype=np.int64), minlength=n_features) + alpha)
+        ham, spam = counts
+        weights = np.log(spam / spam.sum()) - np.log(ham / ham.sum())
+        # Смещение по долям классов со сглаживанием, чтобы не получить log(0)
+        bias = np.log((labels.sum() + 1) / (len(labels) - labels.sum() + 1))
+        return cls(weights, bias, n_features)
+
+    def score(self, texts):
+        """
+        Оценивает пачку сообщений.
+
+        Args:
+            texts (list): Тексты сообщений
+
+        Returns:
+            np.ndarray: Вероятности спама для каждого сообщения
+        """
+        indices, docs = [], []
+        for doc, text in enumerate(texts):
+            found = features(text, self.n_features)
+            indices.extend(found)
+            docs.extend([doc] * len(found))
+        logits = self.bias + np.bincount(
+            np.asarray(docs, dtype=np.int64),
+            weights=self.weights[np.asarray(indices, dtype=np.int64)],
+            minlength=len(texts),
+        )
+        return 1.0 / (1.0 + np.exp(-logits))
+
+    def save(self, path):
+        """
+        Сохраняет модель в файл .npz.
+
+        Args:
+            path (str): Путь к файлу
+        """
+        np.savez_compressed(path, weights=self.weights, bias=self.bias, n_features=self.n_features)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Загружает модель из файла .npz.
+
+        Args:
+            path (str): Путь к файлу
+
+        Returns:
+            SpamClassifier: Классификатор
+        """
+        with np.load(path) as data:
+            return cls(data["weights"], data["bias"], int(data["n_features"]))
+
+
+def _train(args):
+    """
+    Обучает модель по размеченным заявкам и сохраняет ее.
+
+    Args:
+        args (argparse.Namespace): Аргументы командной строки
+    """
+    conn = connect(args.db)
+    try:
+        rows = conn.execute(
+            "SELECT name, message, label FROM submissions WHERE label IN ('ham', 'spam')"
+        ).fetchall()
+    finally:
+        conn.close()
+    labels = [row["label"] == "spam" for row in rows]
+    if not any(labels) or all(labels):
+        raise SystemExit("Нужны размеченные заявки обоих классов (spam и ham)")
+
+    classifier = SpamClassifier.train([row["message"] for row in rows], labels)
+    classifier.save(args.model)
+    scores = classifier.score([row["message"] for row in rows])
+    accuracy = np.mean((scores >= config.SPAM_THRESHOLD) == np.asarray(labels))
+    print(f"Обучено на {len(rows)} заявках ({sum(labels)} спам), "
+          f"точность на обучающих данных: {accuracy:.1%}. Модель: {args.model}")
+
+
+def _label(args):
+    """
+    Размечает заявку.
+
+    Args:
+        args (argparse.Namespace): Аргументы командной строки
+    """
+    conn = connect(args.db)
+    try:
+        with conn:
+            updated = conn.execute(
+                "UPDATE submissions SET label = ? WHERE id = ?", (args.label, args.id)
+            ).rowcount
+    finally:
+        conn.close()
+    if not updated:
+        raise SystemExit(f"Заявка {args.id} не найдена")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Классификатор спама для заявок Zen-кот")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    # Общие аргументы команд
+    database = argparse.ArgumentParser(add_help=False)
+    database.add_argument("--db", default=config.DB_PATH, help="Файл SQLite с заявками")
+
+    train = commands.add_parser("train", parents=[database], help="Обучить модель по размеченным заявкам")
+    train.add_argument("--model", default=config.SPAM_MODEL_PATH, help="Файл модели")
+    train.set_defaults(handler=_train)
+
+    label = commands.add_parser("label", parents=[database], help="Разметить заявку")
+    label.add_argument("id", type=int, help="Номер заявки")
+    label.add_argument("label", choices=LABELS, help="Метка")
+    label.set_defaults(handler=_label)
+
+    args = parser.parse_args()
+    args.handler(args)
+
+
+if __name__ == "__main__":
+    main()
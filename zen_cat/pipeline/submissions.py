@@ -0,0 +1,538 @@
+"""
+Модуль сохранения заявок с формы обратной связи для приложения Zen-кот.
+
+Обработчик формы только кладет заявку в ограниченную очередь в памяти и сразу
+возвращает управление интерфейсу. Фоновый поток забирает заявки пачками
+и записывает каждую пачку в SQLite (режим WAL) одной транзакцией.
+При штатном завершении процесса очередь дописывается до конца.
+
+Пачка, которую не удалось записать (база заблокирована другим соединением,
+нет места на диске, ошибка ввода-вывода), не выбрасывается: запись повторяется
+с экспоненциальной задержкой (config.SUBMIT_RETRY_BASE, config.SUBMIT_MAX_ATTEMPTS
+попыток), а после последней неудачи заявки дописываются в запасной файл
+config.SUBMIT_SPILL_PATH (JSON Lines), откуда их можно загрузить вручную.
+При остановке процесса повторов не ждут: пачка сразу переносится в файл.
+
+Соединение с базой открывается с теми же повторами. Если базу так и не удалось
+открыть или поток записи остановился из-за ошибки, очередь помечается
+неисправной (healthy = False): заявки из нее переносятся в запасной файл,
+а submit() больше их не принимает, и форма показывает ошибку.
+
+В той же транзакции для каждой заявки создаются записи в таблице outbox —
+по одной на канал доставки (email, webhook). Доставкой из outbox занимаются
+отдельные фоновые обработчики (см. zen_cat/pipeline/outbox.py), поэтому
+заявка не теряется, даже если процесс упадет до ее отправки.
+
+Если задан классификатор спама, пачка оценивается целиком перед записью:
+оценка сохраняется в submissions.spam_score, а заявки с оценкой не ниже
+config.SPAM_THRESHOLD в outbox не ставятся.
+"""
+
+import atexit
+import collections
+import dataclasses
+import json
+import logging
+import queue
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+
+from zen_cat import config
+
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS submissions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    created_at REAL NOT NULL,
+    session_id TEXT,
+    client_ip TEXT,
+    name TEXT NOT NULL,
+    email TEXT NOT NULL,
+    message TEXT NOT NULL,
+    spam_score REAL,
+    label TEXT
+);
+
+CREATE TABLE IF NOT EXISTS outbox (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    submission_id INTEGER NOT NULL REFERENCES submissions (id),
+    channel TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL,
+    last_error TEXT
+);
+
+CREATE INDEX IF NOT EXISTS outbox_due ON outbox (channel, next_attempt_at);
+
+CREATE TABLE IF NOT EXISTS dead_letters (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    submission_id INTEGER NOT NULL REFERENCES submissions (id),
+    channel TEXT NOT NULL,
+    attempts INTEGER NOT NULL,
+    failed_at REAL NOT NULL,
+    last_error TEXT
+);
+"""
+
+# Столбцы, добавленные после первой версии схемы: (имя, определение)
+_MIGRATIONS = (
+    ("spam_score", "REAL"),
+    ("label", "TEXT"),
+)
+
+# Признак остановки фонового потока
+_STOP = object()
+
+
+@dataclass
+class Submission:
+    """
+    Заявка с формы обратной связи.
+    """
+
+    name: str
+    email: str
+    message: str
+    session_id: str = ""
+    client_ip: str = ""
+    created_at: float = field(default_factory=time.time)
+
+
+def _is_spam(score):
+    """
+    Проверяет, считается ли заявка с такой оценкой спамом.
+
+    Args:
+        score (float): Оценка заявки или None
+
+    Returns:
+        bool: True, если оценка не ниже config.SPAM_THRESHOLD
+    """
+    return score is not None and score >= config.SPAM_THRESHOLD
+
+
+def _columns(conn):
+    """
+    Возвращает имена столбцов таблицы submissions.
+
+    Args:
+        conn (sqlite3.Connection): Соединение с базой
+
+    Returns:
+        set: Имена столбцов
+    """
+    return {row["name"] for row in conn.execute("PRAGMA table_info(submissions)")}
+
+
+def _migrate(conn):
+    """
+    Добавляет в таблицу submissions столбцы, появившиеся после первой версии схемы.
+
+    Обработчики доставки и поток записи открывают базу одновременно, поэтому
+    столбцы проверяются повторно под блокировкой записи (BEGIN IMMEDIATE):
+    миграцию выполняет только первое соединение.
+
+    Args:
+        conn (sqlite3.Connection): Соединение с базой
+    """
+    if all(name in _columns(conn) for name, _ in _MIGRATIONS):
+        return
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        columns = _columns(conn)
+        for name, definition in _MIGRATIONS:
+            if name not in columns:
+                conn.execute(f"ALTER TABLE submissions ADD COLUMN {name} {definition}")
+        conn.commit()
+    except sqlite3.Error:
+        conn.rollback()
+        raise
+
+
+def connect(db_path):
+    """
+    Открывает базу заявок в режиме WAL и создает таблицы при необходимости.
+
+    Args:
+        db_path (str): Путь к файлу SQLite
+
+    Returns:
+        sqlite3.Connection: Соединение с базой
+    """
+    conn = sqlite3.connect(db_path, check_same_thread=False)
+    try:
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(_SCHEMA)
+        _migrate(conn)
+    except sqlite3.Error:
+        conn.close()
+        raise
+    return conn
+
+
+def connect_retrying(db_path, attempts, backoff, stopping):
+    """
+    Открывает базу, при ошибке повторяя попытку с задержкой (для фоновых потоков).
+
+    Args:
+        db_path (str): Путь к файлу SQLite
+        attempts (int): Число попыток
+        backoff (callable): Функция backoff(номер неудачной попытки) -> задержка в секундах
+        stopping (threading.Event): Признак остановки потока: повторы прекращаются
+
+    Returns:
+        sqlite3.Connection: Соединение с базой
+
+    Raises:
+        sqlite3.Error: Если базу не удалось открыть
+    """
+    for attempt in range(1, attempts + 1):
+        try:
+            return connect(db_path)
+        except sqlite3.Error as error:
+            logger.warning(
+                "Не удалось открыть базу заявок %s (попытка %d из %d): %s", db_path, attempt, attempts, error
+            )
+            if attempt == attempts or stopping.is_set():
+                raise
+            stopping.wait(backoff(attempt))
+
+
+class SubmissionPipeline:
+    """
+    Очередь заявок с фоновой пакетной записью в SQLite.
+
+    Атрибуты:
+        db_path (str): Путь к файлу SQLite
+        batch_size (int): Максимальный размер пачки
+        flush_interval (float): Максимальное время ожидания пачки в секундах
+        channels (tuple): Каналы доставки, для которых создаются записи в outbox
+        classifier (SpamClassifier): Классификатор спама или None
+        max_attempts (int): Число попыток записи пачки
+        retry_base (float): Задержка перед второй попыткой в секундах
+        spill_path (str): Запасной файл для заявок, которые не удалось записать
+        healthy (bool): False, если поток записи остановился из-за ошибки
+    """
+
+    def __init__(self, db_path=None, max_queue=None, batch_size=None, flush_interval=None, channels=(),
+                 classifier=None, max_attempts=None, retry_base=None, spill_path=None):
+        """
+        Инициализирует очередь заявок (фоновый поток запускается методом start).
+
+        Args:
+            db_path (str): Путь к файлу SQLite (по умолчанию config.DB_PATH)
+            max_queue (int): Максимальная длина очереди (по умолчанию config.SUBMIT_QUEUE_SIZE)
+            batch_size (int): Максимальный размер пачки (по умолчанию config.SUBMIT_BATCH_SIZE)
+            flush_interval (float): Максимальное время набора пачки в секундах
+                (по умолчанию config.SUBMIT_FLUSH_INTERVAL)
+            channels (tuple): Каналы доставки (например, ("email", "webhook"))
+            classifier (SpamClassifier): Классификатор спама (по умолчанию не используется)
+            max_attempts (int): Число попыток записи пачки (по умолчанию config.SUBMIT_MAX_ATTEMPTS)
+            retry_base (float): Задержка перед второй попыткой в секундах
+                (по умолчанию config.SUBMIT_RETRY_BASE)
+            spill_path (str): Запасной файл (по умолчанию config.SUBMIT_SPILL_PATH)
+        """
+        self.db_path = db_path or config.DB_PATH
+        self.channels = tuple(channels)
+        self.classifier = classifier
+        self.batch_size = batch_size or config.SUBMIT_BATCH_SIZE
+        self.flush_interval = config.SUBMIT_FLUSH_INTERVAL if flush_interval is None else flush_interval
+        self.max_attempts = max(1, max_attempts or config.SUBMIT_MAX_ATTEMPTS)
+        self.retry_base = config.SUBMIT_RETRY_BASE if retry_base is None else retry_base
+        self.spill_path = spill_path or config.SUBMIT_SPILL_PATH
+        self._queue = queue.Queue(maxsize=max_queue or config.SUBMIT_QUEUE_SIZE)
+        self._thread = None
+        self._lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._listeners = []
+        self.healthy = True
+
+        # Метрики
+        self.accepted = 0
+        self.dropped = 0
+        self.written = 0
+        self.batches = 0
+        self.failed_batches = 0
+        self.retries = 0
+        self.spilled = 0
+        self.lost = 0
+        self.spam = 0
+        self._latencies = collections.deque(maxlen=1024)
+
+    def start(self):
+        """
+        Запускает фоновый поток записи (повторный вызов ничего не делает).
+        """
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._stopping.clear()
+            self._thread = threading.Thread(target=self._run, name="zen-cat-submissions", daemon=True)
+            self._thread.start()
+            atexit.register(self.stop)
+
+    def add_listener(self, callback):
+        """
+        Регистрирует функцию, вызываемую после записи каждой пачки
+        (например, чтобы разбудить обработчики outbox).
+
+        Args:
+            callback (callable): Функция без аргументов
+        """
+        self._listeners.append(callback)
+
+    def submit(self, submission: Submission):
+        """
+        Ставит заявку в очередь без ожидания.
+
+        Args:
+            submission (Submission): Заявка
+
+        Returns:
+            bool: True, если заявка принята; False, если очередь переполнена
+                или неисправна
+        """
+        if not self.healthy:
+            self.dropped += 1
+            return False
+        try:
+            self._queue.put_nowait(submission)
+        except queue.Full:
+            self.dropped += 1
+            return False
+        self.accepted += 1
+        return True
+
+    def stop(self, timeout=10.0):
+        """
+        Останавливает фоновый поток, предварительно записав все заявки из очереди.
+
+        Args:
+            timeout (float): Максимальное время ожидания в секундах
+        """
+        with self._lock:
+            thread = self._thread
+            self._thread = None
+        if thread is None:
+            return
+        self._stopping.set()
+        deadline = time.monotonic() + timeout
+        # Если поток уже остановился, полную очередь никто не разберет: не ждем места в ней
+        while thread.is_alive():
+            try:
+                self._queue.put(_STOP, timeout=0.1)
+                break
+            except queue.Full:
+                if time.monotonic() >= deadline:
+                    break
+        thread.join(max(0.0, deadline - time.monotonic()))
+        atexit.unregister(self.stop)
+
+    def _collect(self):
+        """
+        Собирает очередную пачку заявок.
+
+        Ждет первую заявку, затем добирает пачку до batch_size,
+        но не дольше flush_interval.
+
+        Returns:
+            tuple: (список заявок, признак остановки)
+        """
+        first = self._queue.get()
+        if first is _STOP:
+            return [], True
+
+        batch = [first]
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is _STOP:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def _run(self):
+        """
+        Основной цикл фонового потока записи.
+        """
+        conn = None
+        try:
+            conn = connect_retrying(
+                self.db_path, self.max_attempts, lambda attempt: self.retry_base * 2 ** (attempt - 1), self._stopping
+            )
+            stopping = False
+            while not stopping:
+                batch, stopping = self._collect()
+                if stopping:
+                    # Дописываем все, что осталось в очереди
+                    while True:
+                        try:
+                            item = self._queue.get_nowait()
+                        except queue.Empty:
+                            break
+                        if item is not _STOP:
+                            batch.append(item)
+                if batch:
+                    self._write(conn, batch)
+        except Exception as error:
+            logger.exception("Поток записи заявок остановлен из-за ошибки")
+            self.healthy = False
+            self._drain(error)
+        finally:
+            if conn is not None:
+                conn.close()
+
+    def _drain(self, error):
+        """
+        Переносит все заявки из очереди в запасной файл (после отказа потока записи).
+
+        Args:
+            error (Exception): Ошибка, из-за которой остановился поток
+        """
+        batch = []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not _STOP:
+                batch.append(item)
+        if batch:
+            self._spill(batch, [None] * len(batch), error)
+
+    def _write(self, conn, batch):
+        """
+        Записывает пачку заявок одной транзакцией, при ошибке повторяя запись
+        с экспоненциальной задержкой.
+
+        Если все попытки неудачны, пачка дописывается в запасной файл.
+
+        Args:
+            conn (sqlite3.Connection): Соединение с базой
+            batch (list): Список заявок
+        """
+        started = time.perf_counter()
+        scores = self._score(batch)
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                with conn:
+                    self._insert(conn, batch, scores)
+                break
+            except sqlite3.Error as error:
+                logger.warning(
+                    "Не удалось записать пачку из %d заявок (попытка %d из %d): %s",
+                    len(batch), attempt, self.max_attempts, error
+                )
+                if attempt == self.max_attempts or self._stopping.is_set():
+                    self.failed_batches += 1
+                    self._spill(batch, scores, error)
+                    return
+                self.retries += 1
+                self._stopping.wait(self.retry_base * 2 ** (attempt - 1))
+        self._latencies.append(time.perf_counter() - started)
+        self.written += len(batch)
+        self.batches += 1
+        self.spam += sum(1 for score in scores if _is_spam(score))
+        for callback in self._listeners:
+            callback()
+
+    def _spill(self, batch, scores, error):
+        """
+        Дописывает заявки, которые не удалось записать в базу, в запасной файл.
+
+        Args:
+            batch (list): Список заявок
+            scores (list): Оценки заявок на спам
+            error (Exception): Последняя ошибка записи
+        """
+        lines = "".join(
+            json.dumps({**dataclasses.asdict(s), "spam_score": score, "error": str(error)}, ensure_ascii=False) + "\n"
+            for s, score in zip(batch, scores)
+        )
+        try:
+            with open(self.spill_path, "a", encoding="utf-8") as f:
+                f.write(lines)
+        except OSError:
+            self.lost += len(batch)
+            logger.exception("Заявки потеряны: не удалось записать %d заявок в %s", len(batch), self.spill_path)
+            return
+        self.spilled += len(batch)
+        logger.error("%d заявок перенесены в запасной файл %s", len(batch), self.spill_path)
+
+    def _score(self, batch):
+        """
+        Оценивает пачку заявок на спам.
+
+        Args:
+            batch (list): Список заявок
+
+        Returns:
+            list: Оценки (None, если классификатор не задан или не сработал)
+        """
+        if self.classifier is None:
+            return [None] * len(batch)
+        try:
+            return [float(score) for score in self.classifier.score([s.message for s in batch])]
+        except Exception:  # Ошибка оценки не должна терять заявки
+            return [None] * len(batch)
+
+    def _insert(self, conn, batch, scores):
+        """
+        Вставляет заявки пачки в таблицу submissions и ставит в outbox те, что не похожи на спам.
+
+        Args:
+            conn (sqlite3.Connection): Соединение с базой (внутри транзакции)
+            batch (list): Список заявок
+            scores (list): Оценки заявок на спам
+        """
+        outbox = []
+        for s, score in zip(batch, scores):
+            cursor = conn.execute(
+                "INSERT INTO submissions (created_at, session_id, client_ip, name, email, message, spam_score) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (s.created_at, s.session_id, s.client_ip, s.name, s.email, s.message, score),
+            )
+            if _is_spam(score):
+                continue
+            outbox.extend((cursor.lastrowid, channel, s.created_at) for channel in self.channels)
+        if outbox:
+            conn.executemany(
+                "INSERT INTO outbox (submission_id, channel, next_attempt_at) VALUES (?, ?, ?)",
+                outbox,
+            )
+
+    def stats(self):
+        """
+        Возвращает метрики очереди и записи.
+
+        Returns:
+            dict: Исправность и глубина очереди, счетчики заявок, пачек, повторов, перенесенных в запасной файл
+                и потерянных заявок и спама, задержка записи пачки (p50/p95, секунды)
+        """
+        latencies = sorted(self._latencies)
+        return {
+            "healthy": self.healthy,
+            "queue_depth": self._queue.qsize(),
+            "accepted": self.accepted,
+            "dropped": self.dropped,
+            "written": self.written,
+            "batches": self.batches,
+            "failed_batches": self.failed_batches,
+            "retries": self.retries,
+            "spilled": self.spilled,
+            "lost": self.lost,
+            "spam": self.spam,
+            "write_latency_p50": latencies[len(latencies) // 2] if latencies else 0.0,
+            "write_latency_p95": latencies[int(len(latencies) * 0.95)] if latencies else 0.0,
+        }
+
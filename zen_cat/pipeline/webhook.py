@@ -0,0 +1,178 @@
+"""
+Модуль отправки заявок во внешние системы (CRM) через webhook для приложения Zen-кот.
+
+WebhookSender отправляет заявки POST-запросами с JSON через общий httpx.Client,
+который держит keep-alive соединения с внешней системой. Если она принимает
+несколько заявок в одном запросе (batch > 1), пачка outbox делится на запросы
+по batch заявок: {"submissions": [...]}; иначе каждая заявка отправляется
+отдельным запросом. Запросы пачки выполняются параллельно.
+
+Адрес webhook часто содержит секретный токен (в пути или параметрах запроса),
+поэтому он хранится только в отправителе. Канал outbox, его записи в базе
+и метки метрик используют короткое имя: заданное в настройке как
+имя=адрес или, если имени нет, начало хэша адреса (webhook_channel).
+"""
+
+import collections
+import hashlib
+import re
+import threading
+import time
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+
+from zen_cat import config
+
+
+# Поля заявки, передаваемые во внешнюю систему
+_FIELDS = ("id", "created_at", "session_id", "client_ip", "name", "email", "message")
+
+# Адрес с именем канала: crm=https://crm.example.com/hook
+_NAMED = re.compile(r"([A-Za-z0-9_-]+)=(https?://.+)")
+
+
+def webhook_channel(entry):
+    """
+    Определяет имя канала и адрес для адреса из настройки ZEN_CAT_WEBHOOK_URLS.
+
+    Args:
+        entry (str): Адрес или имя=адрес
+
+    Returns:
+        tuple: (имя канала вида webhook:<имя>, адрес)
+    """
+    match = _NAMED.fullmatch(entry)
+    if match:
+        name, url = match.groups()
+    else:
+        name, url = hashlib.sha256(entry.encode("utf-8")).hexdigest()[:12], entry
+    return f"webhook:{name}", url
+
+
+class WebhookSender:
+    """
+    Отправитель канала webhook для одного адреса внешней системы.
+
+    Атрибуты:
+        url (str): Адрес webhook
+        batch (int): Число заявок в одном запросе (1 — по одной заявке)
+    """
+
+    def __init__(self, url, token=None, batch=None, timeout=None, pool_size=None, transport=None):
+        """
+        Инициализирует отправителя и пул соединений.
+
+        Args:
+            url (str): Адрес webhook
+            token (str): Токен для заголовка Authorization (по умолчанию config.WEBHOOK_TOKEN)
+            batch (int): Число заявок в одном запросе (по умолчанию config.WEBHOOK_BATCH)
+            timeout (float): Таймаут запроса в секундах (по умолчанию config.WEBHOOK_TIMEOUT)
+            pool_size (int): Число одновременных запросов и keep-alive соединений
+                (по умолчанию config.WEBHOOK_POOL_SIZE)
+            transport (httpx.BaseTransport): Транспорт httpx (для подмены в бенчмарках)
+        """
+        self.url = url
+        self.batch = batch or config.WEBHOOK_BATCH
+        pool_size = pool_size or config.WEBHOOK_POOL_SIZE
+        token = config.WEBHOOK_TOKEN if token is None else token
+        headers = {"Authorization": f"Bearer {token}"} if token else {}
+        self._client = httpx.Client(
+            headers=headers,
+            timeout=timeout or config.WEBHOOK_TIMEOUT,
+            limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size),
+            transport=transport,
+        )
+        self._executor = ThreadPoolExecutor(pool_size, thread_name_prefix="zen-cat-webhook")
+        self._lock = threading.Lock()
+
+        # Метрики
+        self.requests = 0
+        self.succeeded = 0
+        self.failed = 0
+        self._latencies = collections.deque(maxlen=1024)
+
+    def _payload(self, items):
+        """
+        Формирует тело запроса.
+
+        Args:
+            items (list): Записи заявок
+
+        Returns:
+            dict: Одна заявка или {"submissions": [...]} для пакетного режима
+        """
+        submissions = [{name: item[name] for name in _FIELDS} for item in items]
+        return submissions[0] if self.batch == 1 else {"submissions": submissions}
+
+    def _post(self, items):
+        """
+        Отправляет один запрос.
+
+        Args:
+            items (list): Записи заявок запроса
+
+        Returns:
+            str: Текст ошибки или None, если внешняя система приняла заявки
+        """
+        started = time.perf_counter()
+        try:
+            response = self._client.post(
+                self.url,
+                json=self._payload(items),
+                # Повторная отправка тех же заявок не должна создавать дубликаты в CRM
+                headers={"Idempotency-Key": ",".join(str(item["id"]) for item in items)},
+            )
+            error = None if response.is_success else f"HTTP {response.status_code}"
+        except httpx.HTTPError as exc:
+            error = repr(exc)
+        with self._lock:
+            self.requests += 1
+            if error is None:
+                self.succeeded += 1
+                self._latencies.append(time.perf_counter() - started)
+            else:
+                self.failed += 1
+        return error
+
+    def send_batch(self, items):
+        """
+        Отправляет пачку заявок запросами по batch заявок.
+
+        Args:
+            items (list): Записи заявок
+
+        Returns:
+            list: Ошибки по заявкам (None — заявка доставлена)
+        """
+        chunks = [items[i:i + self.batch] for i in range(0, len(items), self.batch)]
+        errors = []
+        for chunk, error in zip(chunks, self._executor.map(self._post, chunks)):
+            errors.extend([error] * len(chunk))
+        return errors
+
+    def stats(self):
+        """
+        Возвращает метрики запросов к внешней системе.
+
+        Returns:
+            dict: Узел внешней системы (без пути и параметров адреса, где может быть токен),
+                счетчики запросов и задержка успешного запроса (p50/p95, секунды)
+        """
+        latencies = sorted(self._latencies)
+        return {
+            "host": urllib.parse.urlsplit(self.url).hostname,
+            "requests": self.requests,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "request_latency_p50": latencies[len(latencies) // 2] if latencies else 0.0,
+            "request_latency_p95": latencies[int(len(latencies) * 0.95)] if latencies else 0.0,
+        }
+
+    def close(self):
+        """
+        Останавливает потоки отправки и закрывает соединения.
+        """
+        self._executor.shutdown(wait=True)
+        self._client.close()
@@ -0,0 +1,97 @@
+"""
+Модуль привязок текстов для приложения Zen-кот.
+
+Содержит класс TextBindings, который при построении интерфейса запоминает,
+какое свойство какого элемента берет значение из каталога локализации.
+При смене языка реестр обновляет только изменившиеся свойства и возвращает
+список затронутых элементов для одного точечного обновления страницы.
+"""
+
+from zen_cat.utils.localization import Localization
+
+
+class TextBindings:
+    """
+    Реестр привязок (элемент, свойство, ключ каталога) для одной сессии.
+
+    Атрибуты:
+        localization (Localization): Объект локализации сессии
+    """
+
+    def __init__(self, localization: Localization):
+        """
+        Инициализирует пустой реестр привязок.
+
+        Args:
+            localization (Localization): Объект локализации сессии
+        """
+        self.localization = localization
+        self._bindings = []
+
+    def __len__(self):
+        return len(self._bindings)
+
+    def _resolve(self, key):
+        """
+        Получает значение для ключа привязки.
+
+        Args:
+            key (str | callable): Ключ каталога или функция, вычисляющая значение
+                по объекту локализации (например, код текущего языка)
+
+        Returns:
+            Значение свойства на текущем языке
+        """
+        if callable(key):
+            return key(self.localization)
+        return self.localization.get(key)
+
+    def bind(self, control, prop, key):
+        """
+        Привязывает свойство элемента к ключу каталога и сразу задает его значение.
+
+        Args:
+            control (ft.Control): Элемент интерфейса
+            prop (str): Имя свойства (value, label, hint_text, text, tooltip...)
+            key (str | callable): Ключ каталога или функция от объекта локализации
+
+        Returns:
+            ft.Control: Тот же элемент, чтобы привязку можно было делать при создании
+        """
+        setattr(control, prop, self._resolve(key))
+        self._bindings.append((control, prop, key))
+        return control
+
+    def add(self, control, prop, key):
+        """
+        Регистрирует привязку, не меняя текущего значения свойства.
+
+        Используется для элементов, скопированных из шаблона, где значение
+        уже соответствует текущему языку.
+
+        Args:
+            control (ft.Control): Элемент интерфейса
+            prop (str): Имя свойства
+            key (str | callable): Ключ каталога или функция от объекта локализации
+        """
+        self._bindings.append((control, prop, key))
+
+    def __iter__(self):
+        return iter(self._bindings)
+
+    def apply(self):
+        """
+        Применяет текущий язык ко всем привязкам.
+
+        Изменяются только свойства, значение которых отличается от нового.
+
+        Returns:
+            list: Элементы, у которых изменилось хотя бы одно свойство
+        """
+        changed = {}
+        for control, prop, key in self._bindings:
+            value = self._resolve(key)
+            if getattr(control, prop) != value:
+                setattr(control, prop, value)
+                changed[id(control)] = control
+        return list(changed.values())
@@ -0,0 +1,367 @@
+"""
+Модуль каталогов локализации для приложения Zen-кот.
+
+Тексты хранятся во внешних JSON-файлах (zen_cat/locales/<язык>.json).
+Шаг компиляции собирает их в компактный бинарный индекс, который открывается
+через mmap: страницы файла разделяются всеми процессами-воркерами через
+страничный кэш ОС, а тексты конкретного языка декодируются только при первом запросе.
+
+Формат индекса (все числа little-endian):
+    заголовок:       magic b"ZCAT", версия (H), количество языков (H)
+    таблица языков:  код языка (8s), смещение блока (I), количество записей (I)
+    блок языка:      записи (смещение ключа, длина ключа, смещение текста, длина текста) (4I),
+                     затем UTF-8 строки; смещения отсчитываются от начала строк блока
+
+Служебные ключи, начинающиеся с "@", не являются текстами: "@fallback" задаёт
+резервный язык для отсутствующих ключей.
+
+Компиляция вручную:
+    python -m zen_cat.utils.catalog
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+import threading
+from collections import OrderedDict
+from types import MappingProxyType
+
+from zen_cat import config
+
+
+# Каталог с исходными JSON-файлами и путь к скомпилированному индексу
+LOCALES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "locales")
+INDEX_PATH = os.path.join(LOCALES_DIR, "catalog.idx")
+
+_MAGIC = b"ZCAT"
+_VERSION = 1
+_HEADER = struct.Struct("<4sHH")
+_LANG_ENTRY = struct.Struct("<8sII")
+_TEXT_ENTRY = struct.Struct("<4I")
+
+
+def _source_files(source_dir):
+    """
+    Возвращает исходные JSON-файлы каталога.
+
+    Args:
+        source_dir (str): Каталог с JSON-файлами
+
+    Returns:
+        dict: Словарь {язык: путь к файлу}
+    """
+    return {
+        name[:-len(".json")]: os.path.join(source_dir, name)
+        for name in sorted(os.listdir(source_dir))
+        if name.endswith(".json")
+    }
+
+
+def load_source(path):
+    """
+    Читает тексты одного языка из JSON-файла.
+
+    Args:
+        path (str): Путь к JSON-файлу
+
+    Returns:
+        dict: Словарь {ключ: текст}
+    """
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compile_catalogs(source_dir=LOCALES_DIR, index_path=INDEX_PATH):
+    """
+    Компилирует JSON-каталоги в бинарный индекс.
+
+    Файл записывается во временный путь и атомарно подменяется, поэтому
+    процессы, уже открывшие старый индекс, продолжают работать без ошибок.
+
+    Args:
+        source_dir (str): Каталог с JSON-файлами
+        index_path (str): Путь к создаваемому индексу
+
+    Returns:
+        str: Путь к созданному индексу
+    """
+    blocks = []
+    for lang, path in _source_files(source_dir).items():
+        code = lang.encode("ascii")
+        if len(code) > 8:
+            raise ValueError(f"Слишком длинный код языка: {lang}")
+
+        entries = []
+        strings = bytearray()
+        for key, value in load_source(path).items():
+            key_bytes = key.encode("utf-8")
+            value_bytes = str(value).encode("utf-8")
+            entries.append((len(strings), len(key_bytes), len(strings) + len(key_bytes), len(value_bytes)))
+            strings += key_bytes + value_bytes
+
+        table = b"".join(_TEXT_ENTRY.pack(*entry) for entry in entries)
+        blocks.append((code, len(entries), table + bytes(strings)))
+
+    offset = _HEADER.size + _LANG_ENTRY.size * len(blocks)
+    header = [_HEADER.pack(_MAGIC, _VERSION, len(blocks))]
+    for code, count, block in blocks:
+        header.append(_LANG_ENTRY.pack(code, offset, count))
+        offset += len(block)
+
+    tmp_path = f"{index_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(b"".join(header))
+        for _, _, block in blocks:
+            f.write(block)
+    os.replace(tmp_path, index_path)
+    return index_path
+
+
+def _estimate_size(texts):
+    """
+    Оценивает объём памяти, занимаемый словарём текстов.
+
+    Args:
+        texts (dict): Словарь {ключ: текст}
+
+    Returns:
+        int: Примерный размер в байтах
+    """
+    return sys.getsizeof(texts) + sum(sys.getsizeof(key) + sys.getsizeof(value) for key, value in texts.items())
+
+
+def _is_stale(source_dir, index_path):
+    """
+    Проверяет, нужно ли перекомпилировать индекс.
+
+    Args:
+        source_dir (str): Каталог с JSON-файлами
+        index_path (str): Путь к индексу
+
+    Returns:
+        bool: True, если индекса нет или он старше исходных файлов
+    """
+    try:
+        index_mtime = os.path.getmtime(index_path)
+    except OSError:
+        return True
+    return any(os.path.getmtime(path) > index_mtime for path in _source_files(source_dir).values())
+
+
+class CatalogIndex:
+    """
+    Скомпилированный индекс каталогов, открытый через mmap.
+
+    Атрибуты:
+        languages (dict): Словарь {язык: (смещение блока, количество записей)}
+    """
+
+    def __init__(self, index_path):
+        """
+        Открывает индекс и читает таблицу языков.
+
+        Args:
+            index_path (str): Путь к скомпилированному индексу
+        """
+        with open(index_path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, count = _HEADER.unpack_from(self._mmap, 0)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError(f"Неподдерживаемый формат индекса: {index_path}")
+
+        self.languages = {}
+        for i in range(count):
+            code, offset, entries = _LANG_ENTRY.unpack_from(self._mmap, _HEADER.size + i * _LANG_ENTRY.size)
+            self.languages[code.rstrip(b"\0").decode("ascii")] = (offset, entries)
+
+    def load(self, lang):
+        """
+        Декодирует тексты одного языка из индекса.
+
+        Args:
+            lang (str): Код языка
+
+        Returns:
+            dict: Словарь {ключ: текст}
+        """
+        offset, count = self.languages[lang]
+        data = self._mmap
+        strings = offset + _TEXT_ENTRY.size * count
+        texts = {}
+        for key_off, key_len, value_off, value_len in _TEXT_ENTRY.iter_unpack(data[offset:strings]):
+            key = data[strings + key_off:strings + key_off + key_len].decode("utf-8")
+            texts[key] = data[strings + value_off:strings + value_off + value_len].decode("utf-8")
+        return texts
+
+
+class Catalog:
+    """
+    Общий для процесса каталог текстов с ленивой загрузкой языков.
+
+    Язык читается из индекса при первом обращении и дальше разделяется
+    всеми сессиями в виде неизменяемого словаря. Цепочка резервных языков
+    (служебный ключ "@fallback" в JSON-файле, например de → en) сливается в этот
+    словарь один раз при загрузке, поэтому поиск текста — всегда одно обращение
+    к словарю. Редко используемые языки вытесняются из кэша (LRU), когда суммарный
+    объём загруженных текстов превышает max_bytes.
+
+    Атрибуты:
+        max_bytes (int): Ограничение памяти под загруженные языки
+        evictions (int): Количество вытесненных из кэша языков
+    """
+
+    def __init__(self, source_dir=LOCALES_DIR, index_path=INDEX_PATH, max_bytes=None):
+        """
+        Инициализирует каталог без чтения каких-либо текстов.
+
+        Args:
+            source_dir (str): Каталог с JSON-файлами
+            index_path (str): Путь к скомпилированному индексу
+            max_bytes (int): Ограничение памяти под загруженные языки
+                (по умолчанию config.LOCALE_CACHE_BYTES)
+        """
+        self._source_dir = source_dir
+        self._index_path = index_path
+        self._index = None
+        self._sources = None
+        self._languages = None
+        self._texts = OrderedDict()
+        self._sizes = {}
+        self._lock = threading.Lock()
+        self.max_bytes = config.LOCALE_CACHE_BYTES if max_bytes is None else max_bytes
+        self.evictions = 0
+
+    def _open(self):
+        """
+        Открывает индекс, при необходимости перекомпилировав его.
+
+        Если индекс нельзя записать (например, каталог пакета доступен только
+        для чтения), тексты читаются напрямую из JSON-файлов.
+        """
+        if self._languages is not None:
+            return
+        try:
+            if _is_stale(self._source_dir, self._index_path):
+                compile_catalogs(self._source_dir, self._index_path)
+            self._index = CatalogIndex(self._index_path)
+            self._languages = tuple(self._index.languages)
+        except OSError:
+            self._sources = _source_files(self._source_dir)
+            self._languages = tuple(self._sources)
+
+    def _read(self, lang):
+        """
+        Читает тексты одного языка без учёта резервных языков.
+
+        Args:
+            lang (str): Код языка
+
+        Returns:
+            dict: Словарь {ключ: текст}, включая служебные ключи "@..."
+        """
+        if lang not in self._languages:
+            raise KeyError(lang)
+        if self._index is not None:
+            return self._index.load(lang)
+        return load_source(self._sources[lang])
+
+    def _merge(self, lang):
+        """
+        Собирает тексты языка, подставляя недостающие ключи из цепочки резервных языков.
+
+        Args:
+            lang (str): Код языка
+
+        Returns:
+            dict: Словарь {ключ: текст} без служебных ключей
+        """
+        seen = set()
+        layers = []
+        current = lang
+        while current and current not in seen:
+            seen.add(current)
+            raw = self._read(current)
+            layers.append(raw)
+            current = raw.get("@fallback")
+
+        merged = {}
+        for raw in reversed(layers):
+            merged.update(raw)
+        return {key: value for key, value in merged.items() if not key.startswith("@")}
+
+    def _evict(self, keep):
+        """
+        Вытесняет давно не используемые языки, пока кэш превышает ограничение.
+
+        Args:
+            keep (str): Язык, который нельзя вытеснять (только что загруженный)
+        """
+        total = sum(self._sizes.values())
+        for lang in list(self._texts):
+            if total <= self.max_bytes:
+                break
+            if lang == keep:
+                continue
+            del self._texts[lang]
+            total -= self._sizes.pop(lang)
+            self.evictions += 1
+
+    def languages(self):
+        """
+        Возвращает список доступных языков без загрузки текстов.
+
+        Returns:
+            tuple: Коды доступных языков
+        """
+        if self._languages is None:
+            with self._lock:
+                self._open()
+        return self._languages
+
+    def loaded(self):
+        """
+        Возвращает список загруженных языков, от давно использованного к недавнему.
+
+        Returns:
+            tuple: Коды загруженных языков
+        """
+        return tuple(self._texts)
+
+    def stats(self):
+        """
+        Возвращает статистику кэша языков.
+
+        Returns:
+            dict: Количество загруженных языков, занятые байты и число вытеснений
+        """
+        return {
+            "loaded": len(self._texts),
+            "bytes": sum(self._sizes.values()),
+            "max_bytes": self.max_bytes,
+            "evictions": self.evictions,
+        }
+
+    def __contains__(self, lang):
+        return lang in self.languages()
+
+    def __getitem__(self, lang):
+        with self._lock:
+            texts = self._texts.get(lang)
+            if texts is not None:
+                self._texts.move_to_end(lang)
+                return texts
+
+            self._open()
+            merged = self._merge(lang)
+            texts = MappingProxyType(merged)
+            self._texts[lang] = texts
+            self._sizes[lang] = _estimate_size(merged)
+            self._evict(keep=lang)
+            return texts
+
+
+if __name__ == "__main__":
+    print(compile_catalogs())
@@ -0,0 +1,261 @@
+"""
+Модуль компиляции раскладки интерфейса для приложения Zen-кот.
+
+Компоненты задают отступы пустыми контейнерами-распорками
+(ft.Container(height=...) в колонке, ft.Container(width=...) в строке).
+Каждая распорка — отдельный элемент, который сервер сериализует, сравнивает
+и отправляет в каждой сессии. compact() убирает распорки из готового дерева,
+не меняя раскладку:
+
+- если все промежутки в колонке (строке) одинаковы — они задаются через spacing;
+- иначе spacing становится равным наименьшему промежутку, а остаток переносится
+  в margin соседнего контейнера (сначала предыдущего, затем следующего);
+- распорки в начале и в конце переносятся в padding родительского контейнера,
+  а если родитель не обычный контейнер — сливаются в одну распорку, высота
+  которой учитывает новый spacing;
+- растягивающаяся распорка между двумя элементами заменяется выравниванием
+  SPACE_BETWEEN.
+
+Распорки, которые нельзя убрать без изменения раскладки (например, между двумя
+текстами, у которых нет margin), остаются на месте. measure() возвращает число
+элементов и размер сериализованного дерева — по нему проверяется бюджет
+компонентов (benchmarks/layout_budget.py).
+"""
+
+import dataclasses
+import json
+
+import flet as ft
+from flet.core.protocol import CommandEncoder
+
+
+# Интервал между элементами Column и Row, если spacing не задан (как в Flet)
+_DEFAULT_SPACING = 10
+
+# Свойства контейнера, при которых он уже не пустая распорка
+_SPACER_FIELDS = (
+    "content", "padding", "margin", "alignment", "bgcolor", "gradient", "border",
+    "border_radius", "image", "shape", "blur", "tooltip", "data", "key",
+)
+
+_SPREAD = {ft.MainAxisAlignment.SPACE_BETWEEN, ft.MainAxisAlignment.SPACE_AROUND, ft.MainAxisAlignment.SPACE_EVENLY}
+
+
+def _is_spacer(control, prop):
+    """
+    Проверяет, что элемент — пустой контейнер, задающий только одно свойство.
+
+    Args:
+        control (ft.Control): Элемент
+        prop (str): Свойство распорки (height, width или expand)
+
+    Returns:
+        bool: True для распорки
+    """
+    if type(control) is not ft.Container or control.visible is False:
+        return False
+    if set(control._Control__attrs) != {prop}:
+        return False
+    return not control.shadow and all(getattr(control, name) is None for name in _SPACER_FIELDS)
+
+
+def _sides(value, cls):
+    """
+    Приводит отступы (None, число, Padding или Margin) к объекту cls.
+
+    Args:
+        value: Отступы
+        cls (type): ft.Padding или ft.Margin
+
+    Returns:
+        Отступы в виде объекта cls
+    """
+    if value is None:
+        return cls(0, 0, 0, 0)
+    if isinstance(value, (int, float)):
+        return cls(value, value, value, value)
+    return value
+
+
+def _grow(control, prop, side, amount):
+    """
+    Увеличивает отступ элемента с одной стороны (объект отступов заменяется новым).
+
+    Args:
+        control (ft.Container): Контейнер
+        prop (str): Свойство (padding или margin)
+        side (str): Сторона (left, top, right, bottom)
+        amount (float): На сколько увеличить
+    """
+    cls = ft.Padding if prop == "padding" else ft.Margin
+    sides = _sides(getattr(control, prop), cls)
+    setattr(control, prop, dataclasses.replace(sides, **{side: getattr(sides, side) + amount}))
+
+
+def compact(control):
+    """
+    Убирает распорки из дерева элементов (на месте).
+
+    Args:
+        control (ft.Control): Корневой элемент
+
+    Returns:
+        ft.Control: Тот же элемент
+    """
+    _compact(control, None)
+    return control
+
+
+def _compact(control, parent):
+    """
+    Обходит дерево снизу вверх и сворачивает распорки в колонках и строках.
+
+    Args:
+        control (ft.Control): Элемент
+        parent (ft.Control): Родительский элемент или None
+    """
+    for child in control._get_children():
+        _compact(child, control)
+    if type(control) in (ft.Column, ft.Row) and not getattr(control, "wrap", False):
+        _fold_spring(control)
+        _fold(control, parent)
+
+
+def _fold_spring(flex):
+    """
+    Заменяет растягивающуюся распорку между двумя элементами выравниванием SPACE_BETWEEN.
+
+    Args:
+        flex (ft.Column | ft.Row): Колонка или строка
+    """
+    controls = flex.controls
+    if len(controls) == 3 and _is_spacer(controls[1], "expand") and not any(
+        _is_spacer(control, "expand") for control in (controls[0], controls[2])
+    ):
+        flex.alignment = ft.MainAxisAlignment.SPACE_BETWEEN
+        flex.controls = [controls[0], controls[2]]
+
+
+def _fold(flex, parent):
+    """
+    Сворачивает распорки колонки или строки в spacing, margin соседей
+    и padding родительского контейнера.
+
+    Args:
+        flex (ft.Column | ft.Row): Колонка или строка
+        parent (ft.Control): Родительский элемент или None
+    """
+    if flex.alignment in _SPREAD:
+        return  # Свободное место делится между элементами: промежутки зависят от их числа
+    column = type(flex) is ft.Column
+    prop, before, after = ("height", "top", "bottom") if column else ("width", "left", "right")
+    spacing = _DEFAULT_SPACING if flex.spacing is None else flex.spacing
+
+    # Делим видимые элементы на содержательные и распорки перед каждым из них
+    items, gaps, current = [], [], []
+    for control in flex.controls:
+        if control.visible is False:
+            continue
+        if _is_spacer(control, prop):
+            current.append(control)
+        else:
+            items.append(control)
+            gaps.append(current)
+            current = []
+    trailing = current
+    if not items or not (trailing or any(gaps)):
+        return
+    leading = gaps[0]
+
+    def size(spacers):
+        return sum(getattr(spacer, prop) for spacer in spacers) + spacing * len(spacers)
+
+    # Промежутки между соседними элементами и новый spacing — наименьший из них
+    totals = [spacing + size(spacers) for spacers in gaps[1:]]
+    new_spacing = min(totals) if totals else spacing
+
+    def placement(index, total):
+        # Как получить промежуток перед items[index] при новом spacing
+        extra = total - new_spacing
+        if not extra:
+            return "none"
+        if type(items[index - 1]) is ft.Container:
+            return "previous"
+        if type(items[index]) is ft.Container:
+            return "next"
+        return "spacer" if total - 2 * new_spacing >= 0 else None
+
+    fold_edges = (
+        type(parent) is ft.Container and parent.content is flex
+        and parent.alignment is None and getattr(parent, prop) is None
+    )
+    # Оставшаяся на краю распорка вместе с новым spacing должна дать прежний отступ
+    kept_edges = [] if fold_edges else [spacers for spacers in (leading, trailing) if spacers]
+    plan = [placement(index, total) for index, total in enumerate(totals, start=1)]
+    if None in plan or any(size(spacers) < new_spacing for spacers in kept_edges):
+        new_spacing = spacing
+        plan = [placement(index, total) for index, total in enumerate(totals, start=1)]
+
+    def edge(spacers):
+        # Распорки края сливаются в одну: ее высота плюс новый spacing равны прежнему отступу
+        spacer = spacers[0]
+        setattr(spacer, prop, size(spacers) - new_spacing)
+        return spacer
+
+    result = []
+    if leading and fold_edges:
+        _grow(parent, "padding", before, size(leading))
+    elif leading:
+        result.append(edge(leading))
+    result.append(items[0])
+    for index, (total, how) in enumerate(zip(totals, plan), start=1):
+        extra = total - new_spacing
+        if how == "previous":
+            _grow(items[index - 1], "margin", after, extra)
+        elif how == "next":
+            _grow(items[index], "margin", before, extra)
+        elif how == "spacer":
+            spacer = gaps[index][0]
+            setattr(spacer, prop, total - 2 * new_spacing)
+            result.append(spacer)
+        result.append(items[index])
+    if trailing and fold_edges:
+        _grow(parent, "padding", after, size(trailing))
+    elif trailing:
+        result.append(edge(trailing))
+
+    # Скрытые элементы возвращаются на свои места относительно соседей
+    hidden = [control for control in flex.controls if control.visible is False]
+    if hidden:
+        order = {id(control): position for position, control in enumerate(flex.controls)}
+        result = sorted(result + hidden, key=lambda control: order.get(id(control), -1))
+    flex.spacing = new_spacing
+    flex.controls = result
+
+
+def count_controls(control):
+    """
+    Считает элементы в дереве, начиная с указанного.
+
+    Args:
+        control (ft.Control): Корневой элемент
+
+    Returns:
+        int: Количество элементов, включая корневой
+    """
+    return 1 + sum(count_controls(child) for child in control._get_children())
+
+
+def measure(control):
+    """
+    Измеряет дерево элементов так, как его увидит клиент при добавлении на страницу.
+
+    Args:
+        control (ft.Control): Корневой элемент (еще не добавленный на страницу)
+
+    Returns:
+        dict: Число элементов (controls) и размер команд добавления в JSON (bytes)
+    """
+    commands = control._build_add_commands()
+    payload = json.dumps(commands, cls=CommandEncoder, separators=(",", ":"))
+    return {"controls": count_controls(control), "bytes": len(payload.encode("utf-8"))}
@@ -1,104 +1,52 @@
 """
 Модуль локализации для приложения Zen-кот.
 
-Содержит класс Localization, который предоставляет функционал для переключения 
-между русским и английским языками и получения текстов на выбранном языке.
+Содержит общий для всего процесса каталог текстов и класс Localization,
+который предоставляет функционал для переключения между доступными языками
+и получения текстов на выбранном языке.
 """
 
+from zen_cat.utils.catalog import Catalog
+
+
+# Каталог текстов общий для всего процесса; языки загружаются при первом обращении
+CATALOG = Catalog()
+
 
 class Localization:
     """
     Класс для управления локализацией приложения на разных языках.
+
+    Объект хранит только текущий язык и ссылку на тексты этого языка в общем
+    каталоге CATALOG, поэтому создание его для каждой сессии почти ничего не стоит.
     
     Атрибуты:
-        lang (str): Текущий выбранный язык (ru или en)
-        _texts (dict): Словарь с текстами для всех поддерживаемых языков
+        lang (str): Текущий выбранный язык (код языка, например ru или en)
+        _texts (Mapping): Тексты текущего языка из общего каталога
     """
+
+    __slots__ = ("_lang", "_texts")
     
     def __init__(self, default_lang="ru"):
         """
         Инициализирует объект локализации с языком по умолчанию.
         
         Args:
-            default_lang (str): Язык по умолчанию (ru или en)
+            default_lang (str): Язык по умолчанию (код языка, например ru или en)
         """
         self.lang = default_lang
-        self._texts = {
-            "ru": {
-                # Хедер
-                "language_switch": "EN",
-                
-                # Первый экран
-                "main_title": "ИТ, КОТОРОЕ НЕ ТРЕВОЖИТ",
-                "main_subtitle": "Минимализм. Спокойствие. Надёжность.",
-                
-                # Блок услуг
-                "services_title": "Наши услуги",
-                "service_1_title": "Разработка",
-                "service_1_desc": "Создаем минималистичные и функциональные приложения, не перегруженные деталями.",
-                "service_2_title": "Дизайн",
-                "service_2_desc": "Проектируем интерфейсы, которые не отвлекают и помогают сосредоточиться.",
-                "service_3_title": "Консалтинг",
-                "service_3_desc": "Помогаем упростить процессы и убрать всё лишнее из ваших проектов.",
-                "service_4_title": "Поддержка",
-                "service_4_desc": "Обеспечиваем стабильную и спокойную работу ваших сервисов 24/7.",
-                
-                # Блок о нас
-                "about_title": "О нас",
-                "about_text": "Мы — команда разработчиков и дизайнеров, которые верят, что технологии должны успокаивать, а не тревожить. Наша миссия — создавать цифровые продукты, которые уменьшают информационный шум и помогают сосредоточиться на важном.",
-                
-                # Форма обратной связи
-                "contact_title": "Оставить заявку",
-                "name_label": "Имя",
-                "email_label": "Email",
-                "message_label": "Сообщение",
-                "submit_button": "Отправить",
-                "form_success": "Спасибо! Мы свяжемся с вами в ближайшее время.",
-                "name_placeholder": "Ваше имя",
-                "email_placeholder": "Ваш email",
-                "message_placeholder": "Ваше сообщение",
-                
-                # Футер
-                "copyright": "© 2025 Zen-кот. Все права защищены."
-            },
-            "en": {
-                # Header
-                "language_switch": "RU",
-                
-                # First screen
-                "main_title": "IT THAT DOESN'T DISTURB",
-                "main_subtitle": "Minimalism. Calm. Reliability.",
-                
-                # Services block
-                "services_title": "Our Services",
-                "service_1_title": "Development",
-                "service_1_desc": "We create minimalist and functional applications that aren't overloaded with details.",
-                "service_2_title": "Design",
-                "service_2_desc": "We design interfaces that don't distract and help you focus.",
-                "service_3_title": "Consulting",
-                "service_3_desc": "We help simplify processes and remove everything unnecessary from your projects.",
-                "service_4_title": "Support",
-                "service_4_desc": "We ensure stable and calm operation of your services 24/7.",
-                
-                # About us block
-                "about_title": "About Us",
-                "about_text": "We are a team of developers and designers who believe that technology should calm, not disturb. Our mission is to create digital products that reduce information noise and help focus on what's important.",
-                
-                # Contact form
-                "contact_title": "Get in Touch",
-                "name_label": "Name",
-                "email_label": "Email",
-                "message_label": "Message",
-                "submit_button": "Submit",
-                "form_success": "Thank you! We'll get back to you soon.",
-                "name_placeholder": "Your name",
-                "email_placeholder": "Your email",
-                "message_placeholder": "Your message",
-                
-                # Footer
-                "copyright": "© 2025 Zen-cat. All rights reserved."
-            }
-        }
+
+    @property
+    def lang(self):
+        """
+        str: Текущий выбранный язык.
+        """
+        return self._lang
+
+    @lang.setter
+    def lang(self, value):
+        self._texts = CATALOG[value]
+        self._lang = value
     
     def get(self, key):
         """
@@ -110,29 +58,41 @@ class Localization:
         Returns:
             str: Текст на текущем языке или ключ, если текст не найден
         """
-        return self._texts[self.lang].get(key, key)
+        return self._texts.get(key, key)
     
     def set_lang(self, lang):
         """
         Устанавливает текущий язык.
         
         Args:
-            lang (str): Язык для установки ('ru' или 'en')
+            lang (str): Язык для установки (код языка из CATALOG.languages())
             
         Returns:
             bool: True, если язык был изменен, False в противном случае
         """
-        if lang in self._texts:
+        if lang in CATALOG:
             self.lang = lang
             return True
         return False
     
+    def languages(self):
+        """
+        Возвращает список доступных языков.
+
+        Returns:
+            tuple: Коды доступных языков
+        """
+        return CATALOG.languages()
+    
     def toggle_lang(self):
         """
-        Переключает язык между русским и английским.
+        Переключает язык на следующий из доступных (по кругу).
         
         Returns:
             str: Новый установленный язык
         """
-        self.lang = "en" if self.lang == "ru" else "ru"
-        return self.lang 
\ No newline at end of file
+        languages = CATALOG.languages()
+        position = languages.index(self.lang) if self.lang in languages else -1
+        self.lang = languages[(position + 1) % len(languages)]
+        return self.lang
+ 
\ No newline at end of file
@@ -0,0 +1,266 @@
+"""
+Модуль учета памяти по сессиям для приложения Zen-кот.
+
+В режиме учета (ZEN_CAT_MEMORY_TRACKING=1) запускается tracemalloc, а каждая
+сессия ZenCatApp регистрируется в MemoryTracker:
+- приложение и его компоненты отслеживаются слабыми ссылками, поэтому учет
+  сам по себе не продлевает им жизнь;
+- построение каждого компонента выполняется внутри measure(), которая
+  записывает прирост памяти по tracemalloc за это время — так получается
+  расход памяти сессии по компонентам;
+- при закрытии сессии (событие page close) отмечается время отключения.
+
+Проверка утечек (leaks) после сборки мусора находит сессии, которые отключены
+дольше заданного времени, но объекты которых все еще живы, и показывает, какие
+объекты держат ссылки на приложение.
+
+Вне режима учета measure() возвращает пустой контекст и ничего не стоит.
+"""
+
+import contextlib
+import gc
+import threading
+import time
+import tracemalloc
+import weakref
+
+from zen_cat import config
+
+
+# Атрибуты ZenCatApp, которые отслеживаются как отдельные объекты сессии
+_TRACKED_PARTS = ("page", "header", "contact_form", "scheduler", "bindings")
+
+
+class SessionRecord:
+    """
+    Сведения об одной отслеживаемой сессии.
+
+    Атрибуты:
+        session_id (str): Идентификатор сессии
+        created_at (float): Время создания (time.monotonic)
+        closed_at (float): Время отключения или None
+        components (dict): Прирост памяти при построении компонентов, байт
+        refs (dict): Слабые ссылки на приложение и его части
+    """
+
+    __slots__ = ("session_id", "created_at", "closed_at", "components", "refs")
+
+    def __init__(self, session_id):
+        """
+        Инициализирует запись сессии.
+
+        Args:
+            session_id (str): Идентификатор сессии
+        """
+        self.session_id = session_id
+        self.created_at = time.monotonic()
+        self.closed_at = None
+        self.components = {}
+        self.refs = {}
+
+    def alive(self):
+        """
+        Возвращает имена объектов сессии, которые еще не освобождены.
+
+        Returns:
+            list: Имена живых объектов (app, page, header...)
+        """
+        return [name for name, ref in self.refs.items() if ref() is not None]
+
+
+class MemoryTracker:
+    """
+    Учет памяти и поиск утечек по сессиям.
+
+    Атрибуты:
+        enabled (bool): Включен ли режим учета
+    """
+
+    def __init__(self, enabled=False):
+        """
+        Инициализирует учет (tracemalloc запускается при включении).
+
+        Args:
+            enabled (bool): Включить режим учета
+        """
+        self.enabled = False
+        self.tracked = 0
+        self._sessions = {}
+        self._totals = {}
+        self._lock = threading.Lock()
+        if enabled:
+            self.enable()
+
+    def enable(self):
+        """
+        Включает режим учета и запускает tracemalloc, если он еще не запущен.
+        """
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+        self.enabled = True
+
+    def track(self, app):
+        """
+        Регистрирует сессию приложения.
+
+        Args:
+            app (ZenCatApp): Приложение сессии
+        """
+        if not self.enabled:
+            return
+        record = SessionRecord(str(app.page.session_id))
+        record.refs["app"] = weakref.ref(app)
+        with self._lock:
+            self._sessions[record.session_id] = record
+            self.tracked += 1
+        app.memory_record = record
+
+    def attach(self, app):
+        """
+        Добавляет к учету части приложения, созданные после регистрации.
+
+        Args:
+            app (ZenCatApp): Приложение сессии
+        """
+        record = getattr(app, "memory_record", None)
+        if record is None:
+            return
+        for name in _TRACKED_PARTS:
+            part = getattr(app, name, None)
+            if part is not None:
+                record.refs[name] = weakref.ref(part)
+
+    def measure(self, app, component):
+        """
+        Возвращает контекст, записывающий прирост памяти при построении компонента.
+
+        Args:
+            app (ZenCatApp): Приложение сессии
+            component (str): Имя компонента
+
+        Returns:
+            contextlib.AbstractContextManager: Контекст замера
+        """
+        record = getattr(app, "memory_record", None)
+        if record is None:
+            return contextlib.nullcontext()
+        return self._measure(record, component)
+
+    @contextlib.contextmanager
+    def _measure(self, record, component):
+        """
+        Замеряет прирост памяти по tracemalloc внутри блока.
+
+        При одновременном построении нескольких сессий в прирост попадают
+        и их выделения, поэтому значения по одной сессии приблизительны,
+        а средние по многим сессиям — точны.
+
+        Args:
+            record (SessionRecord): Запись сессии
+            component (str): Имя компонента
+        """
+        before = tracemalloc.get_traced_memory()[0]
+        try:
+            yield
+        finally:
+            delta = tracemalloc.get_traced_memory()[0] - before
+            record.components[component] = record.components.get(component, 0) + delta
+            with self._lock:
+                self._totals[component] = self._totals.get(component, 0) + delta
+
+    def closed(self, app):
+        """
+        Отмечает отключение сессии.
+
+        Args:
+            app (ZenCatApp): Приложение сессии
+        """
+        record = getattr(app, "memory_record", None)
+        if record is not None:
+            record.closed_at = time.monotonic()
+
+    def report(self):
+        """
+        Возвращает сводку расхода памяти по компонентам.
+
+        Returns:
+            dict: Число сессий (всего за время учета, открытых, с живыми объектами),
+                средний прирост памяти на сессию по компонентам и в сумме (байт),
+                текущий и пиковый объем памяти под tracemalloc
+        """
+        with self._lock:
+            records = list(self._sessions.values())
+            count = self.tracked or 1
+            per_component = {component: round(size / count) for component, size in self._totals.items()}
+        current, peak = tracemalloc.get_traced_memory() if tracemalloc.is_tracing() else (0, 0)
+        return {
+            "sessions": self.tracked,
+            "open": sum(1 for record in records if record.closed_at is None),
+            "alive": sum(1 for record in records if record.refs["app"]() is not None),
+            "bytes_per_session": per_component,
+            "bytes_per_session_total": sum(per_component.values()),
+            "traced_current_bytes": current,
+            "traced_peak_bytes": peak,
+        }
+
+    def leaks(self, grace=None):
+        """
+        Находит отключенные сессии, объекты которых не освобождены.
+
+        Перед проверкой выполняется полная сборка мусора. Записи сессий,
+        объекты которых освобождены, удаляются из учета.
+
+        Args:
+            grace (float): Сколько секунд после отключения объекты могут жить
+                (по умолчанию config.MEMORY_LEAK_GRACE)
+
+        Returns:
+            list: Словари с идентификатором сессии, временем после отключения,
+                живыми объектами и типами объектов, ссылающихся на приложение
+        """
+        grace = config.MEMORY_LEAK_GRACE if grace is None else grace
+        gc.collect()
+        now = time.monotonic()
+        found = []
+        with self._lock:
+            for session_id, record in list(self._sessions.items()):
+                alive = record.alive()
+                if not alive:
+                    del self._sessions[session_id]
+                    continue
+                if record.closed_at is None or now - record.closed_at < grace:
+                    continue
+                app = record.refs["app"]()
+                found.append({
+                    "session_id": session_id,
+                    "closed_for_s": round(now - record.closed_at, 1),
+                    "alive": alive,
+                    "referrers": _referrer_types(app) if app is not None else [],
+                })
+        return found
+
+
+def _referrer_types(obj):
+    """
+    Описывает объекты, которые ссылаются на данный (для поиска причины утечки).
+
+    Args:
+        obj: Объект
+
+    Returns:
+        list: Имена типов ссылающихся объектов без повторов
+    """
+    names = []
+    for referrer in gc.get_referrers(obj):
+        name = type(referrer).__qualname__
+        if name == "frame":
+            continue
+        if name == "method":
+            name = f"method {referrer.__func__.__qualname__}"
+        if name not in names:
+            names.append(name)
+    return names
+
+
+# Учет памяти, общий для всех сессий процесса
+MEMORY = MemoryTracker(config.MEMORY_TRACKING)
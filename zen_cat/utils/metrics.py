@@ -0,0 +1,392 @@
+"""
+Модуль метрик приложения Zen-кот в текстовом формате Prometheus.
+
+Счетчики (Counter) и гистограммы (Histogram) обновляются в обработчиках
+событий, поэтому запись в них не берет блокировок: у каждого потока своя
+ячейка значений, в которую пишет только он сам, а при чтении метрик ячейки
+всех потоков суммируются. Блокировка нужна только при первом обращении
+потока к метрике (регистрация его ячейки).
+
+Значения, которые уже считают другие части приложения (сессии, очереди заявок),
+не дублируются: они собираются в момент запроса метрик функциями-сборщиками
+(MetricsRegistry.collector).
+
+Метрики отдаются по HTTP на локальном порту рядом с сервером Flet
+(config.METRICS_HOST:config.METRICS_PORT, путь /metrics).
+"""
+
+import bisect
+import http.server
+import threading
+
+from zen_cat import config
+
+
+# Границы гистограмм длительностей по умолчанию, секунды
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+class _Shards:
+    """
+    Набор ячеек значений по потокам.
+
+    Атрибуты:
+        size (int): Количество значений в ячейке
+    """
+
+    def __init__(self, size):
+        """
+        Инициализирует набор ячеек.
+
+        Args:
+            size (int): Количество значений в ячейке
+        """
+        self.size = size
+        self._local = threading.local()
+        self._cells = []
+        self._lock = threading.Lock()
+
+    def cell(self):
+        """
+        Возвращает ячейку текущего потока (создает ее при первом обращении).
+
+        Returns:
+            list: Значения, в которые пишет только текущий поток
+        """
+        try:
+            return self._local.cell
+        except AttributeError:
+            cell = [0] * self.size
+            with self._lock:
+                self._cells.append(cell)
+            self._local.cell = cell
+            return cell
+
+    def totals(self):
+        """
+        Суммирует ячейки всех потоков (включая завершившиеся).
+
+        Returns:
+            list: Суммы значений
+        """
+        with self._lock:
+            cells = list(self._cells)
+        return [sum(cell[i] for cell in cells) for i in range(self.size)]
+
+
+class Counter:
+    """
+    Монотонно растущий счетчик (с метками или без).
+
+    Атрибуты:
+        name (str): Имя метрики
+        help (str): Описание
+        label_names (tuple): Имена меток
+    """
+
+    kind = "counter"
+
+    def __init__(self, name, help, label_names=()):
+        """
+        Инициализирует счетчик.
+
+        Args:
+            name (str): Имя метрики
+            help (str): Описание
+            label_names (tuple): Имена меток
+        """
+        self.name = name
+        self.help = help
+        self.label_names = tuple(label_names)
+        self._children = {}
+        self._lock = threading.Lock()
+        self._shards = _Shards(1)
+
+    def labels(self, *values):
+        """
+        Возвращает счетчик для значений меток.
+
+        Args:
+            *values (str): Значения меток в порядке label_names
+
+        Returns:
+            Counter: Счетчик без меток
+        """
+        child = self._children.get(values)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(values, Counter(self.name, self.help))
+        return child
+
+    def inc(self, amount=1):
+        """
+        Увеличивает счетчик.
+
+        Args:
+            amount (float): Приращение
+        """
+        self._shards.cell()[0] += amount
+
+    def value(self):
+        """
+        Возвращает текущее значение счетчика без меток.
+
+        Returns:
+            float: Значение
+        """
+        return self._shards.totals()[0]
+
+    def samples(self):
+        """
+        Возвращает значения для вывода.
+
+        Returns:
+            list: Пары (суффикс имени, метки, значение)
+        """
+        if not self.label_names:
+            return [("", {}, self.value())]
+        with self._lock:
+            children = list(self._children.items())
+        return [("", dict(zip(self.label_names, values)), child.value()) for values, child in children]
+
+
+class Histogram:
+    """
+    Гистограмма значений (обычно длительностей в секундах).
+
+    Атрибуты:
+        name (str): Имя метрики
+        help (str): Описание
+        buckets (tuple): Верхние границы корзин по возрастанию
+    """
+
+    kind = "histogram"
+
+    def __init__(self, name, help, buckets=DEFAULT_BUCKETS):
+        """
+        Инициализирует гистограмму.
+
+        Args:
+            name (str): Имя метрики
+            help (str): Описание
+            buckets (tuple): Верхние границы корзин по возрастанию
+        """
+        self.name = name
+        self.help = help
+        self.buckets = tuple(buckets)
+        # Ячейка: число значений по корзинам (последняя — больше всех границ), сумма, количество
+        self._shards = _Shards(len(self.buckets) + 3)
+
+    def observe(self, value):
+        """
+        Учитывает значение.
+
+        Args:
+            value (float): Значение
+        """
+        cell = self._shards.cell()
+        cell[bisect.bisect_left(self.buckets, value)] += 1
+        cell[-2] += value
+        cell[-1] += 1
+
+    def samples(self):
+        """
+        Возвращает значения для вывода (корзины накопительно, как в Prometheus).
+
+        Returns:
+            list: Пары (суффикс имени, метки, значение)
+        """
+        totals = self._shards.totals()
+        samples = []
+        cumulative = 0
+        for bound, count in zip(self.buckets + (float("inf"),), totals):
+            cumulative += count
+            samples.append(("_bucket", {"le": _format_value(bound)}, cumulative))
+        samples.append(("_sum", {}, totals[-2]))
+        samples.append(("_count", {}, totals[-1]))
+        return samples
+
+
+class MetricsRegistry:
+    """
+    Реестр метрик и сборщиков с выводом в текстовом формате Prometheus.
+    """
+
+    def __init__(self):
+        """
+        Инициализирует пустой реестр.
+        """
+        self._metrics = {}
+        self._collectors = []
+        self._lock = threading.Lock()
+        self._server = None
+
+    def counter(self, name, help, label_names=()):
+        """
+        Регистрирует счетчик (или возвращает уже зарегистрированный).
+
+        Args:
+            name (str): Имя метрики
+            help (str): Описание
+            label_names (tuple): Имена меток
+
+        Returns:
+            Counter: Счетчик
+        """
+        with self._lock:
+            return self._metrics.setdefault(name, Counter(name, help, label_names))
+
+    def histogram(self, name, help, buckets=DEFAULT_BUCKETS):
+        """
+        Регистрирует гистограмму (или возвращает уже зарегистрированную).
+
+        Args:
+            name (str): Имя метрики
+            help (str): Описание
+            buckets (tuple): Верхние границы корзин
+
+        Returns:
+            Histogram: Гистограмма
+        """
+        with self._lock:
+            return self._metrics.setdefault(name, Histogram(name, help, buckets))
+
+    def collector(self, collect):
+        """
+        Регистрирует функцию, собирающую метрики в момент запроса.
+
+        Args:
+            collect (callable): Функция без аргументов, возвращающая кортежи
+                (имя, тип gauge/counter, описание, [(метки, значение), ...])
+
+        Returns:
+            callable: Та же функция (можно использовать как декоратор)
+        """
+        with self._lock:
+            self._collectors.append(collect)
+        return collect
+
+    def render(self):
+        """
+        Формирует текст метрик в формате Prometheus.
+
+        Returns:
+            str: Текст метрик
+        """
+        with self._lock:
+            metrics = list(self._metrics.values())
+            collectors = list(self._collectors)
+        lines = []
+        for metric in metrics:
+            _write_header(lines, metric.name, metric.kind, metric.help)
+            for suffix, labels, value in metric.samples():
+                lines.append(_format_sample(metric.name + suffix, labels, value))
+        for collect in collectors:
+            for name, kind, help, samples in collect():
+                _write_header(lines, name, kind, help)
+                for labels, value in samples:
+                    lines.append(_format_sample(name, labels, value))
+        return "\n".join(lines) + "\n"
+
+    def serve(self, port=None, host=None):
+        """
+        Запускает HTTP-сервер метрик в фоновом потоке (повторный вызов ничего не делает).
+
+        Args:
+            port (int): Порт (по умолчанию config.METRICS_PORT; 0 — не запускать)
+            host (str): Адрес (по умолчанию config.METRICS_HOST)
+
+        Returns:
+            http.server.ThreadingHTTPServer: Сервер или None, если он отключен
+        """
+        port = config.METRICS_PORT if port is None else port
+        host = config.METRICS_HOST if host is None else host
+        with self._lock:
+            if self._server is None and port:
+                registry = self
+
+                class Handler(http.server.BaseHTTPRequestHandler):
+                    def do_GET(self):
+                        if self.path.split("?")[0] != "/metrics":
+                            self.send_error(404)
+                            return
+                        body = registry.render().encode("utf-8")
+                        self.send_response(200)
+                        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                        self.send_header("Content-Length", str(len(body)))
+                        self.end_headers()
+                        self.wfile.write(body)
+
+                    def log_message(self, format, *args):
+                        pass
+
+                self._server = http.server.ThreadingHTTPServer((host, port), Handler)
+                self._server.daemon_threads = True
+                threading.Thread(
+                    target=self._server.serve_forever, name="zen-cat-metrics", daemon=True
+                ).start()
+            return self._server
+
+
+def _write_header(lines, name, kind, help):
+    """
+    Добавляет строки HELP и TYPE метрики.
+
+    Args:
+        lines (list): Строки вывода
+        name (str): Имя метрики
+        kind (str): Тип метрики
+        help (str): Описание
+    """
+    lines.append(f"# HELP {name} {help}")
+    lines.append(f"# TYPE {name} {kind}")
+
+
+def _format_value(value):
+    """
+    Форматирует число для вывода.
+
+    Args:
+        value (float): Значение
+
+    Returns:
+        str: Текст значения
+    """
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def _escape(label):
+    """
+    Экранирует значение метки (обратная косая черта, кавычка, перевод строки).
+
+    Args:
+        label: Значение метки
+
+    Returns:
+        str: Экранированный текст
+    """
+    return str(label).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_sample(name, labels, value):
+    """
+    Форматирует строку значения метрики.
+
+    Args:
+        name (str): Имя метрики (с суффиксом)
+        labels (dict): Метки
+        value (float): Значение
+
+    Returns:
+        str: Строка вывода
+    """
+    if labels:
+        text = ",".join(f'{key}="{_escape(label)}"' for key, label in labels.items())
+        name = f"{name}{{{text}}}"
+    return f"{name} {_format_value(value)}"
+
+
+# Метрики, общие для всех сессий процесса
+METRICS = MetricsRegistry()
@@ -0,0 +1,205 @@
+"""
+Модуль ограничения частоты действий для приложения Zen-кот.
+
+RateLimiter — набор «ведер с токенами» по ключам (сессия, адрес клиента).
+На ключ хранятся только два числа: остаток токенов и время последнего
+обращения. Ведро, не использовавшееся дольше времени полного пополнения,
+ничем не отличается от нового, поэтому такие записи удаляются сами
+при следующих обращениях к ограничителю. Нулевая скорость или емкость
+отключает ограничение.
+
+TTLCache — ограниченный по размеру набор ключей со сроком жизни
+(например, хэшей недавних заявок).
+"""
+
+import collections
+import threading
+import time
+
+
+class RateLimiter:
+    """
+    Ограничение частоты по алгоритму token bucket для множества ключей.
+
+    Атрибуты:
+        rate (float): Скорость пополнения, токенов в секунду
+        burst (int): Емкость ведра (сколько действий можно сделать подряд)
+        max_keys (int): Максимальное число отслеживаемых ключей
+        enabled (bool): False, если скорость или емкость равна 0 (ограничения нет)
+    """
+
+    def __init__(self, rate, burst, max_keys=100000):
+        """
+        Инициализирует ограничитель.
+
+        Args:
+            rate (float): Скорость пополнения, токенов в секунду (0 — без ограничения)
+            burst (int): Емкость ведра (0 — без ограничения)
+            max_keys (int): Максимальное число отслеживаемых ключей
+
+        Raises:
+            ValueError: Если скорость или емкость отрицательна
+        """
+        if rate < 0 or burst < 0:
+            raise ValueError(f"Скорость и емкость ограничителя не могут быть отрицательными: {rate}, {burst}")
+        self.rate = rate
+        self.burst = burst
+        self.max_keys = max_keys
+        self.enabled = rate > 0 and burst > 0
+        # Время, за которое пустое ведро наполняется полностью
+        self.idle_ttl = burst / rate if self.enabled else 0.0
+        # Ключ -> [остаток токенов, время последнего обращения]; порядок — по давности обращения
+        self._buckets = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def allow(self, key, now=None):
+        """
+        Расходует токен ключа, если он есть.
+
+        Args:
+            key (str): Ключ (идентификатор сессии, адрес клиента)
+            now (float): Текущее время по time.monotonic() (для бенчмарков)
+
+        Returns:
+            bool: True, если действие разрешено
+        """
+        if not self.enabled:
+            return True
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            self._expire(now)
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = [float(self.burst), now]
+            else:
+                self._buckets.move_to_end(key)
+                bucket[0] = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+                bucket[1] = now
+            if bucket[0] < 1:
+                return False
+            bucket[0] -= 1
+            return True
+
+    def refund(self, key):
+        """
+        Возвращает ключу токен, израсходованный на действие, которое в итоге не состоялось.
+
+        Args:
+            key (str): Ключ
+        """
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is not None:
+                bucket[0] = min(self.burst, bucket[0] + 1)
+
+    def _expire(self, now):
+        """
+        Удаляет ведра, которые уже наполнились бы полностью, и самые старые сверх max_keys.
+
+        Args:
+            now (float): Текущее время
+        """
+        buckets = self._buckets
+        while buckets:
+            key, bucket = next(iter(buckets.items()))
+            if now - bucket[1] < self.idle_ttl and len(buckets) < self.max_keys:
+                break
+            del buckets[key]
+
+    def __len__(self):
+        """
+        Возвращает число отслеживаемых ключей.
+
+        Returns:
+            int: Число ключей
+        """
+        return len(self._buckets)
+
+
+class TTLCache:
+    """
+    Набор ключей со сроком жизни и ограничением размера.
+
+    Атрибуты:
+        ttl (float): Срок жизни ключа в секундах
+        max_size (int): Максимальное число ключей
+    """
+
+    def __init__(self, ttl, max_size=10000):
+        """
+        Инициализирует пустой набор.
+
+        Args:
+            ttl (float): Срок жизни ключа в секундах
+            max_size (int): Максимальное число ключей
+        """
+        self.ttl = ttl
+        self.max_size = max_size
+        # Ключ -> время истечения; срок жизни одинаковый, поэтому порядок вставки совпадает с порядком истечения
+        self._expires = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, key, now=None):
+        """
+        Добавляет ключ, если его еще нет.
+
+        Args:
+            key: Ключ
+            now (float): Текущее время по time.monotonic()
+
+        Returns:
+            bool: True, если ключ добавлен; False, если он уже есть и не истек
+        """
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            self._expire(now)
+            if key in self._expires:
+                return False
+            self._expires[key] = now + self.ttl
+            return True
+
+    def discard(self, key):
+        """
+        Удаляет ключ, если он есть.
+
+        Args:
+            key: Ключ
+        """
+        with self._lock:
+            self._expires.pop(key, None)
+
+    def _expire(self, now):
+        """
+        Удаляет истекшие ключи и самые старые сверх max_size.
+
+        Args:
+            now (float): Текущее время
+        """
+        expires = self._expires
+        while expires:
+            key, expires_at = next(iter(expires.items()))
+            if expires_at > now and len(expires) < self.max_size:
+                break
+            del expires[key]
+
+    def __contains__(self, key):
+        """
+        Проверяет наличие неистекшего ключа.
+
+        Args:
+            key: Ключ
+
+        Returns:
+            bool: True, если ключ есть
+        """
+        expires_at = self._expires.get(key)
+        return expires_at is not None and expires_at > time.monotonic()
+
+    def __len__(self):
+        """
+        Возвращает число хранимых ключей.
+
+        Returns:
+            int: Число ключей
+        """
+        return len(self._expires)
@@ -0,0 +1,197 @@
+"""
+Модуль планировщика обновлений интерфейса для приложения Zen-кот.
+
+Содержит класс UpdateScheduler, который собирает все запросы на обновление
+страницы, сделанные за один проход цикла событий (или за заданное окно времени),
+и отправляет их клиенту одним вызовом page.update().
+
+Также откладывает действия до паузы в серии событий (debounce): например,
+проверка поля запускается, только когда пользователь перестал печатать.
+"""
+
+import threading
+
+import flet as ft
+from flet.core.page import PageDisconnectedException
+
+from zen_cat.utils.tracing import TRACER
+
+
+class UpdateScheduler:
+    """
+    Планировщик обновлений страницы для одной сессии.
+
+    Атрибуты:
+        page (ft.Page): Объект страницы Flet
+        window (float): Окно объединения запросов в секундах (0 — до следующего прохода цикла событий)
+        requested (int): Количество запросов на обновление
+        flushed (int): Количество фактически выполненных обновлений страницы
+        debounced (int): Количество отложенных действий
+        debounce_runs (int): Количество фактически выполненных отложенных действий
+    """
+
+    def __init__(self, page: ft.Page, window=0.0):
+        """
+        Инициализирует планировщик.
+
+        Args:
+            page (ft.Page): Объект страницы Flet
+            window (float): Окно объединения запросов в секундах
+        """
+        self.page = page
+        self.window = window
+        self.requested = 0
+        self.flushed = 0
+        self._controls = {}
+        self._prepare = {}
+        self._done = []
+        self._scheduled = False
+        self._lock = threading.Lock()
+        self.debounced = 0
+        self.debounce_runs = 0
+        self._debounce_handles = {}
+
+    def request(self, *controls, prepare=None, done=None):
+        """
+        Запрашивает обновление элементов страницы.
+
+        Args:
+            *controls (ft.Control): Элементы, которые нужно обновить
+            prepare (callable): Функция, вызываемая один раз перед отправкой
+                и возвращающая дополнительные элементы для обновления
+                (например, TextBindings.apply)
+            done (callable): Функция без аргументов, вызываемая после отправки
+                обновления (например, для замера задержки)
+        """
+        with self._lock:
+            self.requested += 1
+            for control in controls:
+                self._controls[id(control)] = control
+            if prepare is not None:
+                self._prepare[prepare] = None
+            if done is not None:
+                self._done.append(done)
+            if self._scheduled:
+                return
+            self._scheduled = True
+
+        loop = self.page.loop
+        if self.window > 0:
+            loop.call_soon_threadsafe(loop.call_later, self.window, self.flush)
+        else:
+            loop.call_soon_threadsafe(self.flush)
+
+    def flush(self):
+        """
+        Отправляет все накопленные изменения одним обновлением страницы.
+        """
+        with self._lock:
+            controls = self._controls
+            prepare = self._prepare
+            done = self._done
+            self._controls = {}
+            self._prepare = {}
+            self._done = []
+            self._scheduled = False
+
+        for callback in prepare:
+            for control in callback() or ():
+                controls[id(control)] = control
+
+        if controls:
+            try:
+                with TRACER.span("page.update", str(self.page.session_id), controls=len(controls)):
+                    self.page.update(*controls.values())
+            except PageDisconnectedException:
+                return
+            self.flushed += 1
+        for callback in done:
+            callback()
+
+    def debounce(self, key, delay, callback):
+        """
+        Откладывает действие до паузы длиной delay секунд.
+
+        Повторный вызов с тем же ключом до истечения паузы отменяет предыдущее
+        действие, поэтому из серии быстрых событий выполняется только последнее.
+        Действие выполняется в цикле событий страницы.
+
+        Args:
+            key (str): Ключ серии событий (например, имя поля)
+            delay (float): Длительность паузы в секундах
+            callback (callable): Функция без аргументов
+        """
+        self.debounced += 1
+        self.page.loop.call_soon_threadsafe(self._debounce, key, delay, callback)
+
+    def cancel(self, key):
+        """
+        Отменяет отложенное действие ключа, если оно еще не выполнено.
+
+        Args:
+            key (str): Ключ серии событий
+        """
+        self.page.loop.call_soon_threadsafe(self._cancel, key)
+
+    def close(self):
+        """
+        Отменяет все отложенные действия (при закрытии сессии), чтобы таймеры
+        цикла событий не удерживали объекты отключенной сессии.
+        """
+        self.page.loop.call_soon_threadsafe(self._cancel_all)
+
+    def _cancel_all(self):
+        """
+        Отменяет все отложенные действия (выполняется в цикле событий).
+        """
+        for key in list(self._debounce_handles):
+            self._cancel(key)
+
+    def _cancel(self, key):
+        """
+        Отменяет отложенное действие ключа (выполняется в цикле событий).
+
+        Args:
+            key (str): Ключ серии событий
+        """
+        handle = self._debounce_handles.pop(key, None)
+        if handle is not None:
+            handle.cancel()
+
+    def _debounce(self, key, delay, callback):
+        """
+        Переносит отложенное действие ключа (выполняется в цикле событий).
+
+        Args:
+            key (str): Ключ серии событий
+            delay (float): Длительность паузы в секундах
+            callback (callable): Функция без аргументов
+        """
+        self._cancel(key)
+        self._debounce_handles[key] = self.page.loop.call_later(delay, self._run_debounced, key, callback)
+
+    def _run_debounced(self, key, callback):
+        """
+        Выполняет отложенное действие.
+
+        Args:
+            key (str): Ключ серии событий
+            callback (callable): Функция без аргументов
+        """
+        self._debounce_handles.pop(key, None)
+        self.debounce_runs += 1
+        callback()
+
+    def stats(self):
+        """
+        Возвращает счетчики планировщика.
+
+        Returns:
+            dict: Количество запрошенных и выполненных обновлений и отложенных действий
+        """
+        return {
+            "requested": self.requested,
+            "flushed": self.flushed,
+            "debounced": self.debounced,
+            "debounce_runs": self.debounce_runs,
+        }
@@ -0,0 +1,286 @@
+"""
+Модуль поиска по каталогу услуг для приложения Zen-кот.
+
+SearchIndex — обратный индекс по заголовкам и описаниям услуг сразу на
+нескольких языках (по умолчанию ru и en, config.SEARCH_LANGUAGES): посетитель
+находит услугу на любом из них независимо от языка интерфейса.
+
+Слова приводятся к основе простым отсечением окончаний (русские слова —
+по русским окончаниям, остальные — по английским), поэтому «дизайна»
+и «дизайну», «services» и «service» совпадают. Слова запроса сравниваются
+с основами по префиксу, поэтому результаты есть, пока посетитель еще набирает
+слово. Совпадение в заголовке весит
+больше совпадения в описании, точное совпадение основы — больше префиксного;
+результаты должны содержать все слова запроса.
+
+Индекс строится один раз на версию каталога услуг и общий для всех сессий
+процесса (SEARCH). Самые дорогие запросы — из одной буквы, под которые
+подходит заметная часть словаря, — ранжируются заранее при построении
+индекса. Результаты для остальных основ и целых запросов кэшируются, поэтому
+повторные запросы (в том числе из других сессий) почти бесплатны.
+"""
+
+import bisect
+import functools
+import re
+import threading
+
+from zen_cat import config
+from zen_cat.utils.localization import Localization
+
+
+_WORD = re.compile(r"[^\W_]+")
+_CYRILLIC = re.compile(r"[а-я]")
+
+# Окончания, отсекаемые при приведении слова к основе (сначала длинные)
+_RU_ENDINGS = tuple(sorted((
+    "иями", "ями", "ами", "ого", "его", "ому", "ему", "ыми", "ими", "ией",
+    "ешь", "ишь", "ете", "ите", "ия", "ие", "ий", "ии", "ый", "ой", "ая", "яя", "ое", "ее",
+    "ые", "ом", "ем", "ам", "ям", "ах", "ях", "ов", "ев", "ей", "ть", "ет", "ут", "ют",
+    "ит", "ат", "ят", "ую", "юю", "а", "я", "о", "е", "ы", "и", "у", "ю", "ь", "й",
+), key=len, reverse=True))
+_EN_ENDINGS = tuple(sorted((
+    "ational", "ations", "ation", "ments", "ment", "ness", "ings", "ing", "ers", "ies",
+    "ied", "ed", "es", "er", "ly", "s", "e", "y",
+), key=len, reverse=True))
+
+# Наименьшая длина основы после отсечения окончания
+_MIN_STEM = 3
+
+# Вес совпадения в заголовке и в описании; множитель для префиксного совпадения
+_TITLE_WEIGHT = 3.0
+_DESC_WEIGHT = 1.0
+_PREFIX_FACTOR = 0.5
+
+# Сколько основ и запросов хранит кэш индекса
+_CACHE_SIZE = 4096
+
+
+def stem(word):
+    """
+    Приводит слово к основе.
+
+    Args:
+        word (str): Слово в нижнем регистре
+
+    Returns:
+        str: Основа слова
+    """
+    endings = _RU_ENDINGS if _CYRILLIC.search(word) else _EN_ENDINGS
+    for ending in endings:
+        if word.endswith(ending) and len(word) - len(ending) >= _MIN_STEM:
+            return word[:-len(ending)]
+    return word
+
+
+def tokenize(text):
+    """
+    Разбивает текст на основы слов.
+
+    Args:
+        text (str): Текст
+
+    Returns:
+        list: Основы слов в порядке появления
+    """
+    return [stem(word) for word in _WORD.findall(text.lower().replace("ё", "е"))]
+
+
+class SearchIndex:
+    """
+    Обратный индекс услуг.
+
+    Атрибуты:
+        items (tuple): Услуги (ServiceItem) в порядке каталога
+        terms (list): Отсортированный словарь основ
+    """
+
+    def __init__(self, items, catalogs):
+        """
+        Строит индекс.
+
+        Args:
+            items (tuple): Услуги в порядке каталога
+            catalogs (list): Тексты на каждом языке — объекты с методом get(key)
+                (Localization или словарь); отсутствующие тексты пропускаются
+        """
+        self.items = items
+        postings = {}
+        for doc, item in enumerate(items):
+            for catalog in catalogs:
+                for key, weight in ((item.title_key, _TITLE_WEIGHT), (item.desc_key, _DESC_WEIGHT)):
+                    text = catalog.get(key)
+                    if not text or text == key:
+                        continue
+                    for term in tokenize(text):
+                        entry = postings.setdefault(term, {})
+                        if entry.get(doc, 0) < weight:
+                            entry[doc] = weight
+        self.terms = sorted(postings)
+        self._postings = postings
+
+        # Совпадения и готовый порядок для запросов из одной буквы
+        self._letters = {}
+        for term in self.terms:
+            matched = self._letters.setdefault(term[0], {})
+            factor = 1.0 if len(term) == 1 else _PREFIX_FACTOR
+            for doc, weight in postings[term].items():
+                weight *= factor
+                if matched.get(doc, 0) < weight:
+                    matched[doc] = weight
+        self._letters_ranked = {letter: self._order(matched) for letter, matched in self._letters.items()}
+
+        self._matches = functools.lru_cache(maxsize=_CACHE_SIZE)(self._match)
+        self._ranked = functools.lru_cache(maxsize=_CACHE_SIZE)(self._rank)
+
+    def __len__(self):
+        return len(self.items)
+
+    def _match(self, term):
+        """
+        Находит услуги, в текстах которых есть основа, начинающаяся с term.
+
+        Args:
+            term (str): Основа из запроса
+
+        Returns:
+            dict: Лучший вес совпадения по номеру услуги
+        """
+        if len(term) == 1:
+            return self._letters.get(term, {})
+        terms = self.terms
+        start = bisect.bisect_left(terms, term)
+        end = bisect.bisect_left(terms, term + "\uffff", start)
+        if end - start == 1 and terms[start] == term:
+            return self._postings[term]
+        matched = {}
+        for index in range(start, end):
+            factor = 1.0 if terms[index] == term else _PREFIX_FACTOR
+            for doc, weight in self._postings[terms[index]].items():
+                weight *= factor
+                if matched.get(doc, 0) < weight:
+                    matched[doc] = weight
+        return matched
+
+    def _order(self, scores):
+        """
+        Упорядочивает услуги по убыванию веса.
+
+        Args:
+            scores (dict): Вес по номеру услуги
+
+        Returns:
+            tuple: Услуги от лучшей к худшей (при равном весе — в порядке каталога)
+        """
+        docs = sorted(scores)
+        docs.sort(key=scores.__getitem__, reverse=True)  # Сортировка устойчива: порядок каталога сохраняется
+        items = self.items
+        return tuple(items[doc] for doc in docs)
+
+    def _rank(self, terms):
+        """
+        Ранжирует услуги, подходящие под все основы запроса.
+
+        Args:
+            terms (tuple): Основы запроса (без повторов)
+
+        Returns:
+            tuple: Услуги от лучшей к худшей
+        """
+        if len(terms) == 1 and len(terms[0]) == 1:
+            return self._letters_ranked.get(terms[0], ())
+        matches = sorted((self._matches(term) for term in terms), key=len)
+        first, rest = matches[0], matches[1:]
+        if not rest:
+            return self._order(first)
+        scores = {}
+        for doc, weight in first.items():
+            for other in rest:
+                extra = other.get(doc)
+                if extra is None:
+                    break
+                weight += extra
+            else:
+                scores[doc] = weight
+        return self._order(scores)
+
+    def search(self, query, limit=None):
+        """
+        Ищет услуги по запросу.
+
+        Args:
+            query (str): Запрос
+            limit (int): Сколько услуг вернуть (None — все найденные)
+
+        Returns:
+            tuple: Услуги от самой подходящей к наименее подходящей или None,
+                если в запросе нет слов (фильтр не применяется)
+        """
+        terms = tuple(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return None
+        results = self._ranked(terms)
+        return results if limit is None else results[:limit]
+
+
+class SearchIndexCache:
+    """
+    Общий для процесса индекс поиска, перестраиваемый при смене версии каталога услуг.
+
+    Атрибуты:
+        languages (tuple): Языки, тексты которых попадают в индекс
+        builds (int): Сколько раз индекс был построен
+    """
+
+    def __init__(self, languages=None):
+        """
+        Инициализирует кэш (индекс строится при первом поиске).
+
+        Args:
+            languages (list): Языки (по умолчанию config.SEARCH_LANGUAGES)
+        """
+        self.languages = tuple(languages or config.SEARCH_LANGUAGES)
+        self.builds = 0
+        self._current = (None, None)  # (версия каталога, индекс)
+        self._lock = threading.Lock()
+
+    def get(self, snapshot):
+        """
+        Возвращает индекс для снимка каталога услуг, при необходимости построив его.
+
+        Args:
+            snapshot (ServiceSnapshot): Снимок каталога услуг
+
+        Returns:
+            SearchIndex: Индекс
+        """
+        version, index = self._current
+        if version == snapshot.version:
+            return index
+        with self._lock:
+            version, index = self._current
+            if version != snapshot.version:
+                available = Localization().languages()
+                catalogs = [Localization(lang) for lang in self.languages if lang in available]
+                index = SearchIndex(snapshot.items, catalogs)
+                self._current = (snapshot.version, index)
+                self.builds += 1
+            return index
+
+    def search(self, snapshot, query, limit=None):
+        """
+        Ищет услуги в снимке каталога.
+
+        Args:
+            snapshot (ServiceSnapshot): Снимок каталога услуг
+            query (str): Запрос
+            limit (int): Сколько услуг вернуть (None — все найденные)
+
+        Returns:
+            tuple: Найденные услуги или None, если в запросе нет слов
+        """
+        return self.get(snapshot).search(query, limit)
+
+
+# Индекс поиска по услугам, общий для всех сессий процесса
+SEARCH = SearchIndexCache()
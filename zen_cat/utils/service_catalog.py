@@ -0,0 +1,286 @@
+"""
+Модуль каталога услуг для приложения Zen-кот.
+
+Список услуг хранится не в коде компонента, а в каталоге: файле JSON (список
+объектов) или таблице services базы SQLite. Каждая услуга задает ключи текстов
+в каталоге локализации (title_key, desc_key), иконку, порядок и категорию:
+
+    [{"id": "design", "title_key": "service_2_title", "desc_key": "service_2_desc",
+      "icon": "🎨", "order": 20, "category": "build"}]
+
+Таблица SQLite (колонка порядка называется sort_order, потому что order —
+ключевое слово SQL):
+
+    CREATE TABLE services (id TEXT PRIMARY KEY, title_key TEXT NOT NULL,
+        desc_key TEXT NOT NULL, icon TEXT, sort_order INTEGER, category TEXT)
+
+ServiceCatalog.snapshot() возвращает неизменяемый снимок каталога. Не чаще
+одного раза в config.SERVICES_RELOAD секунд каталог сверяет время изменения
+и размер файла (для SQLite — и журнала WAL) и при изменении перечитывает его,
+поэтому новые сессии видят изменения без перезапуска. Если новый каталог
+не удалось прочитать, остается предыдущий снимок.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from zen_cat import config
+
+
+# Каталог услуг по умолчанию (поставляется вместе с приложением)
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "services.json")
+
+_SQLITE_SUFFIXES = (".db", ".sqlite", ".sqlite3")
+
+
+class ServiceItem:
+    """
+    Услуга из каталога.
+
+    Атрибуты:
+        id (str): Идентификатор услуги
+        title_key (str): Ключ заголовка в каталоге локализации
+        desc_key (str): Ключ описания в каталоге локализации
+        icon (str): Иконка (эмодзи)
+        order (int): Порядок в списке
+        category (str): Категория
+    """
+
+    __slots__ = ("id", "title_key", "desc_key", "icon", "order", "category")
+
+    def __init__(self, item_id, title_key, desc_key, icon="", order=0, category=""):
+        """
+        Инициализирует услугу.
+
+        Args:
+            item_id (str): Идентификатор услуги
+            title_key (str): Ключ заголовка
+            desc_key (str): Ключ описания
+            icon (str): Иконка
+            order (int): Порядок в списке
+            category (str): Категория
+        """
+        self.id = item_id
+        self.title_key = title_key
+        self.desc_key = desc_key
+        self.icon = icon or ""
+        self.order = order or 0
+        self.category = category or ""
+
+    def __eq__(self, other):
+        return isinstance(other, ServiceItem) and all(
+            getattr(self, name) == getattr(other, name) for name in self.__slots__
+        )
+
+    def __hash__(self):
+        return hash(self.id)
+
+    def __repr__(self):
+        return f"ServiceItem({self.id!r}, order={self.order}, category={self.category!r})"
+
+
+class ServiceSnapshot:
+    """
+    Неизменяемый снимок каталога услуг.
+
+    Атрибуты:
+        version (int): Номер версии (растет при каждом изменении каталога)
+        items (tuple): Услуги в порядке отображения
+    """
+
+    __slots__ = ("version", "items")
+
+    def __init__(self, version, items):
+        """
+        Инициализирует снимок.
+
+        Args:
+            version (int): Номер версии
+            items (tuple): Услуги в порядке отображения
+        """
+        self.version = version
+        self.items = items
+
+    def __len__(self):
+        return len(self.items)
+
+    def categories(self):
+        """
+        Возвращает категории услуг в порядке первого появления.
+
+        Returns:
+            tuple: Категории
+        """
+        return tuple(dict.fromkeys(item.category for item in self.items if item.category))
+
+
+def _parse(records, source):
+    """
+    Проверяет записи каталога и создает из них услуги.
+
+    Args:
+        records (list): Словари с полями услуги
+        source (str): Источник (для сообщений об ошибках)
+
+    Returns:
+        tuple: Услуги, упорядоченные по order, затем по id
+
+    Raises:
+        ValueError: Если запись некорректна или идентификаторы повторяются
+    """
+    if not isinstance(records, list):
+        raise ValueError(f"{source}: каталог услуг должен быть списком")
+    items = {}
+    for number, record in enumerate(records):
+        if not isinstance(record, dict) or not record.get("title_key") or not record.get("desc_key"):
+            raise ValueError(f"{source}: у услуги №{number} нет title_key или desc_key")
+        order = record.get("order", number)
+        if isinstance(order, bool) or not isinstance(order, (int, float)):
+            raise ValueError(f"{source}: некорректный order у услуги №{number}: {order!r}")
+        item = ServiceItem(
+            str(record.get("id") or record["title_key"]),
+            record["title_key"],
+            record["desc_key"],
+            record.get("icon"),
+            order,
+            record.get("category")
+        )
+        if item.id in items:
+            raise ValueError(f"{source}: повторяется услуга {item.id}")
+        items[item.id] = item
+    return tuple(sorted(items.values(), key=lambda item: (item.order, item.id)))
+
+
+def load_services(path):
+    """
+    Читает каталог услуг из файла JSON или базы SQLite.
+
+    Args:
+        path (str): Путь к каталогу
+
+    Returns:
+        tuple: Услуги в порядке отображения
+
+    Raises:
+        OSError, ValueError, sqlite3.Error: Если каталог не удалось прочитать
+    """
+    if path.endswith(_SQLITE_SUFFIXES):
+        if not os.path.exists(path):
+            raise FileNotFoundError(path)
+        conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+        try:
+            conn.row_factory = sqlite3.Row
+            rows = conn.execute(
+                "SELECT id, title_key, desc_key, icon, sort_order AS \"order\", category FROM services"
+            ).fetchall()
+        finally:
+            conn.close()
+        records = [{key: row[key] for key in row.keys() if row[key] is not None} for row in rows]
+    else:
+        with open(path, encoding="utf-8") as f:
+            records = json.load(f)
+    return _parse(records, path)
+
+
+def _signature(path):
+    """
+    Возвращает отпечаток файлов каталога для проверки изменений.
+
+    Args:
+        path (str): Путь к каталогу
+
+    Returns:
+        tuple: Время изменения и размер файла и журнала WAL (None, если файла нет)
+    """
+    result = []
+    for name in (path, f"{path}-wal"):
+        try:
+            stat = os.stat(name)
+        except OSError:
+            result.append(None)
+        else:
+            result.append((stat.st_mtime_ns, stat.st_size))
+    return tuple(result)
+
+
+class ServiceCatalog:
+    """
+    Каталог услуг с перечитыванием при изменении источника.
+
+    Атрибуты:
+        path (str): Путь к файлу JSON или базе SQLite
+        reload_interval (float): Как часто проверять изменения, секунды
+        reloads (int): Сколько раз каталог был перечитан
+        errors (int): Сколько раз каталог не удалось прочитать
+        last_error (Exception): Последняя ошибка чтения или None
+    """
+
+    def __init__(self, path=None, reload_interval=None):
+        """
+        Инициализирует каталог (источник читается при первом обращении).
+
+        Args:
+            path (str): Путь к каталогу (по умолчанию config.SERVICES_PATH,
+                а если он пуст — DEFAULT_PATH)
+            reload_interval (float): Интервал проверки изменений (по умолчанию
+                config.SERVICES_RELOAD)
+        """
+        self.path = path or config.SERVICES_PATH or DEFAULT_PATH
+        self.reload_interval = config.SERVICES_RELOAD if reload_interval is None else reload_interval
+        self.reloads = 0
+        self.errors = 0
+        self.last_error = None
+        self._snapshot = None
+        self._signature = None
+        self._checked = 0.0
+        self._lock = threading.Lock()
+
+    def snapshot(self):
+        """
+        Возвращает текущий снимок каталога, при необходимости перечитав источник.
+
+        Returns:
+            ServiceSnapshot: Снимок каталога
+
+        Raises:
+            OSError, ValueError, sqlite3.Error: Если каталог не удалось прочитать
+                при первом обращении
+        """
+        snapshot = self._snapshot
+        if snapshot is not None and time.monotonic() - self._checked < self.reload_interval:
+            return snapshot
+        with self._lock:
+            if self._snapshot is None or time.monotonic() - self._checked >= self.reload_interval:
+                self._refresh()
+            return self._snapshot
+
+    def _refresh(self):
+        """
+        Перечитывает источник, если его отпечаток изменился (вызывается под блокировкой).
+        """
+        self._checked = time.monotonic()
+        signature = _signature(self.path)
+        if signature == self._signature and self._snapshot is not None:
+            return
+        try:
+            items = load_services(self.path)
+        except (OSError, ValueError, sqlite3.Error) as e:
+            if self._snapshot is None:
+                raise
+            self.errors += 1
+            self.last_error = e
+            return
+        self._signature = signature
+        self.last_error = None
+        if self._snapshot is None:
+            self._snapshot = ServiceSnapshot(1, items)
+        elif items != self._snapshot.items:
+            self._snapshot = ServiceSnapshot(self._snapshot.version + 1, items)
+            self.reloads += 1
+
+
+# Каталог услуг, общий для всех сессий процесса
+SERVICE_CATALOG = ServiceCatalog()
@@ -0,0 +1,290 @@
+"""
+Модуль реестра сессий для приложения Zen-кот.
+
+SessionRegistry — общий для процесса реестр сессий ZenCatApp:
+- допуск (admit): пока число сессий меньше предела (config.SESSION_MAX),
+  сессия получает полный интерфейс, а сверх предела — легкую страницу
+  «сервис занят», поэтому при всплеске нагрузки процесс не исчерпывает память;
+- учет активности (touch) и подключения (connected/disconnected) по событиям
+  страницы;
+- вытеснение: сессии, неактивные дольше config.SESSION_IDLE_TIMEOUT или
+  отключенные дольше config.SESSION_DISCONNECT_TIMEOUT, освобождаются
+  (ZenCatApp.release: дерево элементов, отложенные действия, обработчики
+  событий страницы) и удаляются из реестра. Проверка выполняется фоновым
+  потоком раз в config.SESSION_SWEEP_INTERVAL, а также при допуске новой
+  сессии, когда предел достигнут.
+"""
+
+import threading
+import time
+
+from zen_cat import config
+from zen_cat.utils.metrics import METRICS
+
+
+class SessionEntry:
+    """
+    Запись реестра об одной сессии.
+
+    Атрибуты:
+        app (ZenCatApp): Приложение сессии (None, пока интерфейс строится)
+        last_active (float): Время последнего действия посетителя (time.monotonic)
+        disconnected_at (float): Время отключения клиента или None
+    """
+
+    __slots__ = ("app", "last_active", "disconnected_at")
+
+    def __init__(self, now):
+        """
+        Инициализирует запись допущенной сессии.
+
+        Args:
+            now (float): Текущее время (time.monotonic)
+        """
+        self.app = None
+        self.last_active = now
+        self.disconnected_at = None
+
+
+class SessionRegistry:
+    """
+    Реестр сессий с пределом их числа и вытеснением неактивных.
+
+    Атрибуты:
+        max_sessions (int): Предел одновременных сессий (0 — без предела)
+        idle_timeout (float): Через сколько секунд без действий сессия вытесняется
+        disconnect_timeout (float): Через сколько секунд после отключения сессия вытесняется
+        sweep_interval (float): Период фоновой проверки в секундах
+    """
+
+    def __init__(self, max_sessions=None, idle_timeout=None, disconnect_timeout=None, sweep_interval=None):
+        """
+        Инициализирует реестр.
+
+        Args:
+            max_sessions (int): Предел сессий (по умолчанию config.SESSION_MAX)
+            idle_timeout (float): Время неактивности (по умолчанию config.SESSION_IDLE_TIMEOUT)
+            disconnect_timeout (float): Время после отключения
+                (по умолчанию config.SESSION_DISCONNECT_TIMEOUT)
+            sweep_interval (float): Период проверки (по умолчанию config.SESSION_SWEEP_INTERVAL)
+        """
+        self.max_sessions = config.SESSION_MAX if max_sessions is None else max_sessions
+        self.idle_timeout = config.SESSION_IDLE_TIMEOUT if idle_timeout is None else idle_timeout
+        self.disconnect_timeout = config.SESSION_DISCONNECT_TIMEOUT if disconnect_timeout is None else disconnect_timeout
+        self.sweep_interval = config.SESSION_SWEEP_INTERVAL if sweep_interval is None else sweep_interval
+        self._entries = {}
+        self._lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._thread = None
+
+        # Метрики
+        self.admitted = 0
+        self.rejected = 0
+        self.closed = 0
+        self.evicted_idle = 0
+        self.evicted_disconnected = 0
+
+    def admit(self, page):
+        """
+        Допускает новую сессию, если предел не достигнут.
+
+        При достигнутом пределе сначала вытесняются просроченные сессии.
+
+        Args:
+            page (ft.Page): Страница новой сессии
+
+        Returns:
+            bool: True, если сессии можно строить полный интерфейс
+        """
+        session_id = str(page.session_id)
+        for attempt in range(2):
+            with self._lock:
+                if session_id in self._entries:
+                    return True
+                if not self.max_sessions or len(self._entries) < self.max_sessions:
+                    self._entries[session_id] = SessionEntry(time.monotonic())
+                    self.admitted += 1
+                    return True
+            if attempt == 0:
+                self.sweep()
+        with self._lock:
+            self.rejected += 1
+        return False
+
+    def register(self, app):
+        """
+        Связывает сессию с построенным приложением и запускает фоновую проверку.
+
+        Сессия, не прошедшая admit (например, созданная напрямую), допускается без
+        проверки предела.
+
+        Args:
+            app (ZenCatApp): Приложение сессии
+        """
+        session_id = str(app.page.session_id)
+        with self._lock:
+            entry = self._entries.get(session_id)
+            if entry is None:
+                entry = self._entries[session_id] = SessionEntry(time.monotonic())
+                self.admitted += 1
+            entry.app = app
+        self.start()
+
+    def touch(self, app):
+        """
+        Отмечает действие посетителя.
+
+        Args:
+            app (ZenCatApp): Приложение сессии
+        """
+        entry = self._entries.get(str(app.page.session_id))
+        if entry is not None:
+            entry.last_active = time.monotonic()
+
+    def connected(self, app):
+        """
+        Отмечает повторное подключение клиента.
+
+        Args:
+            app (ZenCatApp): Приложение сессии
+        """
+        entry = self._entries.get(str(app.page.session_id))
+        if entry is not None:
+            entry.disconnected_at = None
+            entry.last_active = time.monotonic()
+
+    def disconnected(self, app):
+        """
+        Отмечает отключение клиента (сессия еще может быть восстановлена).
+
+        Args:
+            app (ZenCatApp): Приложение сессии
+        """
+        entry = self._entries.get(str(app.page.session_id))
+        if entry is not None:
+            entry.disconnected_at = time.monotonic()
+
+    def remove(self, app):
+        """
+        Удаляет закрытую сессию из реестра.
+
+        Args:
+            app (ZenCatApp): Приложение сессии
+        """
+        with self._lock:
+            if self._entries.pop(str(app.page.session_id), None) is not None:
+                self.closed += 1
+
+    def sweep(self, now=None):
+        """
+        Вытесняет просроченные сессии.
+
+        Записи удаляются из реестра под блокировкой, а приложения освобождаются
+        после нее: освобождение отправляет команды странице.
+
+        Args:
+            now (float): Текущее время (time.monotonic)
+
+        Returns:
+            int: Количество вытесненных сессий
+        """
+        now = time.monotonic() if now is None else now
+        expired = []
+        with self._lock:
+            for session_id, entry in list(self._entries.items()):
+                if entry.disconnected_at is not None and now - entry.disconnected_at >= self.disconnect_timeout:
+                    self.evicted_disconnected += 1
+                elif now - entry.last_active >= self.idle_timeout:
+                    self.evicted_idle += 1
+                else:
+                    continue
+                del self._entries[session_id]
+                if entry.app is not None:
+                    expired.append(entry.app)
+        for app in expired:
+            app.release()
+        return len(expired)
+
+    def start(self):
+        """
+        Запускает фоновый поток проверки (повторный вызов ничего не делает).
+        """
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._stopping.clear()
+            self._thread = threading.Thread(target=self._run, name="zen-cat-sessions", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout=5.0):
+        """
+        Останавливает фоновый поток проверки.
+
+        Args:
+            timeout (float): Максимальное время ожидания в секундах
+        """
+        with self._lock:
+            thread = self._thread
+            self._thread = None
+        if thread is None:
+            return
+        self._stopping.set()
+        thread.join(timeout)
+
+    def _run(self):
+        """
+        Основной цикл фонового потока проверки.
+        """
+        while not self._stopping.wait(self.sweep_interval):
+            self.sweep()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self):
+        """
+        Возвращает счетчики реестра.
+
+        Returns:
+            dict: Число активных и отключенных сессий, допущенных, отклоненных,
+                закрытых и вытесненных (по неактивности и после отключения)
+        """
+        with self._lock:
+            entries = list(self._entries.values())
+        return {
+            "active": len(entries),
+            "disconnected": sum(1 for entry in entries if entry.disconnected_at is not None),
+            "max_sessions": self.max_sessions,
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "closed": self.closed,
+            "evicted_idle": self.evicted_idle,
+            "evicted_disconnected": self.evicted_disconnected,
+        }
+
+
+# Реестр сессий, общий для всех сессий процесса
+SESSIONS = SessionRegistry()
+
+
+@METRICS.collector
+def _collect_metrics():
+    """
+    Собирает метрики реестра сессий.
+
+    Returns:
+        list: Метрики (имя, тип, описание, значения)
+    """
+    stats = SESSIONS.stats()
+    return [
+        ("zen_cat_sessions_active", "gauge", "Открытые сессии", [({}, stats["active"])]),
+        ("zen_cat_sessions_disconnected", "gauge", "Сессии с отключенным клиентом", [({}, stats["disconnected"])]),
+        ("zen_cat_sessions_admitted_total", "counter", "Допущенные сессии", [({}, stats["admitted"])]),
+        ("zen_cat_sessions_rejected_total", "counter", "Сессии, получившие страницу «сервис занят»",
+         [({}, stats["rejected"])]),
+        ("zen_cat_sessions_closed_total", "counter", "Закрытые сессии", [({}, stats["closed"])]),
+        ("zen_cat_sessions_evicted_total", "counter", "Вытесненные сессии", [
+            ({"reason": "idle"}, stats["evicted_idle"]),
+            ({"reason": "disconnected"}, stats["evicted_disconnected"]),
+        ]),
+    ]
@@ -0,0 +1,376 @@
+"""
+Модуль статической отрисовки интерфейса в HTML для приложения Zen-кот.
+
+HtmlRenderer обходит дерево элементов Flet, построенное обычными компонентами
+(Header, MainScreen, Services, About, Footer), и превращает его в разметку HTML:
+Text — в абзац (или заголовок), Container — в блок, Column и Row — во flex-блоки,
+Divider — в линию. Размеры, отступы, цвета и выравнивание переводятся в CSS
+с теми же значениями, что использует клиент Flet.
+
+Стили не пишутся в атрибуты элементов: StyleSheet собирает одинаковые наборы
+CSS-свойств в один класс, поэтому страницы всех языков (разметка у них одна)
+ссылаются на один общий файл стилей, который браузер кэширует.
+"""
+
+import html
+
+import flet as ft
+
+
+# Интервал между элементами Column и Row, если spacing не задан (как в Flet)
+_DEFAULT_SPACING = 10
+
+_FONT_WEIGHTS = {
+    "normal": 400,
+    "bold": 700,
+    **{f"w{weight}": weight for weight in range(100, 1000, 100)},
+}
+
+_MAIN_AXIS = {
+    "start": "flex-start",
+    "end": "flex-end",
+    "center": "center",
+    "spaceBetween": "space-between",
+    "spaceAround": "space-around",
+    "spaceEvenly": "space-evenly",
+}
+
+_CROSS_AXIS = {
+    "start": "flex-start",
+    "end": "flex-end",
+    "center": "center",
+    "stretch": "stretch",
+    "baseline": "baseline",
+}
+
+# Положение по оси выравнивания Flet (-1, 0, 1) -> значение flex-выравнивания
+_ALIGNMENT = {-1: "flex-start", 0: "center", 1: "flex-end"}
+
+
+def _px(value):
+    """
+    Переводит размер Flet в CSS.
+
+    Args:
+        value (int | float): Размер в логических пикселях
+
+    Returns:
+        str: Размер с единицами измерения
+    """
+    return f"{value:g}px" if value else "0"
+
+
+def _enum(value):
+    """
+    Возвращает значение перечисления Flet (или саму строку).
+
+    Args:
+        value: Элемент перечисления, строка или None
+
+    Returns:
+        str: Значение или None
+    """
+    return getattr(value, "value", value)
+
+
+def _sides(value):
+    """
+    Переводит отступы Flet (число, Padding или Margin) в значение CSS.
+
+    Args:
+        value: Отступы элемента
+
+    Returns:
+        str: Значение свойства padding/margin или None, если отступов нет
+    """
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return _px(value) if value else None
+    sides = (value.top, value.right, value.bottom, value.left)
+    if not any(sides):
+        return None
+    return " ".join(_px(side) for side in sides)
+
+
+def _radius(value):
+    """
+    Переводит скругление углов Flet (число или BorderRadius) в значение CSS.
+
+    Args:
+        value: Скругление углов элемента
+
+    Returns:
+        str: Значение свойства border-radius или None
+    """
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return _px(value) if value else None
+    corners = (value.top_left, value.top_right, value.bottom_right, value.bottom_left)
+    return " ".join(_px(corner) for corner in corners)
+
+
+class StyleSheet:
+    """
+    Таблица стилей, общая для нескольких страниц.
+
+    Каждый уникальный набор CSS-свойств получает короткое имя класса; одинаковые
+    элементы всех страниц используют один и тот же класс.
+    """
+
+    def __init__(self, prefix="z"):
+        """
+        Инициализирует пустую таблицу стилей.
+
+        Args:
+            prefix (str): Префикс имен классов
+        """
+        self.prefix = prefix
+        self._classes = {}
+
+    def __len__(self):
+        return len(self._classes)
+
+    def class_for(self, declarations):
+        """
+        Возвращает имя класса для набора CSS-свойств.
+
+        Args:
+            declarations (list): Пары (свойство, значение); значения None пропускаются
+
+        Returns:
+            str: Имя класса или None, если свойств нет
+        """
+        rule = ";".join(f"{name}:{value}" for name, value in declarations if value is not None)
+        if not rule:
+            return None
+        name = self._classes.get(rule)
+        if name is None:
+            name = self._classes[rule] = f"{self.prefix}{len(self._classes)}"
+        return name
+
+    def render(self):
+        """
+        Формирует текст таблицы стилей.
+
+        Returns:
+            str: CSS-правила всех классов
+        """
+        return "".join(f".{name}{{{rule}}}\n" for rule, name in self._classes.items())
+
+
+class HtmlRenderer:
+    """
+    Отрисовка дерева элементов Flet в HTML.
+
+    Атрибуты:
+        sheet (StyleSheet): Таблица стилей, в которую собираются классы
+        tags (dict): Теги для отдельных текстов {id(элемент): "h1"} (по умолчанию "p")
+        replace (dict): Готовая разметка вместо элементов {id(элемент): html}
+            (например, интерактивных элементов, у которых нет статического вида)
+    """
+
+    def __init__(self, sheet: StyleSheet, tags=None, replace=None):
+        """
+        Инициализирует отрисовку.
+
+        Args:
+            sheet (StyleSheet): Таблица стилей
+            tags (dict): Теги для отдельных текстов
+            replace (dict): Готовая разметка вместо элементов
+        """
+        self.sheet = sheet
+        self.tags = tags or {}
+        self.replace = replace or {}
+        self._renderers = {
+            ft.Text: self._text,
+            ft.Container: self._container,
+            ft.Column: self._column,
+            ft.Row: self._row,
+            ft.Divider: self._divider,
+        }
+
+    def render(self, control):
+        """
+        Отрисовывает элемент со всеми дочерними элементами.
+
+        Args:
+            control (ft.Control): Элемент интерфейса
+
+        Returns:
+            str: Разметка HTML (пустая строка для скрытого элемента)
+
+        Raises:
+            TypeError: Если у элемента нет статического вида и он не заменен через replace
+        """
+        if control is None or control.visible is False:
+            return ""
+        markup = self.replace.get(id(control))
+        if markup is not None:
+            return markup
+        renderer = self._renderers.get(type(control))
+        if renderer is None:
+            raise TypeError(f"Элемент {type(control).__name__} не поддерживается статической отрисовкой")
+        return renderer(control)
+
+    def _element(self, tag, declarations, inner=""):
+        """
+        Формирует элемент HTML с классом для набора CSS-свойств.
+
+        Args:
+            tag (str): Тег
+            declarations (list): Пары (свойство, значение)
+            inner (str): Содержимое элемента
+
+        Returns:
+            str: Разметка элемента
+        """
+        name = self.sheet.class_for(declarations)
+        if name is None:
+            return f"<{tag}>{inner}</{tag}>"
+        return f'<{tag} class="{name}">{inner}</{tag}>'
+
+    def _box(self, control):
+        """
+        Возвращает CSS-свойства размеров элемента (width, height, expand).
+
+        Фиксированная ширина не выходит за пределы экрана: max-width ограничивает
+        ее шириной родителя.
+
+        Args:
+            control (ft.Control): Элемент интерфейса
+
+        Returns:
+            list: Пары (свойство, значение)
+        """
+        declarations = []
+        if control.width is not None:
+            declarations += [("width", _px(control.width)), ("max-width", "100%")]
+        if control.height is not None:
+            declarations.append(("height", _px(control.height)))
+        if control.expand:
+            declarations += [("flex", "1 1 0"), ("min-width", "0")]
+        return declarations
+
+    def _text(self, control):
+        """
+        Отрисовывает текст.
+
+        Args:
+            control (ft.Text): Текст
+
+        Returns:
+            str: Разметка текста
+        """
+        weight = _enum(control.weight)
+        declarations = [
+            ("margin", "0"),
+            ("font-size", _px(control.size) if control.size else None),
+            ("font-weight", _FONT_WEIGHTS.get(weight) if weight else None),
+            ("color", control.color),
+            ("text-align", _enum(control.text_align)),
+            ("white-space", "pre-line"),
+        ]
+        tag = self.tags.get(id(control), "p")
+        return self._element(tag, declarations + self._box(control), html.escape(control.value or ""))
+
+    def _container(self, control):
+        """
+        Отрисовывает контейнер (контейнер без содержимого — отступ).
+
+        Args:
+            control (ft.Container): Контейнер
+
+        Returns:
+            str: Разметка контейнера
+        """
+        declarations = [
+            ("padding", _sides(control.padding)),
+            ("margin", _sides(control.margin)),
+            ("background", control.bgcolor),
+            ("border-radius", _radius(control.border_radius)),
+        ]
+        alignment = control.alignment
+        if alignment is not None and control.content is not None:
+            declarations += [
+                ("display", "flex"),
+                ("justify-content", _ALIGNMENT.get(round(alignment.x), "center")),
+                ("align-items", _ALIGNMENT.get(round(alignment.y), "center")),
+            ]
+        declarations += self._box(control)
+        if control.height is not None or control.width is not None:
+            declarations.append(("flex-shrink", "0"))
+        return self._element("div", declarations, self.render(control.content))
+
+    def _flex(self, control, direction, main, cross, default_cross):
+        """
+        Отрисовывает Column или Row как flex-блок.
+
+        Args:
+            control (ft.Column | ft.Row): Элемент с дочерними элементами
+            direction (str): Направление (column, row)
+            main: Выравнивание по главной оси
+            cross: Выравнивание по поперечной оси
+            default_cross (str): Выравнивание по поперечной оси по умолчанию
+
+        Returns:
+            str: Разметка блока
+        """
+        spacing = _DEFAULT_SPACING if control.spacing is None else control.spacing
+        declarations = [
+            ("display", "flex"),
+            ("flex-direction", direction),
+            ("gap", _px(spacing)),
+            ("justify-content", _MAIN_AXIS.get(_enum(main))),
+            ("align-items", _CROSS_AXIS.get(_enum(cross), default_cross)),
+        ]
+        if getattr(control, "wrap", False):
+            run_spacing = spacing if control.run_spacing is None else control.run_spacing
+            declarations += [("flex-wrap", "wrap"), ("row-gap", _px(run_spacing))]
+        inner = "".join(self.render(child) for child in control.controls)
+        return self._element("div", declarations + self._box(control), inner)
+
+    def _column(self, control):
+        """
+        Отрисовывает колонку.
+
+        Args:
+            control (ft.Column): Колонка
+
+        Returns:
+            str: Разметка колонки
+        """
+        return self._flex(control, "column", control.alignment, control.horizontal_alignment, "flex-start")
+
+    def _row(self, control):
+        """
+        Отрисовывает строку.
+
+        Args:
+            control (ft.Row): Строка
+
+        Returns:
+            str: Разметка строки
+        """
+        return self._flex(control, "row", control.alignment, control.vertical_alignment, "center")
+
+    def _divider(self, control):
+        """
+        Отрисовывает разделительную линию.
+
+        Args:
+            control (ft.Divider): Разделитель
+
+        Returns:
+            str: Разметка линии
+        """
+        thickness = control.thickness if control.thickness is not None else 1
+        height = control.height if control.height is not None else 16
+        declarations = [
+            ("border", "0"),
+            ("border-top", f"{_px(thickness)} solid {control.color or 'currentColor'}"),
+            ("margin", f"{_px(max(height - thickness, 0) / 2)} 0"),
+            ("width", "100%"),
+        ]
+        return f'<hr class="{self.sheet.class_for(declarations)}">'
@@ -0,0 +1,372 @@
+"""
+Модуль шаблонов секций интерфейса для приложения Zen-кот.
+
+Статические секции страницы (основной экран, услуги, «О нас», футер) для
+заданного языка всегда одинаковы. TemplateCache строит каждую секцию один раз
+на язык, а для новой сессии быстро копирует готовое дерево элементов, не вызывая
+конструкторы Flet и не обращаясь к теме и каталогу. Привязки текстов прототипа
+переносятся на копию, поэтому смена языка в сессии работает как обычно.
+
+Изменяемые элементы (шапка с меню языка, форма обратной связи) в шаблоны
+не входят и создаются для каждой сессии отдельно.
+
+Копирование опирается на внутреннее устройство элементов Flet (служебные поля
+элемента и обработчики событий, замкнутые на объект EventHandler). Поэтому
+каждый новый шаблон сразу проверяется (Template.check): у копии чистые uid,
+page и parent, обработчики событий ведут на ее собственные EventHandler, а ни
+один изменяемый объект (Padding, Margin, списки, словари) не общий
+с прототипом. Если после обновления Flet проверка не проходит, кэш пишет
+предупреждение в журнал и строит секцию для каждой сессии заново.
+Проверка всех секций: python benchmarks/check_templates.py
+"""
+
+import copy
+import enum
+import logging
+import threading
+import types
+
+from flet.core.control import Control
+from flet.core.event_handler import EventHandler
+
+from zen_cat.utils.bindings import TextBindings
+from zen_cat.utils.localization import Localization
+
+
+logger = logging.getLogger(__name__)
+
+# Служебные поля элемента Flet, которые у копии должны начинаться с чистого состояния
+_RESET_FIELDS = {"_Control__page": None, "_Control__uid": None, "parent": None}
+
+# Служебные поля, на которые опирается копирование (проверяются в Template.check)
+_REQUIRED_FIELDS = set(_RESET_FIELDS) | {"_Control__previous_children", "_Control__event_handlers"}
+
+# Значения, которые можно разделять между копиями
+_IMMUTABLE = (str, bytes, int, float, bool, type(None), enum.Enum, types.FunctionType, types.MethodType)
+
+
+def _immutable(value):
+    """
+    Проверяет, что значение не меняется на месте и его можно разделять между копиями.
+
+    Args:
+        value: Значение поля элемента
+
+    Returns:
+        bool: True для неизменяемых значений
+    """
+    if isinstance(value, tuple):
+        return all(_immutable(item) for item in value)
+    return isinstance(value, _IMMUTABLE)
+
+
+def _compile(control):
+    """
+    Компилирует элемент прототипа в функцию, создающую его копию.
+
+    Неизменяемые поля копируются одним dict.copy(); дочерние элементы
+    и обработчики событий Flet обрабатываются рекурсивно, списки и словари
+    копируются, а объекты стиля (Padding, Margin, Alignment и т. п.) — глубоко,
+    чтобы копии не разделяли изменяемые объекты.
+
+    Args:
+        control (ft.Control): Элемент прототипа
+
+    Returns:
+        callable: Функция make(memo), возвращающая копию элемента и записывающая
+            в memo соответствие id(прототип) -> копия
+    """
+    cls = control.__class__
+    fields = control.__dict__
+    base = dict(fields)
+    base.update(_RESET_FIELDS)
+    special = []
+    handlers = {}
+
+    for name, value in fields.items():
+        if name in _RESET_FIELDS:
+            continue
+        if name == "_Control__previous_children":
+            special.append((name, lambda memo: []))
+        elif isinstance(value, Control):
+            special.append((name, _compile(value)))
+        elif isinstance(value, EventHandler):
+            handlers[name] = value
+        elif isinstance(value, list) and any(isinstance(item, Control) for item in value):
+            special.append((name, _compile_list(value)))
+        elif isinstance(value, (list, dict)):
+            items = value.values() if isinstance(value, dict) else value
+            if all(_immutable(item) for item in items):
+                special.append((name, lambda memo, value=value: value.copy()))
+            else:
+                special.append((name, lambda memo, value=value: copy.deepcopy(value)))
+        elif not _immutable(value):
+            special.append((name, lambda memo, value=value: copy.deepcopy(value)))
+
+    events = fields.get("_Control__event_handlers", {})
+    source_id = id(control)
+
+    def make(memo):
+        clone = cls.__new__(cls)
+        state = base.copy()
+        for name, factory in special:
+            state[name] = factory(memo)
+        if handlers:
+            state["_Control__event_handlers"] = _copy_handlers(state, handlers, events)
+        clone.__dict__ = state
+        memo[source_id] = clone
+        return clone
+
+    return make
+
+
+def _compile_list(items):
+    """
+    Компилирует список дочерних элементов прототипа.
+
+    Args:
+        items (list): Список элементов (и, возможно, других значений)
+
+    Returns:
+        callable: Функция make(memo), возвращающая новый список копий
+    """
+    factories = [
+        _compile(item) if isinstance(item, Control) else (lambda memo, item=item: item)
+        for item in items
+    ]
+
+    def make(memo):
+        return [factory(memo) for factory in factories]
+
+    return make
+
+
+def _copy_handlers(state, handlers, events):
+    """
+    Создает копии обработчиков событий Flet и перепривязывает их к новому элементу.
+
+    Args:
+        state (dict): Поля создаваемой копии элемента
+        handlers (dict): Поля прототипа с объектами EventHandler
+        events (dict): Словарь событий прототипа {имя события: функция}
+
+    Returns:
+        dict: Словарь событий для копии
+    """
+    replaced = {}
+    for name, handler in handlers.items():
+        clone = EventHandler.__new__(EventHandler)
+        clone.__dict__ = dict(handler.__dict__)
+        state[name] = clone
+        replaced[id(handler)] = clone
+
+    result = {}
+    for event, fn in events.items():
+        for cell in getattr(fn, "__closure__", None) or ():
+            clone = replaced.get(id(cell.cell_contents))
+            if clone is not None:
+                fn = clone.get_handler()
+                break
+        result[event] = fn
+    return result
+
+
+def _walk(control):
+    """
+    Перебирает элемент и все вложенные в него элементы.
+
+    Args:
+        control (ft.Control): Корневой элемент
+
+    Yields:
+        ft.Control: Элементы дерева
+    """
+    yield control
+    for child in control._get_children():
+        yield from _walk(child)
+
+
+def _compare(prototype, clone, prototype_ids, problems):
+    """
+    Сравнивает элемент копии с элементом прототипа (см. Template.check).
+
+    Args:
+        prototype (ft.Control): Элемент прототипа
+        clone (ft.Control): Соответствующий элемент копии
+        prototype_ids (set): id всех элементов и обработчиков прототипа
+        problems (list): Список, в который дописываются найденные нарушения
+    """
+    name = type(prototype).__name__
+    if clone is prototype or type(clone) is not type(prototype):
+        problems.append(f"{name}: копия не отделена от прототипа")
+        return
+    if clone.uid is not None or clone.page is not None or clone.parent is not None:
+        problems.append(f"{name}: у копии не сброшены uid, page или parent")
+    if not _REQUIRED_FIELDS <= set(clone.__dict__):
+        problems.append(f"{name}: нет служебных полей {sorted(_REQUIRED_FIELDS - set(clone.__dict__))}")
+    for field, value in clone.__dict__.items():
+        if isinstance(value, Control) or _immutable(value):
+            continue
+        if value is prototype.__dict__.get(field):
+            problems.append(f"{name}.{field}: объект общий с прототипом")
+        if isinstance(value, EventHandler) and id(value) in prototype_ids:
+            problems.append(f"{name}.{field}: обработчик общий с прототипом")
+    handlers = {id(value) for value in clone.__dict__.values() if isinstance(value, EventHandler)}
+    for event, fn in clone.__dict__.get("_Control__event_handlers", {}).items():
+        for cell in getattr(fn, "__closure__", None) or ():
+            target = cell.cell_contents
+            if id(target) in prototype_ids:
+                problems.append(f"{name}: обработчик {event} ведет на прототип")
+            elif isinstance(target, EventHandler) and id(target) not in handlers:
+                problems.append(f"{name}: обработчик {event} ведет на чужой EventHandler")
+
+
+class Template:
+    """
+    Готовое дерево элементов секции для одного языка.
+
+    Атрибуты:
+        lang (str): Язык, на котором построен прототип
+        version: Версия данных, из которых построен прототип (None — данные не меняются)
+        problems (list): Нарушения, найденные проверкой копирования (см. check)
+    """
+
+    def __init__(self, lang, root, bindings, version=None):
+        """
+        Компилирует прототип секции.
+
+        Args:
+            lang (str): Язык прототипа
+            root (ft.Control): Корневой элемент прототипа
+            bindings (TextBindings): Привязки текстов, сделанные при построении прототипа
+            version: Версия данных прототипа
+        """
+        self.lang = lang
+        self.version = version
+        self._root = root
+        self._make = _compile(root)
+        self._bindings = [(id(control), prop, key) for control, prop, key in bindings]
+        self.problems = []
+
+    def check(self):
+        """
+        Проверяет, что копии шаблона независимы от прототипа и друг от друга.
+
+        Копия должна состоять из новых элементов с чистыми uid, page и parent,
+        ее обработчики событий должны вести на ее собственные EventHandler,
+        и ни один изменяемый объект не должен быть общим с прототипом.
+
+        Returns:
+            list: Описания нарушений (пустой список — копирование работает)
+        """
+        prototype = list(_walk(self._root))
+        prototype_ids = {id(control) for control in prototype}
+        for control in prototype:
+            prototype_ids.update(
+                id(value) for value in control.__dict__.values() if isinstance(value, EventHandler)
+            )
+        problems = []
+        clone = list(_walk(self.instantiate(TextBindings(Localization(self.lang)))))
+        if len(clone) != len(prototype):
+            return [f"в копии {len(clone)} элементов вместо {len(prototype)}"]
+        for original, copied in zip(prototype, clone):
+            _compare(original, copied, prototype_ids, problems)
+        return problems
+
+    def instantiate(self, bindings: TextBindings):
+        """
+        Создает копию секции для новой сессии.
+
+        Args:
+            bindings (TextBindings): Реестр привязок сессии, в который переносятся
+                привязки текстов прототипа
+
+        Returns:
+            ft.Control: Корневой элемент копии
+        """
+        memo = {}
+        root = self._make(memo)
+        for source_id, prop, key in self._bindings:
+            bindings.add(memo[source_id], prop, key)
+        return root
+
+
+class TemplateCache:
+    """
+    Общий для процесса кэш шаблонов секций по языкам.
+
+    Шаблон, не прошедший проверку (Template.check), не используется: секция
+    строится для сессии заново.
+    """
+
+    def __init__(self):
+        """
+        Инициализирует пустой кэш шаблонов.
+        """
+        self._templates = {}
+        self._lock = threading.Lock()
+
+    def get(self, name, lang, factory, version=None):
+        """
+        Возвращает шаблон секции, при необходимости построив его.
+
+        Args:
+            name (str): Имя секции
+            lang (str): Язык
+            factory (callable): Функция factory(localization, bindings) -> ft.Control,
+                строящая секцию
+            version: Версия данных секции (например, каталога услуг); шаблон
+                другой версии строится заново и заменяет прежний
+
+        Returns:
+            Template: Шаблон секции
+        """
+        template = self._templates.get((name, lang))
+        if template is not None and template.version == version:
+            return template
+
+        with self._lock:
+            template = self._templates.get((name, lang))
+            if template is None or template.version != version:
+                localization = Localization(lang)
+                bindings = TextBindings(localization)
+                root = factory(localization, bindings)
+                template = Template(lang, root, bindings, version)
+                template.problems = template.check()
+                if template.problems:
+                    logger.warning(
+                        "Шаблон секции %s отключен: копирование несовместимо с этой версией Flet: %s",
+                        name, "; ".join(template.problems)
+                    )
+                self._templates[(name, lang)] = template
+            return template
+
+    def instantiate(self, name, localization: Localization, bindings: TextBindings, factory, version=None):
+        """
+        Создает секцию для сессии из шаблона на текущем языке сессии.
+
+        Args:
+            name (str): Имя секции
+            localization (Localization): Объект локализации сессии
+            bindings (TextBindings): Реестр привязок сессии
+            factory (callable): Функция, строящая секцию (см. get)
+            version: Версия данных секции (см. get)
+
+        Returns:
+            ft.Control: Корневой элемент секции
+        """
+        template = self.get(name, localization.lang, factory, version)
+        if template.problems:
+            return factory(localization, bindings)
+        return template.instantiate(bindings)
+
+    def clear(self):
+        """
+        Удаляет все шаблоны (например, после изменения каталога текстов).
+        """
+        with self._lock:
+            self._templates.clear()
+
+
+# Кэш шаблонов, общий для всех сессий процесса
+TEMPLATES = TemplateCache()
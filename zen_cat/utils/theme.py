@@ -0,0 +1,288 @@
+"""
+Модуль темы оформления приложения Zen-кот.
+
+Тема задается словарем (цвета, отступы, размеры шрифта) и компилируется один раз
+при запуске: load_theme() проверяет значения и строит неизменяемый объект Theme.
+Кроме значений, Theme содержит готовые наборы свойств для ролей элементов
+(заголовок, основной текст, карточка, секция, поле ввода). Наборы свойств
+и объекты отступов в них (ft.Padding, ft.Margin) создаются один раз
+и используются всеми сессиями, поэтому построение компонента не создает их
+заново и не перебирает вложенные словари.
+
+Общими могут быть только объекты, которые Flet не меняет: наборы свойств ролей
+и отступы. Чтобы изменить отступ одного элемента, ему назначается новый объект
+(так делает, например, compact()). Стиль кнопки Flet меняет на месте
+(ElevatedButton.before_update записывает в него цвета кнопки и оборачивает
+форму и отступы), поэтому theme.primary_button() возвращает каждой кнопке
+свою копию заранее построенного стиля.
+
+Тему можно загрузить из файла JSON (ZEN_CAT_THEME_FILE) с теми же группами,
+что и DEFAULT_THEME; значения из файла заменяют значения по умолчанию.
+"""
+
+import copy
+import json
+import re
+import types
+
+import flet as ft
+
+
+# Тема по умолчанию с цветами и отступами
+DEFAULT_THEME = {
+    "colors": {
+        "primary": "#2dd4bf",      # Бирюзовый акцент
+        "background": "#f8f5f0",   # Светлый беж
+        "text": "#333333",         # Тёмно-серый
+        "text_light": "#666666",   # Серый
+        "white": "#ffffff",        # Белый
+        "error": "#dc2626"         # Красный (сообщения об ошибках)
+    },
+    "spacing": {
+        "xs": 8,    # Очень маленький отступ
+        "sm": 16,   # Маленький отступ
+        "md": 24,   # Средний отступ
+        "lg": 32,   # Большой отступ
+        "xl": 48    # Очень большой отступ
+    },
+    "font_sizes": {
+        "xs": 14,   # Очень маленький текст
+        "sm": 16,   # Маленький текст
+        "md": 18,   # Средний текст
+        "lg": 24,   # Большой текст (заголовки)
+        "xl": 32    # Очень большой текст (главный заголовок)
+    }
+}
+
+_COLOR = re.compile(r"#(?:[0-9a-fA-F]{3}|[0-9a-fA-F]{6}|[0-9a-fA-F]{8})")
+
+
+class _Group:
+    """
+    Неизменяемая группа значений темы (поля задаются в __slots__ подкласса).
+    """
+
+    __slots__ = ()
+
+    def __init__(self, values):
+        """
+        Заполняет поля группы.
+
+        Args:
+            values (dict): Значения по именам полей
+        """
+        for name in self.__slots__:
+            object.__setattr__(self, name, values[name])
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"Тема неизменяема: {type(self).__name__}.{name}")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"Тема неизменяема: {type(self).__name__}.{name}")
+
+    def as_dict(self):
+        """
+        Возвращает значения группы.
+
+        Returns:
+            dict: Значения по именам полей
+        """
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class Colors(_Group):
+    """Цвета темы."""
+
+    __slots__ = tuple(DEFAULT_THEME["colors"])
+
+
+class Spacing(_Group):
+    """Отступы темы."""
+
+    __slots__ = tuple(DEFAULT_THEME["spacing"])
+
+
+class FontSizes(_Group):
+    """Размеры шрифта темы."""
+
+    __slots__ = tuple(DEFAULT_THEME["font_sizes"])
+
+
+_GROUPS = {"colors": Colors, "spacing": Spacing, "font_sizes": FontSizes}
+
+
+def _role(**kwargs):
+    """
+    Создает набор свойств роли, доступный только для чтения.
+
+    Args:
+        **kwargs: Свойства элемента
+
+    Returns:
+        types.MappingProxyType: Свойства (передаются в конструктор элемента через **)
+    """
+    return types.MappingProxyType(kwargs)
+
+
+class Theme(_Group):
+    """
+    Скомпилированная тема оформления.
+
+    Роли — наборы свойств для конструкторов Flet, например
+    ft.Text(**theme.title) или ft.Container(content=..., **theme.section).
+    Стиль основной кнопки выдается методом primary_button().
+
+    Атрибуты:
+        colors (Colors): Цвета
+        spacing (Spacing): Отступы
+        font_sizes (FontSizes): Размеры шрифта
+        display (Mapping): Главный заголовок страницы (ft.Text)
+        title (Mapping): Заголовок секции (ft.Text)
+        subtitle (Mapping): Подзаголовок (ft.Text)
+        card_title (Mapping): Заголовок карточки (ft.Text)
+        body (Mapping): Основной текст (ft.Text)
+        caption (Mapping): Мелкий текст (ft.Text)
+        success (Mapping): Сообщение об успехе (ft.Text)
+        error (Mapping): Сообщение об ошибке (ft.Text)
+        field (Mapping): Поле ввода (ft.TextField)
+        card (Mapping): Карточка (ft.Container)
+        hero (Mapping): Контейнер первого экрана (ft.Container)
+        section (Mapping): Контейнер секции (ft.Container)
+        footer (Mapping): Контейнер футера (ft.Container)
+        notice (Mapping): Контейнер служебного сообщения (ft.Container)
+        page (Mapping): Основной контейнер страницы (ft.Container)
+    """
+
+    __slots__ = (
+        "colors", "spacing", "font_sizes",
+        "display", "title", "subtitle", "card_title", "body", "caption", "success", "error",
+        "field", "_primary_button", "card", "hero", "section", "footer", "notice", "page",
+    )
+
+    def __init__(self, colors: Colors, spacing: Spacing, font_sizes: FontSizes):
+        """
+        Строит роли темы из проверенных значений.
+
+        Args:
+            colors (Colors): Цвета
+            spacing (Spacing): Отступы
+            font_sizes (FontSizes): Размеры шрифта
+        """
+        bold = ft.FontWeight.BOLD
+        super().__init__({
+            "colors": colors,
+            "spacing": spacing,
+            "font_sizes": font_sizes,
+            "display": _role(size=font_sizes.xl, weight=bold, color=colors.text),
+            "title": _role(size=font_sizes.lg, weight=bold, color=colors.text),
+            "subtitle": _role(size=font_sizes.md, color=colors.text_light),
+            "card_title": _role(size=font_sizes.md, weight=bold, color=colors.text),
+            "body": _role(size=font_sizes.sm, color=colors.text_light),
+            "caption": _role(size=font_sizes.xs, color=colors.text_light),
+            "success": _role(size=font_sizes.md, weight=bold, color=colors.primary),
+            "error": _role(size=font_sizes.sm, color=colors.error),
+            "field": _role(
+                border_color=colors.text_light,
+                focused_border_color=colors.primary,
+                text_size=font_sizes.sm
+            ),
+            "_primary_button": ft.ButtonStyle(
+                color=colors.white,
+                bgcolor=colors.primary,
+                shape=ft.RoundedRectangleBorder(radius=8),
+                animation_duration=300,
+            ),
+            "card": _role(
+                padding=spacing.md,
+                border_radius=8,
+                bgcolor=colors.white,
+                margin=ft.margin.all(spacing.xs)
+            ),
+            "hero": _role(
+                margin=ft.margin.only(top=spacing.xl, bottom=spacing.xl),
+                padding=ft.padding.all(spacing.md)
+            ),
+            "section": _role(
+                margin=ft.margin.only(bottom=spacing.xl),
+                padding=ft.padding.all(spacing.md)
+            ),
+            "footer": _role(padding=ft.padding.only(top=spacing.md)),
+            "notice": _role(padding=ft.padding.all(spacing.xl)),
+            "page": _role(padding=ft.padding.only(left=spacing.md, right=spacing.md)),
+        })
+
+
+    def primary_button(self):
+        """
+        Возвращает стиль основной кнопки.
+
+        Flet меняет стиль кнопки на месте, поэтому у каждой кнопки своя копия.
+
+        Returns:
+            ft.ButtonStyle: Копия стиля основной кнопки
+        """
+        return copy.copy(self._primary_button)
+
+
+def compile_theme(values=None):
+    """
+    Проверяет значения темы и компилирует их в объект Theme.
+
+    Args:
+        values (dict): Группы значений темы; отсутствующие группы и значения
+            берутся из DEFAULT_THEME
+
+    Returns:
+        Theme: Скомпилированная тема
+
+    Raises:
+        ValueError: Если в теме неизвестная группа или значение либо значение некорректно
+    """
+    values = values or {}
+    unknown = set(values) - set(_GROUPS)
+    if unknown:
+        raise ValueError(f"Неизвестные группы темы: {', '.join(sorted(unknown))}")
+
+    groups = {}
+    for group, cls in _GROUPS.items():
+        merged = dict(DEFAULT_THEME[group])
+        overrides = values.get(group, {})
+        if not isinstance(overrides, dict):
+            raise ValueError(f"Группа темы {group} должна быть объектом")
+        unknown = set(overrides) - set(merged)
+        if unknown:
+            raise ValueError(f"Неизвестные значения темы в {group}: {', '.join(sorted(unknown))}")
+        merged.update(overrides)
+        for name, value in merged.items():
+            if group == "colors":
+                if not isinstance(value, str) or not _COLOR.fullmatch(value):
+                    raise ValueError(f"Некорректный цвет темы {group}.{name}: {value!r}")
+            elif isinstance(value, bool) or not isinstance(value, (int, float)) or value < 0:
+                raise ValueError(f"Некорректный размер темы {group}.{name}: {value!r}")
+        groups[group] = cls(merged)
+    return Theme(**groups)
+
+
+def load_theme(path=None):
+    """
+    Загружает тему из файла JSON.
+
+    Args:
+        path (str): Путь к файлу; пустой путь — тема по умолчанию
+
+    Returns:
+        Theme: Скомпилированная тема
+
+    Raises:
+        ValueError: Если файл содержит некорректную тему
+    """
+    if not path:
+        return compile_theme()
+    with open(path, encoding="utf-8") as f:
+        values = json.load(f)
+    if not isinstance(values, dict):
+        raise ValueError(f"Файл темы должен содержать объект: {path}")
+    try:
+        return compile_theme(values)
+    except ValueError as e:
+        raise ValueError(f"{path}: {e}") from None
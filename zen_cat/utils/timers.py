@@ -0,0 +1,342 @@
+"""
+Модуль отложенных действий для приложения Zen-кот.
+
+TimerWheel — иерархическое колесо таймеров, общее для всех сессий процесса.
+Колесо из нескольких уровней по config.TIMER_SLOTS ячеек: ячейка первого уровня
+соответствует одному тику (config.TIMER_TICK_MS), ячейка каждого следующего —
+полному обороту предыдущего уровня. Таймер кладется в ячейку того уровня,
+в пределы которого попадает его срок, а когда до срока остается меньше оборота
+нижнего уровня, таймер переносится вниз. Постановка и отмена таймера — O(1)
+независимо от числа таймеров; отмененные таймеры выбрасываются при обходе ячеек.
+
+Одним фоновым потоком обслуживаются все сессии: не нужен поток или спящая задача
+на каждое отложенное действие. Сработавший таймер передается в цикл событий своей
+страницы (loop.call_soon_threadsafe). Таймеры сессии помечаются ее идентификатором
+(owner) и отменяются все сразу, когда сессия закрывается или вытесняется.
+
+Число ожидающих таймеров и задержка срабатывания относительно срока доступны
+как метрики.
+"""
+
+import threading
+import time
+
+from zen_cat import config
+from zen_cat.utils.metrics import METRICS
+
+
+class Timer:
+    """
+    Отложенное действие.
+
+    Атрибуты:
+        due (float): Срок (time.monotonic)
+        tick (int): Номер тика, в который таймер сработает
+        callback (callable): Функция без аргументов
+        loop (asyncio.AbstractEventLoop): Цикл событий, в котором вызывается функция
+            (None — в потоке колеса)
+        owner (str): Владелец (идентификатор сессии) или None
+        cancelled (bool): Отменен ли таймер
+        fired (bool): Наступил ли срок (действие передано на выполнение)
+    """
+
+    __slots__ = ("due", "tick", "callback", "loop", "owner", "cancelled", "fired", "wheel")
+
+    def __init__(self, wheel, due, tick, callback, loop, owner):
+        """
+        Инициализирует таймер.
+
+        Args:
+            wheel (TimerWheel): Колесо таймера
+            due (float): Срок (time.monotonic)
+            tick (int): Номер тика срабатывания
+            callback (callable): Функция без аргументов
+            loop (asyncio.AbstractEventLoop): Цикл событий или None
+            owner (str): Владелец или None
+        """
+        self.wheel = wheel
+        self.due = due
+        self.tick = tick
+        self.callback = callback
+        self.loop = loop
+        self.owner = owner
+        self.cancelled = False
+        self.fired = False
+
+    def cancel(self):
+        """
+        Отменяет таймер, если действие еще не выполнено.
+        """
+        self.wheel.cancel(self)
+
+
+class TimerWheel:
+    """
+    Иерархическое колесо таймеров.
+
+    Атрибуты:
+        tick (float): Длительность тика в секундах
+        slots (int): Число ячеек на уровне (степень двойки)
+        levels (int): Число уровней
+        pending (int): Число ожидающих таймеров
+        fired (int): Число сработавших таймеров
+        cancelled (int): Число отмененных таймеров
+    """
+
+    def __init__(self, tick=None, slots=None, levels=4):
+        """
+        Инициализирует колесо (фоновый поток запускается с первым таймером).
+
+        Args:
+            tick (float): Длительность тика (по умолчанию config.TIMER_TICK_MS / 1000)
+            slots (int): Ячеек на уровне (по умолчанию config.TIMER_SLOTS)
+            levels (int): Число уровней
+        """
+        self.tick = config.TIMER_TICK_MS / 1000 if tick is None else tick
+        self.slots = slots or config.TIMER_SLOTS
+        if self.slots & (self.slots - 1):
+            raise ValueError("Число ячеек на уровне должно быть степенью двойки")
+        self.levels = levels
+        self._bits = self.slots.bit_length() - 1
+        self._mask = self.slots - 1
+        self._wheel = [[[] for _ in range(self.slots)] for _ in range(levels)]
+        self._overflow = []  # Таймеры дальше верхнего уровня
+        self._owners = {}
+        self._started = time.monotonic()
+        self._current = 0  # Номер последнего обработанного тика
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread = None
+
+        # Метрики
+        self.pending = 0
+        self.fired = 0
+        self.cancelled = 0
+        self.lag = METRICS.histogram(
+            "zen_cat_timer_lag_seconds",
+            "Задержка срабатывания отложенного действия относительно срока, секунды",
+            (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+        )
+
+    def schedule(self, delay, callback, loop=None, owner=None):
+        """
+        Откладывает действие.
+
+        Args:
+            delay (float): Задержка в секундах
+            callback (callable): Функция без аргументов
+            loop (asyncio.AbstractEventLoop): Цикл событий страницы, в котором вызвать функцию
+                (None — в потоке колеса; функция должна быть короткой)
+            owner (str): Владелец (идентификатор сессии) для отмены через cancel_owner
+
+        Returns:
+            Timer: Таймер (можно отменить через cancel)
+        """
+        now = time.monotonic()
+        due = now + max(delay, 0.0)
+        with self._lock:
+            if not self.pending:
+                # Колесо пусто: переводим его на текущий тик без обхода пустых ячеек
+                self._current = int((now - self._started) / self.tick)
+            # Срок округляется вверх до тика: действие не выполняется раньше срока
+            tick = max(-int(-(due - self._started) // self.tick), self._current + 1)
+            timer = Timer(self, due, tick, callback, loop, owner)
+            self._place(timer)
+            self.pending += 1
+            if owner is not None:
+                self._owners.setdefault(owner, set()).add(timer)
+            start = self._thread is None
+            if start:
+                self._thread = threading.Thread(target=self._run, name="zen-cat-timers", daemon=True)
+        if start:
+            self._thread.start()
+        else:
+            self._wakeup.set()
+        return timer
+
+    def cancel(self, timer):
+        """
+        Отменяет таймер (он остается в ячейке и выбрасывается при ее обходе).
+
+        Args:
+            timer (Timer): Таймер
+        """
+        with self._lock:
+            self._cancel(timer)
+
+    def cancel_owner(self, owner):
+        """
+        Отменяет все ожидающие таймеры владельца.
+
+        Args:
+            owner (str): Владелец (идентификатор сессии)
+
+        Returns:
+            int: Число отмененных таймеров
+        """
+        with self._lock:
+            timers = self._owners.pop(owner, ())
+            for timer in timers:
+                timer.owner = None
+                self._cancel(timer)
+        return len(timers)
+
+    def _cancel(self, timer):
+        """
+        Отменяет таймер (под блокировкой).
+
+        Args:
+            timer (Timer): Таймер
+        """
+        if timer.cancelled:
+            return
+        timer.cancelled = True
+        # Действие, уже переданное в цикл событий, тоже не выполнится
+        timer.callback = None
+        if timer.fired:
+            return
+        self.pending -= 1
+        self.cancelled += 1
+        self._forget_owner(timer)
+
+    def _forget_owner(self, timer):
+        """
+        Убирает таймер из набора его владельца (под блокировкой).
+
+        Args:
+            timer (Timer): Таймер
+        """
+        if timer.owner is None:
+            return
+        timers = self._owners.get(timer.owner)
+        if timers is not None:
+            timers.discard(timer)
+            if not timers:
+                del self._owners[timer.owner]
+
+    def _place(self, timer):
+        """
+        Кладет таймер в ячейку по его сроку (под блокировкой).
+
+        Args:
+            timer (Timer): Таймер
+        """
+        delta = timer.tick - self._current
+        for level in range(self.levels):
+            if delta < 1 << (self._bits * (level + 1)):
+                self._wheel[level][(timer.tick >> (self._bits * level)) & self._mask].append(timer)
+                return
+        self._overflow.append(timer)
+
+    def _advance(self, until):
+        """
+        Обрабатывает тики до заданного включительно (под блокировкой).
+
+        Args:
+            until (int): Номер тика
+
+        Returns:
+            list: Сработавшие таймеры
+        """
+        due = []
+        while self._current < until:
+            self._current += 1
+            tick = self._current
+            # На границе оборота уровня переносим таймеры следующей ячейки верхних уровней вниз
+            for level in range(1, self.levels):
+                if tick & ((1 << (self._bits * level)) - 1):
+                    break
+                slot = (tick >> (self._bits * level)) & self._mask
+                timers, self._wheel[level][slot] = self._wheel[level][slot], []
+                for timer in timers:
+                    if not timer.cancelled:
+                        self._place(timer)
+            else:
+                timers, self._overflow = self._overflow, []
+                for timer in timers:
+                    if not timer.cancelled:
+                        self._place(timer)
+            slot = tick & self._mask
+            timers, self._wheel[0][slot] = self._wheel[0][slot], []
+            for timer in timers:
+                if timer.cancelled:
+                    continue
+                if timer.tick > tick:
+                    # Таймер оборота колеса, еще не дошедший до своего срока
+                    self._wheel[0][slot].append(timer)
+                    continue
+                timer.fired = True
+                self.pending -= 1
+                self.fired += 1
+                self._forget_owner(timer)
+                due.append(timer)
+        return due
+
+    def _run(self):
+        """
+        Основной цикл фонового потока: ждет следующего тика (или первого таймера,
+        если колесо пусто) и передает сработавшие таймеры на выполнение.
+        """
+        while True:
+            with self._lock:
+                pending = self.pending
+                next_at = self._started + (self._current + 1) * self.tick
+            if not pending:
+                self._wakeup.wait()
+                self._wakeup.clear()
+                continue
+            delay = next_at - time.monotonic()
+            if delay > 0:
+                self._wakeup.wait(delay)
+                self._wakeup.clear()
+            now = time.monotonic()
+            with self._lock:
+                due = self._advance(int((now - self._started) / self.tick))
+            for timer in due:
+                if timer.loop is None:
+                    self._fire(timer)
+                else:
+                    timer.loop.call_soon_threadsafe(self._fire, timer)
+
+    def _fire(self, timer):
+        """
+        Выполняет отложенное действие и учитывает задержку срабатывания.
+
+        Args:
+            timer (Timer): Таймер
+        """
+        callback, timer.callback = timer.callback, None
+        if callback is None:
+            return
+        self.lag.observe(max(time.monotonic() - timer.due, 0.0))
+        callback()
+
+    def stats(self):
+        """
+        Возвращает счетчики колеса.
+
+        Returns:
+            dict: Число ожидающих, сработавших и отмененных таймеров
+        """
+        return {"pending": self.pending, "fired": self.fired, "cancelled": self.cancelled}
+
+
+# Колесо таймеров, общее для всех сессий процесса
+TIMERS = TimerWheel()
+
+
+@METRICS.collector
+def _collect_metrics():
+    """
+    Собирает метрики колеса таймеров.
+
+    Returns:
+        list: Метрики (имя, тип, описание, значения)
+    """
+    stats = TIMERS.stats()
+    return [
+        ("zen_cat_timers_pending", "gauge", "Ожидающие отложенные действия", [({}, stats["pending"])]),
+        ("zen_cat_timers_fired_total", "counter", "Выполненные отложенные действия", [({}, stats["fired"])]),
+        ("zen_cat_timers_cancelled_total", "counter", "Отмененные отложенные действия",
+         [({}, stats["cancelled"])]),
+    ]
@@ -0,0 +1,470 @@
+"""
+Модуль трассировки обработчиков событий для приложения Zen-кот.
+
+Tracer записывает спаны (имя, идентификатор сессии, время начала и окончания,
+атрибуты) вокруг обработчиков событий интерфейса и отправки обновлений страницы.
+Спаны, начатые внутри другого спана того же потока, становятся его дочерними,
+и вместе образуют трассу. Спан, начатый после завершения родителя (обновление
+страницы, запрошенное обработчиком и отправленное позже в цикле событий),
+продолжает ту же трассу отдельной записью с тем же traceId.
+
+Решение о сохранении трассы принимается при завершении корневого спана:
+трасса сохраняется, если она попала в выборку (config.TRACE_SAMPLE_RATE)
+или если корневой спан длился не меньше config.TRACE_SLOW_MS. Поэтому медленные
+обработчики записываются всегда, даже при нулевой доле выборки.
+
+Сохраненные трассы пишутся фоновым потоком в файл JSON Lines
+(config.TRACE_PATH): одна строка — одна трасса в форме, близкой к OTLP/JSON
+(resourceSpans → scopeSpans → spans). Если и выборка, и порог медленных
+обработчиков отключены, декоратор traced сводится к одной проверке флага.
+
+Трассировка не должна вредить приложению: очередь записи ограничена
+(config.TRACE_QUEUE_SIZE), и трассы сверх нее отбрасываются, а ошибки записи
+в файл (нет каталога, нет места на диске) только считаются — поток записи
+продолжает работать.
+"""
+
+import atexit
+import contextlib
+import contextvars
+import functools
+import json
+import os
+import queue
+import random
+import threading
+import time
+
+from zen_cat import config
+
+
+# Текущий спан (у каждого потока и задачи свой)
+_current = contextvars.ContextVar("zen_cat_span", default=None)
+
+# Контекст без записи спана (трассировка отключена)
+_NULL_CONTEXT = contextlib.nullcontext()
+
+# Разница между временем Unix и монотонными часами: спан замеряется одними
+# монотонными часами, а в время Unix переводится только при записи
+_UNIX_OFFSET_NS = time.time_ns() - time.perf_counter_ns()
+
+
+class Span:
+    """
+    Отрезок времени выполнения операции.
+
+    Атрибуты:
+        name (str): Имя операции
+        trace (Trace): Трасса, к которой относится спан
+        parent (Span): Родительский спан или None
+        attributes (dict): Атрибуты (например, число обновленных элементов)
+        start_ns (int): Время начала (time.perf_counter_ns)
+        end_ns (int): Время окончания или None
+        error (str): Тип исключения, если операция завершилась ошибкой
+    """
+
+    __slots__ = ("name", "trace", "parent", "attributes", "start_ns", "end_ns", "error", "_span_id", "_token")
+
+    def __init__(self, name, trace, parent, attributes):
+        """
+        Инициализирует и начинает спан.
+
+        Args:
+            name (str): Имя операции
+            trace (Trace): Трасса
+            parent (Span): Родительский спан или None
+            attributes (dict): Атрибуты
+        """
+        self.name = name
+        self.trace = trace
+        self.parent = parent
+        self.attributes = attributes
+        self.end_ns = None
+        self.error = None
+        self._span_id = None
+        self._token = None
+        self.start_ns = time.perf_counter_ns()
+
+    @property
+    def span_id(self):
+        """
+        Идентификатор спана (16 шестнадцатеричных цифр); создается при первом
+        обращении, то есть только для сохраняемых трасс.
+        """
+        if self._span_id is None:
+            self._span_id = f"{random.getrandbits(64):016x}"
+        return self._span_id
+
+    def duration(self):
+        """
+        Возвращает длительность завершенного спана.
+
+        Returns:
+            float: Длительность в секундах
+        """
+        return (self.end_ns - self.start_ns) / 1e9
+
+    def to_otlp(self):
+        """
+        Возвращает спан в форме OTLP/JSON.
+
+        Returns:
+            dict: Спан
+        """
+        attributes = dict(self.attributes)
+        if self.trace.session_id:
+            attributes["session.id"] = self.trace.session_id
+        span = {
+            "traceId": self.trace.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": 1,  # SPAN_KIND_INTERNAL
+            "startTimeUnixNano": str(self.start_ns + _UNIX_OFFSET_NS),
+            "endTimeUnixNano": str(self.end_ns + _UNIX_OFFSET_NS),
+            "attributes": [{"key": key, "value": _otlp_value(value)} for key, value in attributes.items()],
+            "status": {"code": 2, "message": self.error} if self.error else {"code": 1},
+        }
+        if self.parent is not None:
+            span["parentSpanId"] = self.parent.span_id
+        return span
+
+
+class Trace:
+    """
+    Трасса: корневой спан и все его дочерние.
+
+    Атрибуты:
+        session_id (str): Идентификатор сессии (первый известный среди спанов)
+        sampled (bool): Попала ли трасса в выборку
+        root (Span): Первый спан записи (при его завершении решается, сохранять ли ее)
+        spans (list): Завершенные спаны
+    """
+
+    __slots__ = ("session_id", "sampled", "root", "spans", "_trace_id")
+
+    def __init__(self, session_id, sampled, trace_id=None):
+        """
+        Инициализирует трассу.
+
+        Args:
+            session_id (str): Идентификатор сессии или None
+            sampled (bool): Попала ли трасса в выборку
+            trace_id (str): Идентификатор продолжаемой трассы (по умолчанию новый)
+        """
+        self._trace_id = trace_id
+        self.session_id = session_id
+        self.sampled = sampled
+        self.root = None
+        self.spans = []
+
+    @property
+    def trace_id(self):
+        """
+        Идентификатор трассы (32 шестнадцатеричные цифры); создается при первом
+        обращении, то есть только для сохраняемых трасс.
+        """
+        if self._trace_id is None:
+            self._trace_id = f"{random.getrandbits(128):032x}"
+        return self._trace_id
+
+
+class Tracer:
+    """
+    Трассировка с выборкой и записью медленных обработчиков.
+
+    Атрибуты:
+        sample_rate (float): Доля сохраняемых трасс (0..1)
+        slow_threshold (float): Трассы не короче этого времени сохраняются всегда
+            (секунды, 0 — отключено)
+        path (str): Файл JSON Lines для трасс
+        exported (int): Количество трасс, записанных в файл
+        dropped (int): Количество трасс, не попавших в выборку
+        overflow (int): Количество трасс, отброшенных из-за переполнения очереди записи
+        failed (int): Количество трасс, которые не удалось записать в файл
+    """
+
+    def __init__(self, sample_rate=None, slow_threshold=None, path=None, max_queue=None):
+        """
+        Инициализирует трассировку.
+
+        Args:
+            sample_rate (float): Доля трасс (по умолчанию config.TRACE_SAMPLE_RATE)
+            slow_threshold (float): Порог медленных трасс в секундах
+                (по умолчанию config.TRACE_SLOW_MS / 1000)
+            path (str): Файл трасс (по умолчанию config.TRACE_PATH)
+            max_queue (int): Максимальная длина очереди записи
+                (по умолчанию config.TRACE_QUEUE_SIZE)
+        """
+        self.sample_rate = config.TRACE_SAMPLE_RATE if sample_rate is None else sample_rate
+        self.slow_threshold = config.TRACE_SLOW_MS / 1000 if slow_threshold is None else slow_threshold
+        self.path = path or config.TRACE_PATH
+        self.enabled = self.sample_rate > 0 or self.slow_threshold > 0
+        self.exported = 0
+        self.dropped = 0
+        self.overflow = 0
+        self.failed = 0
+        self._queue = queue.Queue(maxsize=max_queue or config.TRACE_QUEUE_SIZE)
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def start_span(self, name, session_id=None, **attributes):
+        """
+        Начинает спан и делает его текущим.
+
+        Args:
+            name (str): Имя операции
+            session_id (str): Идентификатор сессии
+            **attributes: Атрибуты спана
+
+        Returns:
+            Span: Спан (завершается через end_span)
+        """
+        parent = _current.get()
+        if parent is None:
+            trace = Trace(session_id, random.random() < self.sample_rate)
+        elif parent.end_ns is not None:
+            # Родитель уже завершен, и его трасса сохранена или отброшена
+            trace = Trace(parent.trace.session_id or session_id, parent.trace.sampled, parent.trace.trace_id)
+        else:
+            trace = parent.trace
+            if trace.session_id is None:
+                trace.session_id = session_id
+        span = Span(name, trace, parent, attributes)
+        if trace.root is None:
+            trace.root = span
+        span._token = _current.set(span)
+        return span
+
+    def end_span(self, span, error=None):
+        """
+        Завершает спан; для корневого спана решает, сохранять ли трассу.
+
+        Args:
+            span (Span): Спан
+            error (BaseException): Исключение, которым завершилась операция
+        """
+        span.end_ns = time.perf_counter_ns()
+        if error is not None:
+            span.error = type(error).__name__
+        _current.reset(span._token)
+        trace = span.trace
+        trace.spans.append(span)
+        if span is not trace.root:
+            return
+        if trace.sampled or (self.slow_threshold and span.duration() >= self.slow_threshold):
+            self._export(trace)
+        else:
+            self.dropped += 1
+
+    def span(self, name, session_id=None, **attributes):
+        """
+        Возвращает контекст, записывающий спан вокруг блока.
+
+        Args:
+            name (str): Имя операции
+            session_id (str): Идентификатор сессии
+            **attributes: Атрибуты спана
+
+        Returns:
+            contextlib.AbstractContextManager: Контекст спана
+        """
+        if not self.enabled:
+            return _NULL_CONTEXT
+        return _SpanContext(self, name, session_id, attributes)
+
+    def _export(self, trace):
+        """
+        Передает трассу фоновому потоку записи (если очередь переполнена, трасса отбрасывается).
+
+        Args:
+            trace (Trace): Трасса
+        """
+        try:
+            self._queue.put_nowait(trace)
+        except queue.Full:
+            self.overflow += 1
+            return
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, name="zen-cat-tracing", daemon=True)
+                    self._thread.start()
+                    atexit.register(self.flush)
+
+    def _run(self):
+        """
+        Основной цикл фонового потока записи.
+        """
+        while True:
+            traces = [self._queue.get()]
+            while True:
+                try:
+                    traces.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            self._write(traces)
+
+    def flush(self):
+        """
+        Записывает трассы, еще не записанные фоновым потоком.
+        """
+        traces = []
+        while True:
+            try:
+                traces.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        if traces:
+            self._write(traces)
+
+    def _write(self, traces):
+        """
+        Дописывает трассы в файл; при ошибке трассы только учитываются как несохраненные.
+
+        Args:
+            traces (list): Трассы
+        """
+        try:
+            lines = [json.dumps(_to_otlp(trace), ensure_ascii=False) for trace in traces]
+            with self._lock:
+                with open(self.path, "a", encoding="utf-8") as file:
+                    file.write("\n".join(lines) + "\n")
+        except (OSError, TypeError, ValueError):  # Ошибка записи не должна останавливать поток
+            self.failed += len(traces)
+            return
+        self.exported += len(traces)
+
+    def stats(self):
+        """
+        Возвращает счетчики трассировки.
+
+        Returns:
+            dict: Доля выборки, порог медленных трасс, число записанных, не попавших в выборку,
+                отброшенных из-за переполнения очереди и не записанных из-за ошибки трасс
+        """
+        return {
+            "sample_rate": self.sample_rate,
+            "slow_threshold": self.slow_threshold,
+            "exported": self.exported,
+            "dropped": self.dropped,
+            "overflow": self.overflow,
+            "failed": self.failed,
+        }
+
+
+class _SpanContext:
+    """
+    Контекст спана для оператора with.
+    """
+
+    __slots__ = ("tracer", "name", "session_id", "attributes", "span")
+
+    def __init__(self, tracer, name, session_id, attributes):
+        self.tracer = tracer
+        self.name = name
+        self.session_id = session_id
+        self.attributes = attributes
+        self.span = None
+
+    def __enter__(self):
+        if self.tracer.enabled:
+            self.span = self.tracer.start_span(self.name, self.session_id, **self.attributes)
+        return self.span
+
+    def __exit__(self, kind, error, traceback):
+        if self.span is not None:
+            self.tracer.end_span(self.span, error)
+        return False
+
+
+def traced(name):
+    """
+    Декоратор, записывающий спан вокруг обработчика события.
+
+    Идентификатор сессии берется из атрибута page компонента или события.
+
+    Args:
+        name (str): Имя операции (например, "ContactForm._submit_form")
+
+    Returns:
+        callable: Декоратор
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not TRACER.enabled:
+                return func(*args, **kwargs)
+            span = TRACER.start_span(name, _session_of(args))
+            try:
+                result = func(*args, **kwargs)
+            except BaseException as error:
+                TRACER.end_span(span, error)
+                raise
+            TRACER.end_span(span)
+            return result
+        return wrapper
+    return decorator
+
+
+def _session_of(args):
+    """
+    Находит идентификатор сессии среди аргументов обработчика.
+
+    Args:
+        args (tuple): Аргументы (компонент, событие)
+
+    Returns:
+        str: Идентификатор сессии или None
+    """
+    for arg in args:
+        session_id = getattr(getattr(arg, "page", None), "session_id", None)
+        if session_id is not None:
+            return str(session_id)
+    return None
+
+
+def _otlp_value(value):
+    """
+    Преобразует значение атрибута в форму OTLP/JSON.
+
+    Args:
+        value: Значение
+
+    Returns:
+        dict: Значение с типом
+    """
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _to_otlp(trace):
+    """
+    Преобразует трассу в форму OTLP/JSON.
+
+    Args:
+        trace (Trace): Трасса
+
+    Returns:
+        dict: Трасса (resourceSpans)
+    """
+    return {
+        "resourceSpans": [{
+            "resource": {"attributes": [
+                {"key": "service.name", "value": {"stringValue": "zen-cat"}},
+                {"key": "process.pid", "value": {"intValue": str(os.getpid())}},
+            ]},
+            "scopeSpans": [{
+                "scope": {"name": "zen_cat"},
+                "spans": [span.to_otlp() for span in trace.spans],
+            }],
+        }]
+    }
+
+
+# Трассировка, общая для всех сессий процесса
+TRACER = Tracer()
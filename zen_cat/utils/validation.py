@@ -0,0 +1,127 @@
+"""
+Модуль проверки полей формы обратной связи для приложения Zen-кот.
+
+Проверки используют заранее скомпилированные регулярные выражения и возвращают
+ключ текста ошибки в каталоге локализации (или None, если значение корректно).
+Результаты кэшируются в общем для процесса LRU-кэше: при наборе текста одни и те же
+промежуточные значения (например, при стирании) проверяются повторно бесплатно.
+"""
+
+import functools
+import re
+
+from zen_cat import config
+
+
+# Локальная часть email (до @): допустимые символы без точек по краям и подряд
+_EMAIL_LOCAL = re.compile(r"[\w!#$%&'*+/=?^`{|}~-]+(?:\.[\w!#$%&'*+/=?^`{|}~-]+)*")
+
+# Метка домена: буквы и цифры, дефис только внутри, до 63 символов
+_DOMAIN_LABEL = re.compile(r"[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?")
+
+# Домен верхнего уровня: буквы или punycode (xn--...)
+_TLD = re.compile(r"[a-z]{2,63}|xn--[a-z0-9-]{1,59}")
+
+NAME_MAX = 100
+EMAIL_MAX = 254
+MESSAGE_MAX = 2000
+
+
+def validate_name(value):
+    """
+    Проверяет имя.
+
+    Имена пишут по-разному («Dr. Smith», «John Q. Public», «O'Brien»), поэтому
+    проверяются только длина и отсутствие непечатаемых символов (переводов строк,
+    табуляции и управляющих символов).
+
+    Args:
+        value (str): Имя
+
+    Returns:
+        str: Ключ текста ошибки или None
+    """
+    value = value.strip()
+    if not value:
+        return "name_required"
+    if len(value) > NAME_MAX or not value.isprintable():
+        return "name_invalid"
+    return None
+
+
+def _valid_domain(domain):
+    """
+    Проверяет синтаксис домена email (без обращения к DNS).
+
+    Args:
+        domain (str): Домен (может содержать национальные символы)
+
+    Returns:
+        bool: True, если домен синтаксически корректен
+    """
+    try:
+        domain = domain.encode("idna").decode("ascii").lower()
+    except UnicodeError:
+        return False
+    labels = domain.split(".")
+    if len(domain) > 253 or len(labels) < 2:
+        return False
+    return all(_DOMAIN_LABEL.fullmatch(label) for label in labels[:-1]) and bool(_TLD.fullmatch(labels[-1]))
+
+
+def validate_email(value):
+    """
+    Проверяет email.
+
+    Args:
+        value (str): Email
+
+    Returns:
+        str: Ключ текста ошибки или None
+    """
+    value = value.strip()
+    if not value:
+        return "email_required"
+    local, at, domain = value.rpartition("@")
+    if not at or len(value) > EMAIL_MAX or len(local) > 64 or not _EMAIL_LOCAL.fullmatch(local):
+        return "email_invalid"
+    if not _valid_domain(domain):
+        return "email_domain_invalid"
+    return None
+
+
+def validate_message(value):
+    """
+    Проверяет сообщение (необязательное поле).
+
+    Args:
+        value (str): Сообщение
+
+    Returns:
+        str: Ключ текста ошибки или None
+    """
+    if len(value) > MESSAGE_MAX:
+        return "message_too_long"
+    return None
+
+
+_VALIDATORS = {
+    "name": validate_name,
+    "email": validate_email,
+    "message": validate_message,
+}
+
+
+@functools.lru_cache(maxsize=config.VALIDATION_CACHE_SIZE)
+def validate(field, value):
+    """
+    Проверяет значение поля формы с кэшированием результата.
+
+    Args:
+        field (str): Имя поля (name, email, message)
+        value (str): Значение
+
+    Returns:
+        str: Ключ текста ошибки или None
+    """
+    return _VALIDATORS[field](value or "")
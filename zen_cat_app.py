@@ -11,8 +11,11 @@ import sys
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from zen_cat.main import main
+from zen_cat.utils.metrics import METRICS
 import flet as ft
 
 if __name__ == "__main__":
+    # Метрики на локальном порту (ZEN_CAT_METRICS_PORT)
+    METRICS.serve()
     # Запускаем приложение в веб-браузере
     ft.app(target=main, view=ft.WEB_BROWSER) 
\ No newline at end of file